@@ -0,0 +1,61 @@
+"""
+Cold-start image loading: PNG decode + scale vs. baked blobs (general/bake.py).
+
+Every round uses a fresh AssetService, so nothing is cached in-process; the
+OS page cache is warm for both paths. Bakes first if assets/baked is missing.
+
+    python benchmarks/bake_coldstart.py [rounds]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.assets import AssetService
+from general.bake import bake, load_manifest, INDEX_PATH
+
+
+def load_all(service, items, parallel):
+    start = time.perf_counter()
+    if parallel:
+        for item in items:
+            service.request(**item)
+    for item in items:
+        service.get(**item)
+    elapsed = time.perf_counter() - start
+    service.pool.shutdown()
+    return elapsed
+
+
+def main(rounds=10):
+    if not os.path.exists(INDEX_PATH):
+        bake()
+
+    pygame.init()
+    pygame.display.set_mode((800, 1000))
+    items = load_manifest()
+
+    results = {}
+    for use_baked in (False, True):
+        for parallel in (False, True):
+            samples = [load_all(AssetService(use_baked=use_baked), items, parallel) for _ in range(rounds)]
+            results[(use_baked, parallel)] = sorted(samples)[len(samples) // 2] * 1000
+    pygame.quit()
+
+    print(f"{len(items)} manifest entries, median of {rounds} cold starts")
+    print(f"{'':<10}{'serial ms':>12}{'pooled ms':>12}")
+    for use_baked, label in ((False, "png"), (True, "baked")):
+        print(f"{label:<10}{results[(use_baked, False)]:>12.2f}{results[(use_baked, True)]:>12.2f}")
+    print(f"speedup   {results[(False, False)] / results[(True, False)]:>11.1f}x"
+          f"{results[(False, True)] / results[(True, True)]:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,179 @@
+"""
+Monte Carlo solvability map for the bathtub.
+
+Fires a grid (or a random sample) of slingshot pulls through the real Duck
+physics on a process pool and reports what fraction of the pull space lands
+in the water. Every shot records win/lose, contacts and the time until it
+won or settled, so gravity / sling_max / power (and the tub sprite) can be
+tuned against a number instead of by feel.
+
+The heatmap is the pull space as the player drags it back from the duck,
+flipped so that right = shoots right and up = shoots up. Each cell is
+coloured by its win rate (red 0% .. green 100%); grey is too short to fire.
+
+    python benchmarks/bathtub_solvability.py [--step 2 | --random N] [--gravity G]
+        [--sling-max S] [--power P] [--workers N] [--heatmap map.png] [--csv shots.csv]
+"""
+import os
+import sys
+import csv
+import math
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.levels import BATHTUB_SPRITE
+from components.puzzle import bathtub_game as tub
+
+MAX_FLIGHT = 6.0   # s; a shot still moving after this counts as a miss
+CHUNK = 256        # shots per task
+CELL_PX = 4        # heatmap pixels per cell edge
+SEED = 3
+
+_env = None
+
+
+def setup(sprite_path, gravity, sling_max, power):
+    """Per-process: the tub field and the physics constants every shot needs."""
+    global _env
+    field = tub.BathtubGame.load_field(sprite_path)
+    rect = pygame.Rect((0, 0), tub.TUB_SIZE)
+    rect.center = tub.TUB_CENTER
+    field.place(rect.topleft)
+    _env = {
+        "field": field,
+        "solids": tub.tub_solids(field),
+        "bounds": (0, 0, tub.W, tub.H),
+        "dt": tub.BathtubGame.timestep,
+        "gravity": gravity, "sling_max": sling_max, "power": power,
+    }
+
+
+def shoot(pull):
+    """-> (won, contacts, seconds until it won or settled)"""
+    env = _env
+    vel = tub.shot_velocity(pull, env["sling_max"], env["power"])
+    duck = tub.Duck(tub.DUCK_START, tub.DUCK_RADIUS)
+    duck.launch(vel)
+    field, solids, bounds, dt, gravity = env["field"], env["solids"], env["bounds"], env["dt"], env["gravity"]
+    t = 0.0
+    contacts = 0
+    while t < MAX_FLIGHT:
+        duck.update(dt, gravity, solids, bounds)
+        t += dt
+        contacts += duck.contacts
+        if field.in_water(duck.pos[0], duck.pos[1]):
+            return True, contacts, t
+        if duck.resting > tub.SETTLE_TIME:
+            break
+    return False, contacts, t
+
+
+def shoot_many(pulls):
+    return [shoot(p) for p in pulls]
+
+
+def grid_pulls(sling_max, step):
+    r = int(sling_max)
+    return [(x, y) for y in range(-r, r + 1, step) for x in range(-r, r + 1, step)
+            if tub.MIN_PULL < math.hypot(x, y) <= sling_max]
+
+
+def random_pulls(sling_max, n, seed=SEED):
+    rng = random.Random(seed)
+    out = []
+    while len(out) < n:
+        x, y = rng.uniform(-sling_max, sling_max), rng.uniform(-sling_max, sling_max)
+        if tub.MIN_PULL < math.hypot(x, y) <= sling_max:
+            out.append((x, y))
+    return out
+
+
+def heatmap(pulls, results, sling_max, cell):
+    n = int(2 * sling_max // cell) + 1
+    wins, total = {}, {}
+    for (x, y), (won, _, _) in zip(pulls, results):
+        key = (int((x + sling_max) // cell), int((y + sling_max) // cell))
+        total[key] = total.get(key, 0) + 1
+        wins[key] = wins.get(key, 0) + won
+
+    img = pygame.Surface((n * CELL_PX, n * CELL_PX))
+    img.fill((255, 255, 255))
+    for i in range(n):
+        for j in range(n):
+            # Pull (x, y) launches along (x, y); put that direction on screen as-is
+            px, py = i * CELL_PX, j * CELL_PX
+            cx, cy = (i + 0.5) * cell - sling_max, (j + 0.5) * cell - sling_max
+            if (i, j) in total:
+                f = wins[(i, j)] / total[(i, j)]
+                color = (int(200 - 150 * f), int(60 + 140 * f), 70)
+            elif math.hypot(cx, cy) <= tub.MIN_PULL:
+                color = (170, 170, 170)
+            else:
+                continue
+            img.fill(color, (px, py, CELL_PX, CELL_PX))
+    mid = n * CELL_PX // 2
+    pygame.draw.line(img, (0, 0, 0), (mid, 0), (mid, n * CELL_PX))
+    pygame.draw.line(img, (0, 0, 0), (0, mid), (n * CELL_PX, mid))
+    return img
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bathtub shot-space solvability map")
+    parser.add_argument("--step", type=int, default=2, help="grid spacing in px of pull")
+    parser.add_argument("--random", type=int, help="sample this many random pulls instead of a grid")
+    parser.add_argument("--gravity", type=float, default=tub.GRAVITY)
+    parser.add_argument("--sling-max", type=float, default=tub.SLING_MAX)
+    parser.add_argument("--power", type=float, default=tub.POWER)
+    parser.add_argument("--sprite", default=BATHTUB_SPRITE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--heatmap", default="bathtub_solvability.png")
+    parser.add_argument("--csv")
+    args = parser.parse_args(argv)
+
+    params = (args.sprite, args.gravity, args.sling_max, args.power)
+    setup(*params)  # fail early here if the field can't be had
+    if args.random:
+        pulls = random_pulls(args.sling_max, args.random)
+    else:
+        pulls = grid_pulls(args.sling_max, args.step)
+    chunks = [pulls[i:i + CHUNK] for i in range(0, len(pulls), CHUNK)]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.workers, initializer=setup, initargs=params) as pool:
+        results = [r for chunk in pool.map(shoot_many, chunks) for r in chunk]
+    elapsed = time.perf_counter() - start
+
+    won = [r for r in results if r[0]]
+    print(f"shots {len(results)} in {elapsed:.1f} s on {args.workers} workers ({len(results) / elapsed:.0f} shots/s)")
+    print(f"gravity {args.gravity:g}  sling_max {args.sling_max:g}  power {args.power:g}")
+    print(f"win fraction of pull space: {len(won) / len(results):.1%}")
+    if won:
+        print(f"winning shots: {sum(r[1] for r in won) / len(won):.1f} contacts, "
+              f"{sum(r[2] for r in won) / len(won):.2f} s to the water")
+    print(f"all shots: {sum(r[1] for r in results) / len(results):.1f} contacts, "
+          f"{sum(r[2] for r in results) / len(results):.2f} s to win or settle")
+
+    cell = args.step if not args.random else max(2, int(args.sling_max * 2 / 100))
+    pygame.image.save(heatmap(pulls, results, args.sling_max, cell), args.heatmap)
+    print(f"heatmap -> {args.heatmap}")
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            out = csv.writer(f)
+            out.writerow(["pull_x", "pull_y", "won", "contacts", "seconds"])
+            for (x, y), (w, c, t) in zip(pulls, results):
+                out.writerow([round(x, 2), round(y, 2), int(w), c, round(t, 3)])
+        print(f"shots -> {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Full-frame flip() vs. dirty-rect display.update() on the mostly static scenes.
+Each frame nudges one thing (a clock hand, the stove knob, a wire drag), the
+way a player would, and then renders through SceneManager.render().
+
+    python benchmarks/dirty_rects.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from components.puzzle.clock_game import ClockGame
+from components.puzzle.stove_game import StoveGame
+from components.puzzle.fridge_game import WireGame
+from start_instructions import HiddenMenu
+
+
+def nudge_clock(scene, i):
+    scene.current_minute = (i * 0.25) % 60
+
+def nudge_stove(scene, i):
+    scene.current_angle = (i * 0.5) % 360
+
+def nudge_fridge(scene, i):
+    scene.active_line = 0 if i % 120 < 60 else None
+
+def nudge_menu(scene, i):
+    pass
+
+
+SCENES = [
+    ("clock", lambda screen: ClockGame(screen), nudge_clock),
+    ("stove", lambda screen: StoveGame(screen), nudge_stove),
+    ("fridge", lambda screen: WireGame(screen), nudge_fridge),
+    ("menu", lambda screen: HiddenMenu(), nudge_menu),
+]
+
+
+def run(manager, make_scene, nudge, frames, dirty):
+    manager.use_dirty_rects = dirty
+    scene = make_scene(manager.screen)
+    manager.switch(scene)
+    manager.apply_switch()
+
+    area = manager.screen.get_width() * manager.screen.get_height()
+    manager.pixels_presented = 0
+    start = time.perf_counter()
+    for i in range(frames):
+        nudge(scene, i)
+        manager.render(scene)
+    elapsed = time.perf_counter() - start
+    return elapsed / frames * 1000, manager.pixels_presented / frames / area
+
+
+def main(frames=300):
+    manager = get_manager()
+    print(f"{'scene':<8}{'full ms':>10}{'dirty ms':>10}{'full px':>10}{'dirty px':>10}")
+    for name, make_scene, nudge in SCENES:
+        full_ms, full_px = run(manager, make_scene, nudge, frames, dirty=False)
+        dirty_ms, dirty_px = run(manager, make_scene, nudge, frames, dirty=True)
+        print(f"{name:<8}{full_ms:>10.3f}{dirty_ms:>10.3f}{full_px:>10.1%}{dirty_px:>10.1%}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
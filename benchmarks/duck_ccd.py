@@ -0,0 +1,224 @@
+"""
+Duck collision stress test: thousands of random shots through the old
+3-substep solver and the swept (time-of-impact) one on the old hand-tuned
+hitboxes, and the swept solver on the tub's distance field.
+
+"game"   = shots from the slingshot at up to the real max speed (sling_max * power)
+"stress" = random start points and directions at up to 8x that speed
+
+tunnels  = updates where the duck's centre path crossed into the tub
+deep     = updates ending with the duck more than 1 px inside the tub
+wins     = shots that reached the water
+pushes   = times the swept solver's overlap safety net had to step in
+contacts = bounces resolved per update (swept solver only)
+
+    python benchmarks/duck_ccd.py [shots]
+"""
+import os
+import sys
+import math
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from components.geometry import circle_rect_hit
+from components.puzzle.bathtub_game import Duck
+from frame_times import build
+
+FLIGHT = 180   # updates per shot (3 s)
+SEED = 11
+
+
+def legacy_solids(tub_rect):
+    """The hand-tuned hitboxes and water rect the tub used before its distance field."""
+    rim = pygame.Rect(tub_rect.x + 70,  tub_rect.y + 82,  tub_rect.w - 140, 18)
+    left_wall = pygame.Rect(tub_rect.x + 70,  tub_rect.y + 90,  22, tub_rect.h - 130)
+    right_wall = pygame.Rect(tub_rect.right - 92, tub_rect.y + 90, 22, tub_rect.h - 130)
+    bottom_lip = pygame.Rect(tub_rect.x + 95,  tub_rect.bottom - 105, tub_rect.w - 190, 22)
+    water = pygame.Rect(tub_rect.x + 120, tub_rect.y + 130, tub_rect.w - 240, tub_rect.h - 210)
+    return [
+        {"rect": rim, "rest": 0.62, "fric": 0.95},
+        {"rect": left_wall, "rest": 0.50, "fric": 0.92},
+        {"rect": right_wall, "rest": 0.50, "fric": 0.92},
+        {"rect": bottom_lip, "rest": 0.30, "fric": 0.90},
+    ], water
+
+
+class RectTub:
+    """Tunnel/depth/water checks against rect hitboxes."""
+    def __init__(self, solids, water):
+        self.solids, self.water = solids, water
+        self.rects = [s["rect"] for s in solids]
+
+    def clear(self, x, y, r):
+        return not any(circle_rect_hit(x, y, r, rect)[0] for rect in self.rects)
+
+    def crossed(self, a, b):
+        return any(rect.clipline(a, b) for rect in self.rects)
+
+    def depth(self, x, y, r):
+        deepest = 0.0
+        for rect in self.rects:
+            hit, closest, (dx, dy) = circle_rect_hit(x, y, r, rect)
+            if hit:
+                deepest = max(deepest, r - math.hypot(dx, dy))
+        return deepest
+
+    def wet(self, x, y):
+        return self.water.collidepoint(int(x), int(y))
+
+
+class FieldTub:
+    """The same checks against the distance field."""
+    def __init__(self, field):
+        self.field = field
+        self.solids = [{"field": field, "rest": 0.50, "fric": 0.92}]
+
+    def clear(self, x, y, r):
+        return self.field.distance(x, y) > r
+
+    def crossed(self, a, b):
+        steps = max(1, int(math.hypot(b[0] - a[0], b[1] - a[1])))
+        return any(self.field.distance(a[0] + (b[0] - a[0]) * i / steps, a[1] + (b[1] - a[1]) * i / steps) < 0
+                   for i in range(steps + 1))
+
+    def depth(self, x, y, r):
+        return max(0.0, r - self.field.distance(x, y))
+
+    def wet(self, x, y):
+        return self.field.in_water(x, y)
+
+
+class SubstepDuck(Duck):
+    """The solver Duck used before: 3 fixed substeps, positional push-out."""
+    def step(self, dt, gravity, solids, bounds):
+        # integrate
+        self.vel[1] += gravity * dt
+        self.pos[0] += self.vel[0] * dt
+        self.pos[1] += self.vel[1] * dt
+
+        left, top, right, bottom = bounds
+        rest, fric = 0.50, 0.94
+
+        # screen bounds
+        if self.pos[0] < left + self.r:
+            self.pos[0] = left + self.r
+            self.vel[0] *= -rest
+            self.vel[1] *= fric
+        if self.pos[0] > right - self.r:
+            self.pos[0] = right - self.r
+            self.vel[0] *= -rest
+            self.vel[1] *= fric
+        if self.pos[1] < top + self.r:
+            self.pos[1] = top + self.r
+            self.vel[1] *= -rest
+            self.vel[0] *= fric
+        if self.pos[1] > bottom - self.r:
+            self.pos[1] = bottom - self.r
+            self.vel[1] *= -rest
+            self.vel[0] *= fric
+
+        # tub collisions
+        for s in solids:
+            hit, closest, dxy = circle_rect_hit(self.pos[0], self.pos[1], self.r, s["rect"])
+            if not hit:
+                continue
+
+            dx, dy = dxy
+            if dx == 0 and s["rect"].left < self.pos[0] < s["rect"].right: dx = 1e-6
+            if dy == 0 and s["rect"].top < self.pos[1] < s["rect"].bottom: dy = 1e-6
+
+            rest = s.get("rest", 0.55)
+            fric = s.get("fric", 0.94)
+
+            if abs(dx) > abs(dy):
+                self.pos[0] = closest[0] - self.r if self.pos[0] < closest[0] else closest[0] + self.r
+                self.vel[0] *= -rest
+                self.vel[1] *= fric
+            else:
+                self.pos[1] = closest[1] - self.r if self.pos[1] < closest[1] else closest[1] + self.r
+                self.vel[1] *= -rest
+                self.vel[0] *= fric
+
+        # settle detection (reset after shot ends)
+        if abs(self.vel[0]) < 35 and abs(self.vel[1]) < 35:
+            self.resting += dt
+        else:
+            self.resting = 0.0
+
+    def update(self, dt, gravity, solids, bounds):
+        self.prev = list(self.pos)
+        if not self.launched:
+            return
+        # Substeps = smoother motion + stable collisions
+        substeps = 3
+        step_dt = dt / substeps
+        for _ in range(substeps):
+            self.step(step_dt, gravity, solids, bounds)
+
+
+def shots(scene, tubs, mode, n):
+    rng = random.Random(SEED)
+    top_speed = scene.sling_max * scene.power
+    out = []
+    while len(out) < n:
+        if mode == "game":
+            start = scene.duck_start
+            ang = rng.uniform(-math.pi * 0.55, 0.1)
+            speed = rng.uniform(0.2, 1.0) * top_speed
+        else:
+            start = (rng.uniform(30, scene.bounds[2] - 30), rng.uniform(30, scene.bounds[3] - 30))
+            if not all(tub.clear(start[0], start[1], scene.duck.r + 1) and not tub.wet(*start) for tub in tubs):
+                continue
+            ang = rng.uniform(-math.pi, math.pi)
+            speed = rng.uniform(0.5, 8.0) * top_speed
+        out.append((start, (math.cos(ang) * speed, math.sin(ang) * speed)))
+    return out
+
+
+def run(scene, cls, tub, plan):
+    tunnels = deep = updates = contacts = pushes = wins = 0
+    busy = 0.0
+    for start, vel in plan:
+        duck = cls(start, scene.duck.r)
+        duck.launch(vel)
+        for _ in range(FLIGHT):
+            t = time.perf_counter()
+            duck.update(scene.timestep, scene.gravity, tub.solids, scene.bounds)
+            busy += time.perf_counter() - t
+            updates += 1
+            contacts += duck.contacts
+            tunnels += tub.crossed(duck.prev, duck.pos)
+            deep += tub.depth(duck.pos[0], duck.pos[1], duck.r) > 1.0
+            if tub.wet(*duck.pos):
+                wins += 1
+                break
+        pushes += duck.overlaps
+    return tunnels, deep, busy / updates * 1e6, contacts / updates, pushes, wins
+
+
+def main(n=1000):
+    scene = build("bathtub", get_manager())
+    rects = RectTub(*legacy_solids(scene.tub_rect))
+    field = FieldTub(scene.field)
+    solvers = (("substep", SubstepDuck, rects), ("swept", Duck, rects), ("field", Duck, field))
+    print(f"{'mode':<8}{'solver':<9}{'shots':>6}{'tunnels':>9}{'deep':>7}{'us/update':>11}{'pushes':>8}{'contacts':>10}{'wins':>6}")
+    for mode in ("game", "stress"):
+        plan = shots(scene, (rects, field), mode, n)
+        for name, cls, tub in solvers:
+            tunnels, deep, us, contacts, pushes, wins = run(scene, cls, tub, plan)
+            extra = f"{pushes:>8}{contacts:>10.2f}" if cls is Duck else f"{'-':>8}{'-':>10}"
+            print(f"{mode:<8}{name:<9}{n:>6}{tunnels:>9}{deep:>7}{us:>11.1f}{extra}{wins:>6}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,85 @@
+"""
+Fixed-timestep check: the same puzzle rendered at 30, 60 and 120 FPS must end
+up in the same state after the same amount of game time, and simulation alone
+(no rendering) should run far ahead of real time.
+
+    python benchmarks/fixed_step.py [seconds]
+"""
+import os
+import sys
+import time
+import random
+import hashlib
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from frame_times import build
+
+FRAME_STEPS = {30: 2.0, 60: 1.0, 120: 0.5}  # render rate -> timesteps per frame
+SEED = 99
+
+
+def setup_bathtub(scene):
+    scene.duck.launch((620.0, -540.0))
+
+# Puzzles that move on their own (no input needed)
+SCENES = {
+    "bathtub": setup_bathtub,
+    "record": None,
+    "flyswatter": None,
+    "bookshelf": None,
+}
+
+
+def fingerprint(manager, scene):
+    """Hash of the frame drawn exactly on the last step (alpha = 1)."""
+    scene.alpha = 1.0
+    scene.draw()
+    return hashlib.md5(pygame.image.tobytes(manager.screen, "RGB")).hexdigest()[:12]
+
+
+def simulate(manager, name, seconds, fps):
+    random.seed(SEED)
+    scene = build(name, manager)
+    if SCENES[name]:
+        SCENES[name](scene)
+    steps = round(seconds / scene.timestep)
+    # Frame times in whole/half timesteps, so every rate lands on the same step count
+    per_frame = scene.timestep * FRAME_STEPS[fps]
+    done = 0
+    while done < steps:
+        done += manager.advance(scene, per_frame)
+        manager.render(scene)
+    return fingerprint(manager, scene), done
+
+
+def headless(manager, name, seconds):
+    random.seed(SEED)
+    scene = build(name, manager)
+    if SCENES[name]:
+        SCENES[name](scene)
+    start = time.perf_counter()
+    steps = manager.advance(scene, seconds, max_steps=None)
+    return steps / (time.perf_counter() - start)
+
+
+def main(seconds=3.0):
+    manager = get_manager()
+    print(f"{'scene':<12}" + "".join(f"{str(r) + ' fps':>16}" for r in FRAME_STEPS) + f"{'steps/s':>12}")
+    for name in SCENES:
+        prints = [simulate(manager, name, seconds, fps)[0] for fps in FRAME_STEPS]
+        rate = headless(manager, name, seconds)
+        same = "" if len(set(prints)) == 1 else "   MISMATCH"
+        print(f"{name:<12}" + "".join(f"{p:>16}" for p in prints) + f"{rate:>12.0f}{same}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3.0)
@@ -0,0 +1,83 @@
+"""
+Fly swatter frame cost against swarm size: one Fly object per fly vs the
+NumPy FlySwarm. A frame is update + draw + one swat every 12 frames, like
+the frame_times script; draw includes blitting every live fly.
+
+    python benchmarks/fly_swarm.py [frames]
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from components.puzzle import flyswatter_game as fs
+from frame_times import SEED, DT
+
+SIZES = (14, 32, 100, 200, 500, 1000)
+
+
+class FlyList:
+    """The per-object path the scene uses below SWARM_MIN, behind FlySwarm's interface."""
+    def __init__(self, img, n):
+        self.flies = [fs.Fly(img) for _ in range(n)]
+
+    def update(self, dt):
+        for f in self.flies:
+            if f.alive:
+                f.update(dt)
+
+    def swat(self, mask, topleft, bounds):
+        reach = bounds.inflate(2 * fs.FLY_REACH, 2 * fs.FLY_REACH)
+        for f in self.flies:
+            if f.alive and reach.collidepoint(f.pos) and f.hit_by(mask, topleft):
+                f.alive = False
+
+    def draw(self, s, alpha):
+        for f in self.flies:
+            if f.alive:
+                f.draw(s, alpha)
+
+
+def run(flies, swatter, screen, frames):
+    # Swats hop around the room; a fresh swarm each run so both see the same kills
+    upd = drw = 0.0
+    for f in range(frames):
+        t0 = time.perf_counter()
+        flies.update(DT)
+        if f % 12 == 0:
+            swatter.pos = (fs.PLAY.left + (f * 37) % fs.PLAY.w, fs.PLAY.top + (f * 23) % fs.PLAY.h)
+            swatter.swing_now()
+            flies.swat(*swatter.hit_area())
+        t1 = time.perf_counter()
+        screen.fill((0, 0, 0))
+        flies.draw(screen, 0.5)
+        drw += time.perf_counter() - t1
+        upd += t1 - t0
+    return upd / frames * 1000, drw / frames * 1000
+
+
+def main(frames=300):
+    manager = get_manager()
+    scene = fs.FlySwatterGame(manager.screen)
+    print(f"{'flies':>6}{'objects upd':>13}{'draw':>8}{'swarm upd':>11}{'draw':>8}{'frame x':>9}")
+    for n in SIZES:
+        random.seed(SEED)
+        obj = run(FlyList(scene.fly_img, n), scene.swatter, manager.screen, frames)
+        random.seed(SEED)
+        swarm = run(fs.FlySwarm(scene.fly_img, n), scene.swatter, manager.screen, frames)
+        print(f"{n:>6}{obj[0]:>13.3f}{obj[1]:>8.3f}{swarm[0]:>11.3f}{swarm[1]:>8.3f}"
+              f"{sum(obj) / sum(swarm):>8.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
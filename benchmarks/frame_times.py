@@ -0,0 +1,275 @@
+"""
+Headless frame-time benchmark for every minigame.
+
+Each puzzle runs under SDL_VIDEODRIVER=dummy for N frames with a fixed 1/60 s
+step and a scripted pointer (see SCRIPTS), so runs are repeatable. Reports
+p50/p95/p99 of update (events + update) and draw (render + present) times,
+Surface allocations per frame and peak RSS as JSON.
+
+    python benchmarks/frame_times.py                      # all puzzles, 600 frames each
+    python benchmarks/frame_times.py --frames 300 clock stove
+    python benchmarks/frame_times.py --out bench.json
+
+Every puzzle runs in its own subprocess so peak RSS is per puzzle.
+A second, untimed pass with tracemalloc + SurfaceCounter measures allocations.
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import resource
+import subprocess
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from general.levels import get_puzzle
+from general.pointer import pointer
+from general.perf import SurfaceCounter, percentile
+
+DT = 1.0 / 60.0
+SEED = 1234
+
+
+# --- SCRIPTED INPUT ---
+# script(scene, frame) -> list of events for that frame
+
+def down(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(int(pos[0]), int(pos[1])), button=1)
+
+def up(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(int(pos[0]), int(pos[1])), button=1)
+
+def move(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(int(pos[0]), int(pos[1])), rel=(0, 0), buttons=(1, 0, 0))
+
+def key(k):
+    return pygame.event.Event(pygame.KEYDOWN, key=k, mod=0, unicode="", scancode=0)
+
+def orbit(center, radius, angle):
+    return (center[0] + math.cos(angle) * radius, center[1] + math.sin(angle) * radius)
+
+
+def script_bathtub(scene, f):
+    # Pull the duck back and release every 4 seconds, restart after 12
+    start = scene.duck_start
+    t = f % 240
+    pull = (-120 - (f // 240) % 3 * 20, 90)
+    if f % 720 == 719:
+        return [key(pygame.K_r)]
+    if t == 0:
+        return [down(start)]
+    if t <= 20:
+        return [move((start[0] + pull[0] * t / 20, start[1] + pull[1] * t / 20))]
+    if t == 21:
+        return [up((start[0] + pull[0], start[1] + pull[1]))]
+    return []
+
+def script_record(scene, f):
+    t = f % 180
+    events = [move(orbit(scene.pivot, 200, -1.2 + 0.4 * math.sin(f / 30)))]
+    if t == 10:
+        events.append(down(pointer.pos))
+    if t == 150:
+        events.append(up(pointer.pos))
+    if t == 170:
+        events.append(key(pygame.K_r))
+    return events
+
+def script_flyswatter(scene, f):
+    events = [move(orbit((500, 380), 250, f / 25))]
+    if f % 12 == 0:
+        events.append(down(pointer.pos))
+    if f % 12 == 2:
+        events.append(up(pointer.pos))
+    if f % 600 == 599:
+        events.append(key(pygame.K_r))
+    return events
+
+def script_iron(scene, f):
+    # Grab the iron, then follow the path there and back
+    t = f % 400
+    if t == 0:
+        return [down(scene.iron.rect.center)]
+    if t == 399:
+        return [up(scene.iron.rect.center)]
+    pts = scene.pts
+    u = (t / 200) if t < 200 else (2 - t / 200)
+    i = min(len(pts) - 2, int(u * (len(pts) - 1)))
+    k = u * (len(pts) - 1) - i
+    return [move((pts[i][0] + (pts[i + 1][0] - pts[i][0]) * k, pts[i][1] + (pts[i + 1][1] - pts[i][1]) * k))]
+
+def script_stove(scene, f):
+    t = f % 300
+    ang = math.radians(t * 1.2 - 90)
+    pos = orbit(scene.center, scene.knob_radius, ang)
+    if t == 0:
+        return [down(pos)]
+    if t == 299:
+        return [up(pos)]
+    return [move(pos)]
+
+def script_clock(scene, f):
+    t = f % 240
+    pos = orbit(scene.center, scene.radius * 0.7, math.radians(t * 1.5 - 90))
+    if t == 0:
+        return [down(pos)]
+    if t == 239:
+        return [up(pos)]
+    return [move(pos)]
+
+def script_bookshelf(scene, f):
+    return [move((400 + 300 * math.sin(f / 40), 600))]
+
+def script_fridge(scene, f):
+    # Drag each left socket to its matching right socket
+    t = f % 90
+    i = (f // 90) % len(scene.y_positions)
+    start = (scene.left_x, scene.y_positions[i])
+    j = scene.right_colors.index(scene.left_colors[i])
+    end = (scene.right_x, scene.y_positions[j])
+    if t == 0:
+        return [down(start)]
+    if t < 60:
+        return [move((start[0] + (end[0] - start[0]) * t / 60, start[1] + (end[1] - start[1]) * t / 60))]
+    if t == 60:
+        return [up(end)]
+    return []
+
+def script_mirror(scene, f):
+    r = scene.rect
+    t = f % 600
+    x = r.x + r.w * (0.5 + 0.45 * math.sin(t / 9))
+    y = r.y + r.h * (t / 600)
+    if t == 0:
+        return [down((x, y))]
+    if t == 599:
+        return [up((x, y))]
+    return [move((x, y))]
+
+SCRIPTS = {
+    "bathtub": script_bathtub,
+    "record": script_record,
+    "flyswatter": script_flyswatter,
+    "iron": script_iron,
+    "stove": script_stove,
+    "clock": script_clock,
+    "bookshelf": script_bookshelf,
+    "fridge": script_fridge,
+    "mirror": script_mirror,
+}
+
+
+# --- RUNNER ---
+
+def build(name, manager):
+    scene = get_puzzle(name).build(manager.screen)
+    manager.switch(scene)
+    manager.apply_switch()
+    pointer.reset()
+    return scene
+
+
+def drive(name, frames, on_frame=None):
+    """Runs one puzzle for `frames` frames. on_frame(update_s, draw_s) is called per frame."""
+    random.seed(SEED)
+    manager = get_manager()
+    script = SCRIPTS[name]
+    scene = build(name, manager)
+    rounds = 1
+
+    for f in range(frames):
+        manager.ticks += DT * 1000
+        t0 = time.perf_counter()
+        for event in script(scene, f):
+            pointer.feed(event)
+            scene.handle(event)
+        manager.advance(scene, DT)
+        t1 = time.perf_counter()
+        if not scene.finished:
+            manager.render(scene)
+        t2 = time.perf_counter()
+        if on_frame:
+            on_frame(t1 - t0, t2 - t1)
+        if scene.finished:
+            # Puzzle solved: start a fresh round of the same puzzle
+            scene = build(name, manager)
+            rounds += 1
+    return rounds
+
+
+def summary(samples):
+    s = sorted(samples)
+    ms = lambda v: round(v * 1000, 4)
+    return {"p50": ms(percentile(s, 50)), "p95": ms(percentile(s, 95)),
+            "p99": ms(percentile(s, 99)), "max": ms(s[-1]), "mean": ms(sum(s) / len(s))}
+
+
+def bench_one(name, frames):
+    update_s, draw_s = [], []
+    drive(name, min(frames, 60))  # warm-up: caches, fonts, first-frame work
+    rounds = drive(name, frames, lambda u, d: (update_s.append(u), draw_s.append(d)))
+
+    # Allocation pass (untimed: tracemalloc slows everything down)
+    counter = SurfaceCounter()
+    counter.install()
+    tracemalloc.start()
+    try:
+        drive(name, frames)
+        py_current, py_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        counter.uninstall()
+
+    return {
+        "frames": frames,
+        "rounds": rounds,
+        "update_ms": summary(update_s),
+        "draw_ms": summary(draw_s),
+        "surface_allocs_per_frame": round(counter.count / frames, 3),
+        "surface_kb_per_frame": round(counter.bytes / frames / 1024, 2),
+        "py_peak_kb": round(py_peak / 1024, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("scenes", nargs="*", default=list(SCRIPTS))
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    parser.add_argument("--in-process", action="store_true", help="run everything in this process (RSS is then cumulative)")
+    args = parser.parse_args()
+
+    report = {}
+    for name in args.scenes:
+        if args.in_process:
+            report[name] = bench_one(name, args.frames)
+        else:
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), name, "--frames", str(args.frames), "--in-process"],
+                                 capture_output=True, text=True, check=True).stdout
+            report[name] = json.loads(out[out.index("{"):])[name]
+        print(f"{name:<12} update p95 {report[name]['update_ms']['p95']:>7.3f} ms   "
+              f"draw p95 {report[name]['draw_ms']['p95']:>7.3f} ms   "
+              f"surfaces/frame {report[name]['surface_allocs_per_frame']:>6}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
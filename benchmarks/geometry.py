@@ -0,0 +1,111 @@
+"""
+components/geometry: pure-Python loops vs the batched NumPy queries, for a
+few points (what one frame of pointer samples looks like) up to thousands
+(particles, Monte Carlo). Each row also checks that both give the same answer.
+
+"loop"   = the per-point code the puzzles used to carry (nearest_progress
+           re-measures the path on every call, like iron_game did)
+"scalar" = the same loop over geometry's scalar helpers with cached state
+"batch"  = one *_many / points_in_* call, including turning the Python
+           lists into arrays (the cheap tests are dominated by that)
+
+    python benchmarks/geometry.py [repeats]
+"""
+import os
+import sys
+import time
+import random
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from components import geometry as geo
+
+SIZES = (4, 64, 1024, 8192)
+W, H = 1000, 650
+
+
+def timed(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6, out
+
+
+def random_points(n):
+    return [(random.uniform(0, W), random.uniform(0, H)) for _ in range(n)]
+
+
+def polyline_case(n):
+    pts = [(60 + i * 60, random.randint(150, 500)) for i in range(13)]  # iron, difficulty 3
+    path = geo.Polyline(pts)
+    points = random_points(n)
+    loop = lambda: [geo.nearest_progress(p, pts) for p in points]
+    scalar = lambda: [path.nearest(p) for p in points]
+    batch = lambda: path.nearest_many(points)
+    def same(a, b):
+        prog, d = b
+        return all(abs(x[0] - y) < 1e-9 and abs(x[1] - z) < 1e-6 for x, y, z in zip(a, prog, d))
+    return loop, scalar, batch, same
+
+
+def circle_rect_case(n):
+    rects = [pygame.Rect(random.randint(0, W - 200), random.randint(0, H - 80), random.randint(20, 200),
+                         random.randint(10, 80)) for _ in range(12)]  # a dozen tub walls
+    points = random_points(n)
+    radii = [22.0] * n
+    loop = lambda: [[geo.circle_rect_hit(x, y, r, rect)[0] for rect in rects] for (x, y), r in zip(points, radii)]
+    batch = lambda: geo.circles_hit_rects(points, radii, rects)
+    same = lambda a, b: [list(row) for row in b] == a
+    return loop, None, batch, same
+
+
+def circle_case(n):
+    centers = random_points(16)
+    radii = [random.uniform(10, 60) for _ in centers]
+    points = random_points(n)
+    loop = lambda: [[geo.in_circle(p, c, r) for c, r in zip(centers, radii)] for p in points]
+    batch = lambda: geo.points_in_circles(points, centers, radii)
+    same = lambda a, b: [list(row) for row in b] == a
+    return loop, None, batch, same
+
+
+def annulus_case(n):
+    centers, radii, widths = [(400, 500)], [150.0], [45.0]  # stove track
+    points = random_points(n)
+    loop = lambda: [[geo.in_annulus(p, c, r, w) for c, r, w in zip(centers, radii, widths)] for p in points]
+    batch = lambda: geo.points_in_annuli(points, centers, radii, widths)
+    same = lambda a, b: [list(row) for row in b] == a
+    return loop, None, batch, same
+
+
+CASES = {
+    "polyline": polyline_case,
+    "circle-rect": circle_rect_case,
+    "in-circle": circle_case,
+    "annulus": annulus_case,
+}
+
+
+def main(repeats=20):
+    random.seed(3)
+    if geo.np is None:
+        print("NumPy not installed: batch rows time the scalar fallback")
+    print(f"{'case':<13}{'points':>7}{'loop us':>11}{'scalar us':>11}{'batch us':>11}{'batch x':>9}  same")
+    for name, make in CASES.items():
+        for n in SIZES:
+            loop, scalar, batch, same = make(n)
+            t_loop, ref = timed(loop, repeats)
+            t_scalar = timed(scalar, repeats)[0] if scalar else None
+            t_batch, out = timed(batch, repeats)
+            scalar_col = f"{t_scalar:>11.1f}" if t_scalar is not None else f"{'-':>11}"
+            print(f"{name:<13}{n:>7}{t_loop:>11.1f}{scalar_col}{t_batch:>11.1f}"
+                  f"{t_loop / t_batch:>8.1f}x  {'yes' if same(ref, out) else 'NO'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,65 @@
+"""
+Cost of keeping the performance HUD (F3) on, per puzzle.
+Runs the same scripted frames as frame_times.py twice, HUD off and HUD on,
+and compares the mean of render() + HUD bookkeeping per frame. "self ms" is
+the mean of what the HUD reports as its own cost (the "hud" figure).
+
+    python benchmarks/hud_overhead.py [frames]
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from general.pointer import pointer
+from frame_times import SCRIPTS, SEED, DT, build
+
+
+def run(manager, name, frames, hud):
+    if bool(manager.hud) != hud:
+        manager.toggle_hud()
+    random.seed(SEED)
+    scene = build(name, manager)
+    script = SCRIPTS[name]
+    total = reported = 0.0
+    for f in range(frames):
+        for event in script(scene, f):
+            pointer.feed(event)
+            scene.handle(event)
+        manager.advance(scene, DT)
+        if scene.finished:
+            scene = build(name, manager)
+            continue
+        start = time.perf_counter()
+        manager.render(scene)
+        if manager.hud:
+            manager.hud.record(DT * 1000, 0.0, 0.0, time.perf_counter() - start)
+            reported += manager.hud.cost_ms
+        total += time.perf_counter() - start
+    return total / frames * 1000, reported / frames
+
+
+def main(frames=300):
+    manager = get_manager()
+    print(f"{'scene':<12}{'off ms':>10}{'on ms':>10}{'cost ms':>10}{'self ms':>10}")
+    for name in SCRIPTS:
+        run(manager, name, 30, hud=False)  # warm-up
+        off, _ = run(manager, name, frames, hud=False)
+        on, reported = run(manager, name, frames, hud=True)
+        print(f"{name:<12}{off:>10.3f}{on:>10.3f}{on - off:>10.3f}{reported:>10.3f}")
+    if manager.hud:
+        manager.toggle_hud()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
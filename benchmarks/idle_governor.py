@@ -0,0 +1,67 @@
+"""
+CPU cost of sitting on a quiet screen with and without the idle governor.
+Each scene is left alone (no input) for a few seconds of wall time, going
+through SceneManager.step() exactly like the game loop does.
+
+Under the dummy video driver SDL emulates pygame.event.wait() by polling every
+millisecond, so "cpu on" overstates the governed cost there; with a real
+display the wait blocks in the OS. The frame counts are driver independent.
+
+    python benchmarks/idle_governor.py [seconds]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from general.governor import Governor
+from components.puzzle.clock_game import ClockGame
+from components.puzzle.fridge_game import WireGame
+from components.puzzle.mirror_game import MirrorRoom
+from start_instructions import HiddenMenu
+
+SCENES = [
+    ("menu", lambda screen: HiddenMenu()),
+    ("clock", lambda screen: ClockGame(screen)),
+    ("fridge", lambda screen: WireGame(screen)),
+    ("mirror", lambda screen: MirrorRoom(screen)),
+]
+
+
+def run(manager, make_scene, seconds, governed):
+    manager.governor = Governor()
+    manager.governor.enabled = governed
+    manager.switch(make_scene(manager.screen))
+    frames = 0
+    manager.pixels_presented = 0
+    wall, cpu = time.perf_counter(), time.process_time()
+    while time.perf_counter() - wall < seconds:
+        manager.step()
+        frames += 1
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    area = manager.screen.get_width() * manager.screen.get_height()
+    return cpu / wall, frames / wall, manager.pixels_presented / area / wall
+
+
+def main(seconds=3.0):
+    manager = get_manager()
+    print(f"{'scene':<8}{'cpu off':>10}{'cpu on':>10}{'fps off':>10}{'fps on':>10}{'screens/s on':>14}")
+    for name, make_scene in SCENES:
+        cpu_off, fps_off, _ = run(manager, make_scene, seconds, governed=False)
+        cpu_on, fps_on, screens_on = run(manager, make_scene, seconds, governed=True)
+        print(f"{name:<8}{cpu_off:>10.1%}{cpu_on:>10.1%}{fps_off:>10.1f}{fps_on:>10.1f}{screens_on:>14.2f}")
+    print()
+    print(manager.governor.report())
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3.0)
@@ -0,0 +1,80 @@
+"""
+Ironing coverage: incremental grid vs scanning the pressed surface.
+
+Drags the iron along the path at a few speeds and, every frame, measures
+"stroke" = Coverage.stroke() for each new sample (what the scene does)
+"scan"   = mask of the pressed surface overlapped with a mask of the path
+           core, counted over the whole cloth (the full-surface alternative)
+and compares the two "percent of path pressed" numbers at the end.
+
+    python benchmarks/iron_coverage.py [difficulty]
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from components.puzzle import iron_game
+from touch_samples import densify
+
+STEPS = (2, 6, 12)   # samples per path segment: slow, medium and fast drags
+
+
+def path_mask(scene):
+    """The cells Coverage counts as path, drawn at full resolution."""
+    cov, c = scene.coverage, iron_game.COVER_CELL
+    surf = pygame.Surface(scene.cloth.size, pygame.SRCALPHA)
+    for i, on in enumerate(cov.path):
+        if on:
+            surf.fill((255, 255, 255, 255), ((i % cov.cols) * c, (i // cov.cols) * c, c, c))
+    return pygame.mask.from_surface(surf)
+
+
+def run(difficulty, steps):
+    random.seed(difficulty)
+    scene = iron_game.IronGame(get_manager().screen, difficulty=difficulty)
+    core = path_mask(scene)
+    total = core.count()
+    radius = int(18 * scene.iron.scale)
+    samples = densify([scene.iron.rect.center] + list(scene.pts), steps)
+    frames = [samples[i:i + 4] for i in range(0, len(samples), 4)]  # 4 samples per frame
+
+    stroke = scan = 0.0
+    last = samples[0]
+    for pts in frames:
+        a = last
+        start = time.perf_counter()
+        for p in pts:
+            scene.coverage.stroke(last, p, radius)
+            last = p
+        stroke += time.perf_counter() - start
+        # paint the same strokes so the scan has something to count
+        for p in pts:
+            scene.paint(a, p, radius)
+            a = p
+        start = time.perf_counter()
+        pressed = pygame.mask.from_surface(scene.pressed, 1).overlap_area(core, (0, 0))
+        scan += time.perf_counter() - start
+    n = len(frames)
+    return stroke / n * 1e6, scan / n * 1e6, scene.coverage.fraction, pressed / total
+
+
+def main(difficulty=2):
+    print(f"{'samples/seg':<13}{'stroke us':>10}{'scan us':>10}{'grid':>8}{'pixels':>8}")
+    for steps in STEPS:
+        stroke, scan, grid, pixels = run(difficulty, steps)
+        print(f"{steps:<13}{stroke:>10.1f}{scan:>10.1f}{grid:>8.1%}{pixels:>8.1%}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2)
@@ -0,0 +1,72 @@
+"""
+Mirror clean check: tile counters vs scanning the dirt layer.
+
+Scrubs random strokes over the mirror and, every frame, times
+"scan"  = pygame.mask.from_surface(dirt_layer).count() (the old check)
+"tiles" = DirtTiles.recount() over the tiles the brush touched
+"numpy off" = the same recount without NumPy (mask per tile)
+and checks that the tile total matches the scan after every frame.
+
+    python benchmarks/mirror_dirt.py [frames]
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from components.puzzle import mirror_game
+
+STROKES_PER_FRAME = 6   # brush dabs per frame, about a quick scrub
+
+
+def run(frames, brush_size, use_numpy):
+    saved = mirror_game.np
+    if not use_numpy:
+        mirror_game.np = None
+    try:
+        random.seed(7)
+        scene = mirror_game.MirrorRoom(get_manager().screen)
+        layer, tiles = scene.dirt_layer, scene.dirt
+        brush = pygame.Surface((brush_size * 2, brush_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(brush, (0, 0, 0, 150), (brush_size, brush_size), brush_size)
+
+        scan = recount = 0.0
+        wrong = 0
+        x, y = layer.get_width() // 2, layer.get_height() // 2
+        for _ in range(frames):
+            for _ in range(STROKES_PER_FRAME):
+                x = min(max(x + random.randint(-40, 40), 0), layer.get_width())
+                y = min(max(y + random.randint(-40, 40), 0), layer.get_height())
+                tiles.touch(layer.blit(brush, (x - brush_size, y - brush_size), special_flags=pygame.BLEND_RGBA_SUB))
+            start = time.perf_counter()
+            total = tiles.recount()
+            mid = time.perf_counter()
+            full = pygame.mask.from_surface(layer).count()
+            scan += time.perf_counter() - mid
+            recount += mid - start
+            wrong += total != full
+        return scan / frames * 1e6, recount / frames * 1e6, wrong, tiles.clean
+    finally:
+        mirror_game.np = saved
+
+
+def main(frames=300):
+    print(f"{'brush':<8}{'numpy':<7}{'scan us':>9}{'tiles us':>10}{'wrong':>7}{'clean':>7}")
+    for brush in (25, 50):
+        for use_numpy in (True, False):
+            scan, tiles, wrong, clean = run(frames, brush, use_numpy)
+            print(f"{brush:<8}{'on' if use_numpy else 'off':<7}{scan:>9.1f}{tiles:>10.1f}{wrong:>7}{clean:>7.0%}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,66 @@
+"""
+Nearest-point queries on the ironing path: a full scan (Polyline.nearest)
+vs PathTracker's window + grid, on the straight 13-point path and on spline
+paths with hundreds to thousands of samples. Each row also checks that the
+tracker returns the same answer as the full scan.
+
+"drag" = the pointer follows the path with up to 15 px of wobble
+"jump" = every query lands somewhere random on the screen
+
+    python benchmarks/path_tracker.py [queries]
+"""
+import os
+import sys
+import time
+import random
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from components import geometry as geo
+
+W, H = 900, 500
+SPACINGS = (None, 4.0, 1.0, 0.3)   # None = the straight path the game draws at difficulty 3
+WOBBLE = 15
+
+
+def control_points():
+    return [(220 + i * 40, 250 + random.randint(-96, 96)) for i in range(13)]
+
+
+def drag(pts, n):
+    out = []
+    for i in range(n):
+        x, y = pts[int(i / n * (len(pts) - 1))]
+        out.append((x + random.uniform(-WOBBLE, WOBBLE), y + random.uniform(-WOBBLE, WOBBLE)))
+    return out
+
+
+def jump(n):
+    return [(random.uniform(0, W), random.uniform(0, H)) for _ in range(n)]
+
+
+def timed(fn, queries):
+    start = time.perf_counter()
+    out = [fn(q) for q in queries]
+    return (time.perf_counter() - start) / len(queries) * 1e6, out
+
+
+def main(queries=2000):
+    random.seed(3)
+    ctrl = control_points()
+    print(f"{'samples':>8}{'queries':>8}{'scan us':>10}{'tracker us':>12}{'x':>8}  same")
+    for spacing in SPACINGS:
+        pts = ctrl if spacing is None else geo.smooth_path(ctrl, spacing)
+        scan = geo.Polyline(pts)
+        for name, qs in (("drag", drag(pts, queries)), ("jump", jump(queries // 10))):
+            tracker = geo.PathTracker(pts)
+            t_scan, ref = timed(scan.nearest, qs)
+            t_track, out = timed(tracker.nearest, qs)
+            same = all(abs(a[0] - b[0]) < 1e-9 and abs(a[1] - b[1]) < 1e-6 for a, b in zip(ref, out))
+            print(f"{len(pts):>8}{name:>8}{t_scan:>10.1f}{t_track:>12.1f}{t_scan / t_track:>7.1f}x  {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
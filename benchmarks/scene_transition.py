@@ -0,0 +1,98 @@
+"""
+Room -> minigame transition cost, old way vs. SceneManager.
+
+  old:       pygame.init() + set_mode() + build scene + first frame + pygame.quit()
+  new:       build scene + SceneManager switch + first frame on the shared display
+  preload:   same as new, but the scene's images were queued on the AssetService
+             while the previous scene was running
+
+Runs headless by default:  python benchmarks/scene_transition.py [rounds]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import SceneManager
+from general.assets import get_assets
+from general import fonts, sprites
+from general.levels import LEVELS
+
+
+def first_frame(scene):
+    scene.update(0.0)
+    scene.draw()
+    pygame.display.flip()
+
+
+def old_transition(scene_cls, kwargs):
+    start = time.perf_counter()
+    pygame.init()
+    screen = pygame.display.set_mode(scene_cls.size)
+    scene = scene_cls(screen, **kwargs)
+    first_frame(scene)
+    pygame.quit()
+    fonts.reset()  # cached fonts die with pygame.quit()
+    sprites.reset()
+    return time.perf_counter() - start
+
+
+def new_transition(manager, scene_cls, kwargs, preload=False):
+    assets = get_assets()
+    assets.drop()
+    if preload:
+        scene_cls.preload(**kwargs)
+        # Stand-in for the previous scene's frames: let the pool finish, pumping like step() does
+        while assets.pending:
+            assets.pump()
+            time.sleep(0.001)
+
+    start = time.perf_counter()
+    scene = scene_cls(screen=manager.screen, **kwargs)
+    manager.switch(scene)
+    manager.apply_switch()
+    first_frame(scene)
+    return time.perf_counter() - start
+
+
+def median_ms(samples):
+    return sorted(samples)[len(samples) // 2] * 1000
+
+
+def main(rounds=5):
+    names = [puzzle.name for puzzle in LEVELS]
+    results = {"old": {n: [] for n in names}, "new": {n: [] for n in names}, "preload": {n: [] for n in names}}
+
+    for _ in range(rounds):
+        for puzzle in LEVELS:
+            get_assets().drop()
+            results["old"][puzzle.name].append(old_transition(puzzle.scene_cls, puzzle.kwargs))
+
+    manager = SceneManager()
+    for _ in range(rounds):
+        for puzzle in LEVELS:
+            results["new"][puzzle.name].append(new_transition(manager, puzzle.scene_cls, puzzle.kwargs))
+            results["preload"][puzzle.name].append(new_transition(manager, puzzle.scene_cls, puzzle.kwargs, preload=True))
+    pygame.quit()
+
+    print(f"{'scene':<12}{'old ms':>10}{'new ms':>10}{'preload ms':>12}{'speedup':>10}")
+    totals = {"old": 0.0, "new": 0.0, "preload": 0.0}
+    for name in names:
+        row = {k: median_ms(results[k][name]) for k in totals}
+        for k in totals:
+            totals[k] += row[k]
+        print(f"{name:<12}{row['old']:>10.2f}{row['new']:>10.2f}{row['preload']:>12.2f}"
+              f"{row['old'] / max(row['preload'], 1e-6):>9.1f}x")
+    print(f"{'total':<12}{totals['old']:>10.2f}{totals['new']:>10.2f}{totals['preload']:>12.2f}"
+          f"{totals['old'] / max(totals['preload'], 1e-6):>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,59 @@
+"""
+Per-frame draw cost of the fly swatter with and without the rotation/scale
+sprite cache (general/sprites.py), plus what the cache ends up holding.
+
+"off" = smoothscale + rotate for every fly and the swatter on every frame
+"on"  = cache lookups + blits (flies and swing angles pre-rendered at load)
+
+    python benchmarks/sprite_cache.py [frames]
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general import sprites
+from general.start import get_manager
+from frame_times import build, SEED, DT
+
+
+def time_frames(scene, frames):
+    samples = []
+    for f in range(frames):
+        scene.update(DT)
+        if f % 20 == 0:
+            scene.swatter.swing_now()
+        start = time.perf_counter()
+        scene.draw()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return sum(samples) / len(samples) * 1000, samples[int(len(samples) * 0.95)] * 1000
+
+
+def main(frames=600):
+    manager = get_manager()
+    print(f"{'cache':<7}{'flies':>6}{'load ms':>9}{'mean ms':>9}{'p95 ms':>9}")
+    for on in (False, True):
+        sprites.set_enabled(on)
+        sprites.reset()
+        random.seed(SEED)
+        start = time.perf_counter()
+        scene = build("flyswatter", manager)
+        load = (time.perf_counter() - start) * 1000
+        mean, p95 = time_frames(scene, frames)
+        print(f"{'on' if on else 'off':<7}{len(scene.flies):>6}{load:>9.2f}{mean:>9.3f}{p95:>9.3f}")
+    cache = sprites.sprites
+    print(f"  {len(cache.surfaces)} surfaces, {cache.bytes / 1e6:.1f} MB  {cache.stats}  hit rate {cache.hit_rate():.1%}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 600)
@@ -0,0 +1,64 @@
+"""
+Time to the menu's first frame from a cold interpreter, with every puzzle
+registered. "lazy" is the normal start (puzzle modules import on first use);
+"eager" imports all nine up front, the way general/levels.py used to.
+
+    python benchmarks/startup.py [runs]
+"""
+import os
+import sys
+import json
+import time
+import subprocess
+
+START = time.perf_counter()
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+def child(mode):
+    from general.start import get_manager
+    from general.levels import LEVELS, preload_level
+    from start_instructions import HiddenMenu
+
+    imports = time.perf_counter()
+    if mode == "eager":
+        for puzzle in LEVELS:
+            puzzle.scene_cls
+    imports = time.perf_counter() - imports
+    manager = get_manager()
+    preload_level(0)
+    manager.switch(HiddenMenu())
+    manager.step()  # first frame presented
+    elapsed = time.perf_counter() - START
+    loaded = sum(puzzle.loaded for puzzle in LEVELS)
+    print(json.dumps({"ms": elapsed * 1000, "imports_ms": imports * 1000, "loaded": loaded}))
+
+
+def run(mode):
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode],
+                         capture_output=True, text=True, check=True).stdout
+    wall = (time.perf_counter() - start) * 1000
+    result = json.loads(out.strip().splitlines()[-1])
+    return result["ms"], wall, result["imports_ms"], result["loaded"]
+
+
+def main(runs=7):
+    print(f"{'mode':<8}{'first frame ms':>16}{'process ms':>12}{'puzzle imports ms':>19}{'puzzles loaded':>16}")
+    for mode in ("eager", "lazy"):
+        samples = sorted(run(mode) for _ in range(runs))
+        ms, wall, imports, loaded = samples[len(samples) // 2]
+        print(f"{mode:<8}{ms:>16.1f}{wall:>12.1f}{imports:>19.1f}{loaded:>16}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
@@ -0,0 +1,167 @@
+"""
+Swatter hit test: the old fixed 160x160 rect (85 px above the cursor) vs
+the pixel masks of the swatter head, on random fly positions around random
+strikes. "Pixel" is the ground truth here, since it is what the player sees.
+
+    unearned = kills the rect gave to flies the head never touched
+    missed   = flies under the head the rect let live
+
+Then fast strikes: a click followed by a flick, with the pointer sampled
+SAMPLES times per frame, for the whole SWING_COOLDOWN window. Kill rate of a
+single fly near the strike when only the click is tested, when the head is
+tested once per frame, and when it is swept along the sub-frame path.
+
+Last, the cost of one swat and of one swept frame against swarms of growing
+size (broad phase + mask tests for the flies near the head).
+
+    python benchmarks/swatter_hits.py [strikes]
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from general.pointer import pointer
+from components.puzzle import flyswatter_game as fs
+from frame_times import SEED, DT
+
+SIZES = (14, 200, 1000)
+NEAR = 140     # flies are scattered this far around each strike
+SAMPLES = 4    # pointer samples per frame (a 240 Hz mouse)
+FLICK = 2400   # px/s, fastest flick
+
+
+def old_rect(pos):
+    return pygame.Rect(pos[0] - 80, pos[1] - 85 - 80, 160, 160)
+
+
+def accuracy(scene, strikes):
+    swatter = scene.swatter
+    fair = unearned = missed = 0
+    for _ in range(strikes):
+        swatter.pos = (random.randint(200, 800), random.randint(200, 450))
+        swatter.swing_now()
+        mask, topleft, bounds = swatter.hit_area()
+        rect = old_rect(swatter.pos)
+        fly = fs.Fly(scene.fly_img)
+        fly.pos = [swatter.pos[0] + random.uniform(-NEAR, NEAR), swatter.pos[1] + random.uniform(-NEAR * 1.5, NEAR)]
+        fly.angle = random.uniform(0, 360)
+        by_rect = rect.collidepoint(int(fly.pos[0]), int(fly.pos[1]))
+        by_mask = fly.hit_by(mask, topleft)
+        fair += by_rect == by_mask
+        unearned += by_rect and not by_mask
+        missed += by_mask and not by_rect
+    return fair, unearned, missed
+
+
+def motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(1, 0, 0))
+
+
+def strike(scene, fly, start, flick, mode):
+    """One click + flick against one fly. mode: "click", "frame" or "swept". -> killed"""
+    swatter = scene.swatter
+    scene.flies = [fly]
+    scene.won = False
+    pointer.reset(start)
+    swatter.pos = start
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=start, button=1)
+    pointer.feed(click)
+    swatter.cooldown = 0.0
+    scene.handle(click)
+    pos = start
+    while swatter.striking() and fly.alive:
+        for _ in range(SAMPLES):
+            pos = (pos[0] + flick[0] * DT / SAMPLES, pos[1] + flick[1] * DT / SAMPLES)
+            pointer.feed(motion((int(pos[0]), int(pos[1]))))
+        if mode == "swept":
+            scene.update(DT)
+            continue
+        fly.update(DT)
+        swatter.update(DT)
+        if mode == "frame":
+            scene.swat()
+    return not fly.alive
+
+
+def flicks(scene, strikes):
+    totals = {"click": 0, "frame": 0, "swept": 0}
+    state = random.getstate()
+    for mode in totals:
+        random.setstate(state)
+        for _ in range(strikes):
+            start = (random.randint(250, 750), random.randint(250, 450))
+            speed, ang = random.uniform(0, FLICK), random.uniform(0, 360)
+            flick = pygame.Vector2(speed, 0).rotate(ang)
+            fly = fs.Fly(scene.fly_img)
+            fly.pos = [start[0] + random.uniform(-2 * NEAR, 2 * NEAR), start[1] + random.uniform(-2 * NEAR, NEAR)]
+            fly.prev = tuple(fly.pos)
+            totals[mode] += strike(scene, fly, start, (flick.x, flick.y), mode)
+    return totals
+
+
+def swat_cost(scene, n, repeats=200):
+    swarm = fs.FlySwarm(scene.fly_img, n)
+    alive = swarm.alive.copy()
+    swatter = scene.swatter
+    best = float("inf")
+    for i in range(repeats):
+        swatter.pos = (fs.PLAY.left + (i * 37) % fs.PLAY.w, fs.PLAY.top + (i * 23) % fs.PLAY.h)
+        swatter.swing_now()
+        area = swatter.hit_area()
+        swarm.alive[:] = alive
+        start = time.perf_counter()
+        swarm.swat(*area)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def sweep_cost(scene, n, repeats=200):
+    swarm = fs.FlySwarm(scene.fly_img, n)
+    swarm.update(DT)
+    alive = swarm.alive.copy()
+    swatter = scene.swatter
+    mask, half, bounds = swatter.hit_pose()
+    reach = bounds.inflate(2 * fs.FLY_REACH, 2 * fs.FLY_REACH)
+    best = float("inf")
+    for i in range(repeats):
+        x, y = fs.PLAY.left + (i * 37) % fs.PLAY.w, fs.PLAY.top + (i * 23) % fs.PLAY.h
+        path = [(x + k * 10, y + k * 4) for k in range(SAMPLES + 1)]
+        swarm.alive[:] = alive
+        start = time.perf_counter()
+        swarm.sweep(mask, half, reach, path)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main(strikes=20000):
+    random.seed(SEED)
+    manager = get_manager()
+    scene = fs.FlySwatterGame(manager.screen)
+    fair, unearned, missed = accuracy(scene, strikes)
+    print(f"{strikes} strikes: rect agrees with the pixels {fair / strikes:.1%}, "
+          f"unearned kills {unearned / strikes:.1%}, missed kills {missed / strikes:.1%}")
+    n = strikes // 10
+    kills = flicks(scene, n)
+    print(f"{n} flicks: fly killed by the click only {kills['click'] / n:.1%}, "
+          f"per frame {kills['frame'] / n:.1%}, swept {kills['swept'] / n:.1%}")
+    if fs.np is None:
+        print("NumPy not installed: no FlySwarm to time")
+    else:
+        print(f"{'flies':>6}{'swat us':>10}{'sweep us':>10}")
+        for n in SIZES:
+            print(f"{n:>6}{swat_cost(scene, n):>10.1f}{sweep_cost(scene, n):>10.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
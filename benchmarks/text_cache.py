@@ -0,0 +1,52 @@
+"""
+Per-frame draw cost of the clock and stove scenes with and without the
+font registry / rendered-text cache (general/fonts.py).
+
+    python benchmarks/text_cache.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general import fonts
+from general.start import get_manager
+from components.puzzle.clock_game import ClockGame
+from components.puzzle.stove_game import StoveGame
+
+
+def time_draws(scene, frames):
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        scene.draw()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return sum(samples) / len(samples) * 1000, samples[int(len(samples) * 0.95)] * 1000
+
+
+def main(frames=300):
+    manager = get_manager()
+    print(f"{'scene':<11}{'cache':<7}{'mean ms':>10}{'p95 ms':>10}")
+    for scene_cls in (ClockGame, StoveGame):
+        for on in (False, True):
+            fonts.set_enabled(on)
+            fonts.reset()
+            scene = scene_cls(manager.screen)
+            manager.switch(scene)
+            manager.apply_switch()
+            mean, p95 = time_draws(scene, frames)
+            print(f"{scene_cls.__name__:<11}{'on' if on else 'off':<7}{mean:>10.3f}{p95:>10.3f}")
+        print(f"  fonts {fonts.fonts.stats}  text {fonts.text_cache.stats}  hit rate {fonts.text_cache.hit_rate():.1%}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,113 @@
+"""
+Fast touch drags with and without sub-frame samples.
+A 240 Hz finger (4 samples per 60 Hz frame, plus SDL's mouse copies) swipes
+the iron along its path and scrubs the mirror. "latest" delivers only the
+last sample of each frame, like polling the mouse once per frame; "all"
+delivers every sample through the pointer's ring buffers.
+
+    python benchmarks/touch_samples.py
+"""
+import os
+import sys
+import math
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from general.pointer import pointer
+from frame_times import build, DT
+
+SAMPLES_PER_FRAME = 4
+FINGER = 7
+
+
+def finger(etype, pos, size):
+    return pygame.event.Event(etype, touch_id=0, finger_id=FINGER, x=pos[0] / size[0], y=pos[1] / size[1],
+                              dx=0.0, dy=0.0, pressure=1.0)
+
+def mouse(etype, pos):
+    if etype == pygame.MOUSEMOTION:
+        return pygame.event.Event(etype, pos=pos, rel=(0, 0), buttons=(1, 0, 0), touch=True)
+    return pygame.event.Event(etype, pos=pos, button=1, touch=True)
+
+
+def drag(manager, scene, path, coalesce):
+    """Presses at path[0], moves through path at SAMPLES_PER_FRAME per frame, releases at the end."""
+    size = manager.screen.get_size()
+    frames = [path[i:i + SAMPLES_PER_FRAME] for i in range(1, len(path), SAMPLES_PER_FRAME)]
+    first = [finger(pygame.FINGERDOWN, path[0], size), mouse(pygame.MOUSEBUTTONDOWN, path[0])]
+    for i, chunk in enumerate(frames):
+        if coalesce:
+            chunk = chunk[-1:]
+        events = first if i == 0 else []
+        for p in chunk:
+            events += [finger(pygame.FINGERMOTION, p, size), mouse(pygame.MOUSEMOTION, p)]
+        for e in events:
+            pointer.feed(e)
+            scene.handle(e)
+        manager.advance(scene, DT)
+    for e in (finger(pygame.FINGERUP, path[-1], size), mouse(pygame.MOUSEBUTTONUP, path[-1])):
+        pointer.feed(e)
+        scene.handle(e)
+    manager.advance(scene, DT)
+
+
+def densify(points, n):
+    out = []
+    for a, b in zip(points, points[1:]):
+        out += [(int(a[0] + (b[0] - a[0]) * i / n), int(a[1] + (b[1] - a[1]) * i / n)) for i in range(n)]
+    return out + [points[-1]]
+
+
+def iron(manager, coalesce):
+    random.seed(5)
+    scene = build("iron", manager)
+    start = scene.iron.rect.center
+    path = densify([start] + list(scene.pts), 6)  # ~1000 px/s swipe
+    drag(manager, scene, path, coalesce)
+    pressed = pygame.mask.from_surface(scene.pressed, 1).count()
+    return f"pressed {pressed} px, path {scene.coverage.fraction:.0%}"
+
+
+def mirror(manager, coalesce):
+    random.seed(5)
+    scene = build("mirror", manager)
+    r = scene.rect
+    # Quick scribble: a wiggle that completes a cycle every 2 frames
+    path = [(int(r.x + 80 + i * 2), int(r.centery + 150 * math.sin(i * math.tau / (SAMPLES_PER_FRAME * 2))))
+            for i in range(240)]
+    drag(manager, scene, path, coalesce)
+    return f"dirt removed {scene.dirt.clean:.0%}"
+
+
+def feed_cost(n=20000):
+    size = (800, 1000)
+    events = [finger(pygame.FINGERDOWN, (10, 10), size)]
+    events += [finger(pygame.FINGERMOTION, (i % 800, i % 1000), size) for i in range(n)]
+    pointer.reset()
+    start = time.perf_counter()
+    for e in events:
+        pointer.feed(e)
+    elapsed = time.perf_counter() - start
+    pointer.reset()
+    return elapsed / len(events) * 1e6
+
+
+def main():
+    manager = get_manager()
+    for name, run in (("iron", iron), ("mirror", mirror)):
+        print(f"{name:<8} latest: {run(manager, True):<20} all: {run(manager, False)}")
+    print(f"pointer.feed: {feed_cost():.2f} us per finger sample")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Bathtub slingshot preview: cost of drawing it per frame, old vs cached.
+
+"old"   = re-integrates 28 Euler steps and issues 28 draw.circle calls every frame
+"held"  = cached preview, pull not moving (one blits call)
+"moved" = cached preview, cache emptied every frame, so every frame is a miss
+          (closed-form arcs, swept only near surfaces, restarted per bounce)
+"drag"  = cached preview while the pull creeps DRAG_SPEED px per frame away
+          from the duck and back, like a player aiming
+
+    python benchmarks/trajectory_preview.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from general.start import get_manager
+from frame_times import build
+
+DRAG_SPEED = 1.5   # px of pull per frame
+PULLS = [(100, -80), (150, -120), (200, -60), (60, -150), (140, -160), (120, -180), (180, -140)]
+
+
+def old_preview(scene, screen, pull):
+    vx, vy = pull[0]*scene.power, pull[1]*scene.power
+    px, py = scene.duck.pos[0], scene.duck.pos[1]
+    pvx, pvy = vx, vy
+    for _ in range(scene.preview_steps):
+        pvy += scene.gravity * scene.preview_dt
+        px += pvx * scene.preview_dt
+        py += pvy * scene.preview_dt
+        pygame.draw.circle(screen, (120,170,255), (int(px), int(py)), 4)
+
+
+def new_preview(scene, screen, pull):
+    screen.blits(scene.preview(pull), doreturn=False)
+
+
+def per_frame(scene, draw, pulls, frames, clear):
+    screen = scene.screen
+    start = time.perf_counter()
+    for i in range(frames):
+        if clear:
+            scene.preview_cache.clear()
+        draw(scene, screen, pulls[i % len(pulls)])
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def drag_pulls(pull, frames):
+    """Pull positions for a slow aim: out along the pull's direction and back."""
+    L = (pull[0]**2 + pull[1]**2) ** 0.5
+    ux, uy = pull[0] / L, pull[1] / L
+    span = frames // 2
+    out = []
+    for i in range(frames):
+        d = (i if i < span else frames - i) * DRAG_SPEED - span * DRAG_SPEED / 2
+        out.append((pull[0] + ux * d, pull[1] + uy * d))
+    return out
+
+
+def main(frames=300):
+    scene = build("bathtub", get_manager())
+    print(f"{'pull':<14}{'old ms':>9}{'held ms':>9}{'moved ms':>10}{'drag ms':>9}{'dots':>6}")
+    for pull in PULLS:
+        old = per_frame(scene, old_preview, [pull], frames, False)
+        held = per_frame(scene, new_preview, [pull], frames, False)
+        moved = per_frame(scene, new_preview, [pull], frames // 10, True)
+        scene.preview_cache.clear()
+        drag = per_frame(scene, new_preview, drag_pulls(pull, frames), frames, False)
+        print(f"{str(pull):<14}{old:>9.3f}{held:>9.3f}{moved:>10.3f}{drag:>9.3f}{len(scene.preview(pull)):>6}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,452 @@
+"""
+Shared geometry for the puzzles.
+
+Scalar helpers take plain tuples / pygame.Rect and are what the per-event and
+per-sample code paths use. The *_many functions test many points against many
+shapes at once with NumPy (N points x M shapes -> an (N, M) array); without
+NumPy they fall back to the scalar helpers and return nested lists instead.
+
+Rects in the batched functions are (x, y, w, h) rows. Point-in-rect follows
+pygame.Rect.collidepoint (right/bottom edges excluded); circle-vs-rect clamps
+to the closed rect, like circle_rect_hit.
+
+The swept queries answer "when during this move" instead of "is it inside":
+sweep_interval(s) give the stretch of a straight move spent inside a rect,
+and sweep_mask walks a pygame.Mask along a move looking for the first overlap.
+A moving tool vs moving targets becomes one move each by taking the target's
+motion relative to the tool.
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SWEEP_SPACING = 4.0   # px between overlap tests in sweep_mask
+TRACK_WINDOW = 8      # segments either side of the last match PathTracker checks first
+TRACK_CELL = 16       # PathTracker grid cell size, in average segment lengths
+
+
+# --- SCALAR ---
+def clamp(v, a, b):
+    return max(a, min(b, v))
+
+def dist(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+def vlen(v): return math.hypot(v[0], v[1])
+def vsub(a, b): return (a[0] - b[0], a[1] - b[1])
+def vmul(v, k): return (v[0] * k, v[1] * k)
+def vnorm(v):
+    L = vlen(v)
+    return (0, 0) if L == 0 else (v[0] / L, v[1] / L)
+
+def in_circle(p, center, r):
+    dx, dy = p[0] - center[0], p[1] - center[1]
+    return dx * dx + dy * dy <= r * r
+
+def ring_dist(p, center, r):
+    """Distance from p to the outline of the circle (center, r)."""
+    return abs(dist(p, center) - r)
+
+def in_annulus(p, center, r, half_width):
+    return ring_dist(p, center, r) <= half_width
+
+def circle_rect_hit(cx, cy, r, rect):
+    """-> (hit, closest point on rect, (dx, dy) from that point to the centre)"""
+    px = clamp(cx, rect.left, rect.right)
+    py = clamp(cy, rect.top, rect.bottom)
+    dx, dy = cx - px, cy - py
+    return (dx*dx + dy*dy) <= r*r, (px, py), (dx, dy)
+
+def sweep_circle_rect(x, y, dx, dy, r, rect):
+    """
+    First contact of a circle of radius r at (x, y) moving by (dx, dy) with rect
+    (ray vs the rect grown by r, with rounded corners).
+    -> (f, nx, ny): fraction of the move at contact and the unit contact normal,
+    or None if it misses, moves away, or already overlaps.
+    """
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+    # Broad phase: the box swept by the move doesn't reach the grown rect
+    if (x + dx if dx < 0 else x) > right + r or (x + dx if dx > 0 else x) < left - r or \
+       (y + dy if dy < 0 else y) > bottom + r or (y + dy if dy > 0 else y) < top - r:
+        return None
+    f_in, f_out, axis = -math.inf, math.inf, None
+    for i, p, d, lo, hi in ((0, x, dx, left - r, right + r), (1, y, dy, top - r, bottom + r)):
+        if d == 0:
+            if p < lo or p > hi: return None
+            continue
+        a, b = (lo - p) / d, (hi - p) / d
+        if a > b: a, b = b, a
+        if a > f_in: f_in, axis = a, i
+        f_out = min(f_out, b)
+    if axis is None or f_in > f_out or f_in > 1 or f_out < 0:
+        return None
+
+    f = max(f_in, 0.0)
+    hx, hy = x + dx*f, y + dy*f
+    if left <= hx <= right or top <= hy <= bottom:
+        if f_in < 0: return None   # starts inside the flat part: overlapping
+        if axis == 0: return f, (-1.0 if dx > 0 else 1.0), 0.0
+        return f, 0.0, (-1.0 if dy > 0 else 1.0)
+
+    # Corner region: hit the circle of radius r around that corner
+    ox, oy = x - (left if hx < left else right), y - (top if hy < top else bottom)
+    a = dx*dx + dy*dy
+    b = ox*dx + oy*dy
+    c = ox*ox + oy*oy - r*r
+    disc = b*b - a*c
+    if c < 0 or b >= 0 or disc < 0:   # overlapping, moving away, or passing by
+        return None
+    f = (-b - math.sqrt(disc)) / a
+    if f > 1: return None
+    return f, (ox + dx*f) / r, (oy + dy*f) / r
+
+def sweep_interval(x, y, dx, dy, rect):
+    """
+    Part of the move (x, y) -> (x + dx, y + dy) spent inside the closed rect,
+    as fractions of the move. -> (t_in, t_out), 0 <= t_in <= t_out <= 1, or None.
+    """
+    t_in, t_out = 0.0, 1.0
+    for p, d, lo, hi in ((x, dx, rect[0], rect[0] + rect[2]), (y, dy, rect[1], rect[1] + rect[3])):
+        if d == 0:
+            if p < lo or p > hi: return None
+            continue
+        a, b = (lo - p) / d, (hi - p) / d
+        if a > b: a, b = b, a
+        t_in, t_out = max(t_in, a), min(t_out, b)
+        if t_in > t_out: return None
+    return t_in, t_out
+
+def sweep_mask(mask, other, start, move, t_in=0.0, t_out=1.0, spacing=SWEEP_SPACING):
+    """
+    Earliest t in [t_in, t_out] at which `other` overlaps `mask` while its
+    offset from it (as in pygame.Mask.overlap) goes start -> start + move.
+    Tested every `spacing` px along the move, so nothing thicker than that
+    is skipped. -> t or None
+    """
+    steps = max(1, int(math.ceil(vlen(move) * (t_out - t_in) / spacing)))
+    for i in range(steps + 1):
+        t = t_in + (t_out - t_in) * i / steps
+        offset = (int(round(start[0] + move[0] * t)), int(round(start[1] + move[1] * t)))
+        if mask.overlap(other, offset) is not None:
+            return t
+    return None
+
+def capsule_span(ax, ay, bx, by, r, y):
+    """
+    Where the horizontal line at y crosses the capsule around segment ab
+    (every point within r of it): -> (x_lo, x_hi) or None. Rasterizing a
+    stroke row by row with this only touches the cells it covers.
+    """
+    lo, hi = math.inf, -math.inf
+    for cx, cy in ((ax, ay), (bx, by)):
+        h = r * r - (y - cy) * (y - cy)
+        if h >= 0:
+            w = math.sqrt(h)
+            lo, hi = min(lo, cx - w), max(hi, cx + w)
+    dx, dy = bx - ax, by - ay
+    L2 = dx * dx + dy * dy
+    if L2 > 0:
+        # The straight part: within r of the line, and projecting inside the segment
+        yy = y - ay
+        band = None
+        if dy == 0:
+            if abs(yy) <= r: band = (min(ax, bx), max(ax, bx))
+        else:
+            rL = r * math.sqrt(L2)
+            p0, p1 = sorted((ax + (yy * dx - rL) / dy, ax + (yy * dx + rL) / dy))
+            if dx == 0:
+                if 0 <= yy * dy <= L2: band = (p0, p1)
+            else:
+                q0, q1 = sorted((ax - yy * dy / dx, ax + (L2 - yy * dy) / dx))
+                if max(p0, q0) <= min(p1, q1): band = (max(p0, q0), min(p1, q1))
+        if band:
+            lo, hi = min(lo, band[0]), max(hi, band[1])
+    return (lo, hi) if lo <= hi else None
+
+def point_seg_dist(p, a, b):
+    """-> (distance from p to segment ab, t of the closest point along it)"""
+    px, py = p; ax, ay = a; bx, by = b
+    abx, aby = bx - ax, by - ay
+    apx, apy = px - ax, py - ay
+    ab2 = abx*abx + aby*aby
+    if ab2 == 0: return dist(p, a), 0.0
+    t = (apx*abx + apy*aby) / ab2
+    t = max(0.0, min(1.0, t))
+    cx, cy = ax + t*abx, ay + t*aby
+    return dist(p, (cx, cy)), t
+
+
+class Polyline:
+    """
+    Open polyline with its segment lengths worked out once, so the nearest
+    point query doesn't re-measure the whole path for every sample.
+    """
+    def __init__(self, pts):
+        self.pts = [tuple(p) for p in pts]
+        self.lens = [dist(a, b) for a, b in zip(self.pts, self.pts[1:])]
+        self.starts = []   # arc length at the start of each segment
+        walked = 0.0
+        for L in self.lens:
+            self.starts.append(walked)
+            walked += L
+        self.total = walked
+        self._arrays = None
+
+    def nearest(self, p):
+        """-> (progress 0..1 along the path, distance) of the closest point to p."""
+        if self.total <= 0: return 0.0, 1e9
+        pts, lens = self.pts, self.lens
+        best_d = 1e9
+        best_prog = 0.0
+        for i in range(len(lens)):
+            d, t = point_seg_dist(p, pts[i], pts[i+1])
+            if d < best_d:
+                best_d = d
+                best_prog = (self.starts[i] + t*lens[i]) / self.total
+        return best_prog, best_d
+
+    def nearest_many(self, points):
+        """Batched nearest(): -> (progress array, distance array), one entry per point."""
+        if np is None:
+            found = [self.nearest(p) for p in points]
+            return [f[0] for f in found], [f[1] for f in found]
+        if self.total <= 0:
+            n = len(points)
+            return np.zeros(n), np.full(n, 1e9)
+        if self._arrays is None:
+            a = np.asarray(self.pts[:-1], dtype=float)
+            ab = np.asarray(self.pts[1:], dtype=float) - a
+            ab2 = (ab * ab).sum(axis=1)
+            self._arrays = a, ab, np.where(ab2 == 0, 1.0, ab2), np.asarray(self.lens), np.asarray(self.starts)
+        a, ab, ab2, lens, starts = self._arrays
+        p = _points(points)
+        ap = p[:, None, :] - a[None, :, :]                        # (N, S, 2)
+        t = np.clip((ap * ab).sum(axis=2) / ab2, 0.0, 1.0)       # (N, S)
+        d = np.hypot(ap[..., 0] - t * ab[:, 0], ap[..., 1] - t * ab[:, 1])
+        best = d.argmin(axis=1)
+        rows = np.arange(len(p))
+        prog = (starts[best] + t[rows, best] * lens[best]) / self.total
+        return prog, d[rows, best]
+
+
+class PathTracker(Polyline):
+    """
+    Polyline for something that follows it, like the iron. nearest() gives the
+    same answer as Polyline.nearest without scanning every segment: it checks
+    a window of segments around the last match first (a dragged pointer is
+    nearly always still there), then asks a uniform grid of segment ids
+    whether anything closer exists elsewhere, ring by ring outward from p,
+    stopping once the rings are farther away than the best match. The same
+    grid is what finds the path again after a jump.
+    """
+    def __init__(self, pts, window=TRACK_WINDOW, cell=None):
+        super().__init__(pts)
+        n = len(self.lens)
+        self.window = window
+        self.last = 0
+        self.memo = None   # (p, result) of the last query; an idle pointer asks the same thing every frame
+        # Per segment: start point and direction, so the hot loop is plain float math
+        self.ax = [a[0] for a in self.pts[:-1]]
+        self.ay = [a[1] for a in self.pts[:-1]]
+        self.dx = [b[0] - a[0] for a, b in zip(self.pts, self.pts[1:])]
+        self.dy = [b[1] - a[1] for a, b in zip(self.pts, self.pts[1:])]
+        self.d2 = [dx * dx + dy * dy for dx, dy in zip(self.dx, self.dy)]
+
+        self.cell = cell or max(1.0, TRACK_CELL * self.total / max(1, n))
+        self.grid = {}   # (cx, cy) -> ids of the segments whose bounding box touches that cell
+        c = self.cell
+        for i, (a, b) in enumerate(zip(self.pts, self.pts[1:])):
+            for x in range(int(min(a[0], b[0]) // c), int(max(a[0], b[0]) // c) + 1):
+                for y in range(int(min(a[1], b[1]) // c), int(max(a[1], b[1]) // c) + 1):
+                    self.grid.setdefault((x, y), []).append(i)
+        keys = self.grid.keys()
+        self.cells = (min(k[0] for k in keys), min(k[1] for k in keys),
+                      max(k[0] for k in keys), max(k[1] for k in keys)) if keys else (0, 0, -1, -1)
+
+    def nearest(self, p):
+        """-> (progress 0..1 along the path, distance) of the closest point to p, like Polyline.nearest."""
+        if self.total <= 0: return 0.0, 1e9
+        memo = self.memo
+        if memo is not None and memo[0] == p:
+            return memo[1]
+        px, py = p
+        ax, ay, dx, dy, d2 = self.ax, self.ay, self.dx, self.dy, self.d2
+
+        def check(i, best):
+            t = ((px - ax[i]) * dx[i] + (py - ay[i]) * dy[i]) / d2[i] if d2[i] else 0.0
+            t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+            ex, ey = px - ax[i] - t * dx[i], py - ay[i] - t * dy[i]
+            e = ex * ex + ey * ey
+            return (e, i, t) if e < best[0] or (e == best[0] and i < best[1]) else best
+
+        lo = max(0, self.last - self.window)
+        hi = min(len(d2) - 1, self.last + self.window)
+        best = (math.inf, 0, 0.0)
+        for i in range(lo, hi + 1):
+            best = check(i, best)
+
+        c, grid = self.cell, self.grid
+        n = len(d2)
+        if best[0] > (2 * c) ** 2:
+            # Lost track (a jump, or the first query): every TRACK_CELL-th vertex gives a close upper bound
+            for j in range(0, n + 1, TRACK_CELL):
+                vx, vy = (ax[j], ay[j]) if j < n else self.pts[-1]
+                e = (px - vx) * (px - vx) + (py - vy) * (py - vy)
+                if e < best[0]:
+                    best = (e, j, 0.0) if j < n else (e, n - 1, 1.0)
+
+        def scan(x, y, best):
+            ids = grid.get((x, y))
+            if ids:
+                # Skip cells that can't hold anything closer than the best so far
+                ex = max(x * c - px, 0.0, px - (x + 1) * c)
+                ey = max(y * c - py, 0.0, py - (y + 1) * c)
+                if ex * ex + ey * ey <= best[0]:
+                    for i in ids:
+                        if i < lo or i > hi:
+                            best = check(i, best)
+            return best
+
+        reach = int(math.sqrt(best[0]) // c) + 2
+        if (2 * reach + 1) ** 2 > len(grid):
+            # The rings would visit more cells than the path occupies
+            for x, y in grid:
+                best = scan(x, y, best)
+        else:
+            gx0, gy0, gx1, gy1 = self.cells
+            cx, cy = int(px // c), int(py // c)
+            k = 0
+            while k <= 1 or ((k - 1) * c) ** 2 < best[0]:
+                if cx - k < gx0 and cx + k > gx1 and cy - k < gy0 and cy + k > gy1:
+                    break   # the ring is past the grid on every side
+                for x, y in _ring(cx, cy, k, self.cells):
+                    best = scan(x, y, best)
+                k += 1
+
+        e, i, t = best
+        self.last = i
+        found = (self.starts[i] + t * self.lens[i]) / self.total, math.sqrt(e)
+        self.memo = (p, found)
+        return found
+
+
+def _ring(cx, cy, k, cells):
+    """Grid cells exactly k steps (Chebyshev) from (cx, cy), clipped to cells = (x0, y0, x1, y1)."""
+    x0, y0, x1, y1 = cells
+    if k == 0:
+        if x0 <= cx <= x1 and y0 <= cy <= y1:
+            yield cx, cy
+        return
+    for y in (cy - k, cy + k):
+        if y0 <= y <= y1:
+            for x in range(max(cx - k, x0), min(cx + k, x1) + 1):
+                yield x, y
+    for x in (cx - k, cx + k):
+        if x0 <= x <= x1:
+            for y in range(max(cy - k + 1, y0), min(cy + k - 1, y1) + 1):
+                yield x, y
+
+
+def smooth_path(pts, spacing=2.0):
+    """Catmull-Rom spline through pts, sampled about every `spacing` px (ends and control points kept)."""
+    if len(pts) < 3:
+        return [tuple(p) for p in pts]
+    ctrl = [pts[0]] + list(pts) + [pts[-1]]
+    out = [tuple(pts[0])]
+    for i in range(1, len(ctrl) - 2):
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = ctrl[i - 1], ctrl[i], ctrl[i + 1], ctrl[i + 2]
+        n = max(1, int(math.ceil(dist(ctrl[i], ctrl[i + 1]) / spacing)))
+        for j in range(1, n + 1):
+            t = j / n
+            t2, t3 = t * t, t * t * t
+            out.append((0.5 * (2 * x1 + (x2 - x0) * t + (2 * x0 - 5 * x1 + 4 * x2 - x3) * t2 + (3 * x1 - x0 - 3 * x2 + x3) * t3),
+                        0.5 * (2 * y1 + (y2 - y0) * t + (2 * y0 - 5 * y1 + 4 * y2 - y3) * t2 + (3 * y1 - y0 - 3 * y2 + y3) * t3)))
+    return out
+
+
+def nearest_progress(p, pts):
+    """-> (progress, distance) for p against the polyline pts. Keep a Polyline for repeated queries."""
+    return Polyline(pts).nearest(p)
+
+
+# --- BATCHED ---
+def _points(points):
+    return np.asarray(points, dtype=float).reshape(-1, 2)
+
+def _rects(rects):
+    return np.asarray([tuple(r) for r in rects], dtype=float).reshape(-1, 4)
+
+def points_in_circles(points, centers, radii):
+    """(N, M) bool: point i lies inside (or on) circle j."""
+    if np is None:
+        return [[in_circle(p, c, r) for c, r in zip(centers, radii)] for p in points]
+    p, c = _points(points), _points(centers)
+    r = np.asarray(radii, dtype=float)
+    d = p[:, None, :] - c[None, :, :]
+    return (d * d).sum(axis=2) <= r * r
+
+def points_in_rects(points, rects):
+    """(N, M) bool: rect j collidepoint()s point i."""
+    if np is None:
+        return [[x <= p[0] < x + w and y <= p[1] < y + h for x, y, w, h in map(tuple, rects)] for p in points]
+    p, r = _points(points), _rects(rects)
+    px, py = p[:, 0:1], p[:, 1:2]
+    x, y, w, h = r.T
+    return (px >= x) & (px < x + w) & (py >= y) & (py < y + h)
+
+def circles_hit_rects(centers, radii, rects):
+    """(N, M) bool: circle i touches rect j (same test as circle_rect_hit)."""
+    if np is None:
+        import pygame
+        rects = [pygame.Rect(r) for r in rects]
+        return [[circle_rect_hit(c[0], c[1], rad, r)[0] for r in rects] for c, rad in zip(centers, radii)]
+    c, r = _points(centers), _rects(rects)
+    rad = np.asarray(radii, dtype=float)[:, None]
+    cx, cy = c[:, 0:1], c[:, 1:2]
+    x, y, w, h = r.T
+    dx = cx - np.clip(cx, x, x + w)
+    dy = cy - np.clip(cy, y, y + h)
+    return dx*dx + dy*dy <= rad * rad
+
+def points_in_annuli(points, centers, radii, half_widths):
+    """(N, M) bool: point i is within half_widths[j] of circle j's outline."""
+    if np is None:
+        return [[in_annulus(p, c, r, hw) for c, r, hw in zip(centers, radii, half_widths)] for p in points]
+    p, c = _points(points), _points(centers)
+    d = np.hypot(p[:, None, 0] - c[None, :, 0], p[:, None, 1] - c[None, :, 1])
+    return np.abs(d - np.asarray(radii, dtype=float)) <= np.asarray(half_widths, dtype=float)
+
+def sweep_intervals(starts, moves, rect):
+    """
+    sweep_interval for N moving points at once against one rect.
+    -> (t_in, t_out) arrays; a point misses where t_in > t_out.
+    """
+    if np is None:
+        found = [sweep_interval(p[0], p[1], m[0], m[1], rect) for p, m in zip(starts, moves)]
+        return [f[0] if f else 1.0 for f in found], [f[1] if f else 0.0 for f in found]
+    p, m = _points(starts), _points(moves)
+    lo = np.array([rect[0], rect[1]], dtype=float)
+    hi = lo + (rect[2], rect[3])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a, b = (lo - p) / m, (hi - p) / m
+    # Not moving on an axis: inside the slab for all t, or for none
+    still = m == 0
+    inside = (p >= lo) & (p <= hi)
+    enter = np.where(still, np.where(inside, -np.inf, np.inf), np.minimum(a, b))
+    leave = np.where(still, np.where(inside, np.inf, -np.inf), np.maximum(a, b))
+    return np.maximum(enter.max(axis=1), 0.0), np.minimum(leave.min(axis=1), 1.0)
+
+def points_polyline(points, pts):
+    """-> (progress, distance) arrays for many points against one polyline."""
+    return Polyline(pts).nearest_many(points)
+
+def parabola_points(start, vel, accel, times):
+    """Positions at each of `times` under constant acceleration (start + v*t + a*t^2/2), as (x, y) rows."""
+    if np is None:
+        return [(start[0] + vel[0]*t + 0.5*accel[0]*t*t, start[1] + vel[1]*t + 0.5*accel[1]*t*t) for t in times]
+    t = np.asarray(times, dtype=float)[:, None]
+    return (np.asarray(start, dtype=float) + np.asarray(vel, dtype=float) * t
+            + 0.5 * np.asarray(accel, dtype=float) * t * t).tolist()
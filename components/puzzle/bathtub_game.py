@@ -1,239 +1,464 @@
-import pygame, sys, math, os
-
-def duck_bathtub_game(sprite_path, max_shots=12):
-    W, H, FPS = 1000, 650, 60
-
-    def clamp(v,a,b): return max(a, min(b, v))
-    def vlen(v): return math.hypot(v[0], v[1])
-    def vsub(a,b): return (a[0]-b[0], a[1]-b[1])
-    def vmul(v,k): return (v[0]*k, v[1]*k)
-    def vnorm(v):
-        L=vlen(v)
-        return (0,0) if L==0 else (v[0]/L, v[1]/L)
-
-    def circle_rect_hit(cx, cy, r, rect):
-        px = clamp(cx, rect.left, rect.right)
-        py = clamp(cy, rect.top, rect.bottom)
-        dx, dy = cx - px, cy - py
-        return (dx*dx + dy*dy) <= r*r, (px, py), (dx, dy)
-
-    class Duck:
-        def __init__(self, pos, r=22):
-            self.r = r
-            self.reset(pos)
-
-        def reset(self, pos):
-            self.pos = [float(pos[0]), float(pos[1])]
-            self.vel = [0.0, 0.0]
-            self.launched = False
-            self.sleep = 0
-
-        @property
-        def rect(self):
-            return pygame.Rect(int(self.pos[0]-self.r), int(self.pos[1]-self.r), self.r*2, self.r*2)
-
-        def launch(self, vel):
-            self.vel[0], self.vel[1] = vel
-            self.launched = True
-            self.sleep = 0
-
-        def step(self, dt, gravity, solids, bounds):
-            # integrate
-            self.vel[1] += gravity * dt
-            self.pos[0] += self.vel[0] * dt
-            self.pos[1] += self.vel[1] * dt
-
-            left, top, right, bottom = bounds
-            rest, fric = 0.50, 0.94
-
-            # screen bounds
-            if self.pos[0] < left + self.r:
-                self.pos[0] = left + self.r
-                self.vel[0] *= -rest
-                self.vel[1] *= fric
-            if self.pos[0] > right - self.r:
-                self.pos[0] = right - self.r
-                self.vel[0] *= -rest
-                self.vel[1] *= fric
-            if self.pos[1] < top + self.r:
-                self.pos[1] = top + self.r
-                self.vel[1] *= -rest
-                self.vel[0] *= fric
-            if self.pos[1] > bottom - self.r:
-                self.pos[1] = bottom - self.r
-                self.vel[1] *= -rest
-                self.vel[0] *= fric
-
-            # tub collisions
-            for s in solids:
-                hit, closest, dxy = circle_rect_hit(self.pos[0], self.pos[1], self.r, s["rect"])
-                if not hit:
-                    continue
-
-                dx, dy = dxy
-                if dx == 0 and s["rect"].left < self.pos[0] < s["rect"].right: dx = 1e-6
-                if dy == 0 and s["rect"].top < self.pos[1] < s["rect"].bottom: dy = 1e-6
-
-                rest = s.get("rest", 0.55)
-                fric = s.get("fric", 0.94)
-
-                if abs(dx) > abs(dy):
-                    self.pos[0] = closest[0] - self.r if self.pos[0] < closest[0] else closest[0] + self.r
-                    self.vel[0] *= -rest
-                    self.vel[1] *= fric
-                else:
-                    self.pos[1] = closest[1] - self.r if self.pos[1] < closest[1] else closest[1] + self.r
-                    self.vel[1] *= -rest
-                    self.vel[0] *= fric
-
-            # settle detection (reset after shot ends)
-            if abs(self.vel[0]) < 35 and abs(self.vel[1]) < 35:
-                self.sleep += 1
-            else:
-                self.sleep = 0
-
-        def update(self, dt, gravity, solids, bounds):
-            if not self.launched:
-                return
-            # Substeps = smoother motion + stable collisions
-            substeps = 3
-            step_dt = dt / substeps
-            for _ in range(substeps):
-                self.step(step_dt, gravity, solids, bounds)
-
-        def draw(self, surf):
-            x, y = int(self.pos[0]), int(self.pos[1])
-            pygame.draw.circle(surf, (255,210,70), (x,y), self.r)
-            pygame.draw.circle(surf, (255,230,120), (x-self.r//4,y-self.r//4), self.r//2)
-            pygame.draw.circle(surf, (245,155,70), (x+self.r-6,y+4), max(6,self.r//4))
-            pygame.draw.circle(surf, (70,80,95), (x-self.r//6,y-self.r//6), max(3,self.r//8))
-
-    pygame.init()
-    screen = pygame.display.set_mode((W, H))
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont("arial", 22)
-
-    # If you want to force local assets folder, uncomment:
-    # BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    # sprite_path = os.path.join(BASE_DIR, "assets", "bathtub.png")
-
-    tub_img = pygame.image.load(sprite_path).convert_alpha()
-    tub_img = pygame.transform.smoothscale(tub_img, (520, 340))
-    tub_rect = tub_img.get_rect(center=(W - 280, H//2 + 10))
-
-    # Static hitboxes (tuned for this sprite size)
-    rim = pygame.Rect(tub_rect.x + 70,  tub_rect.y + 82,  tub_rect.w - 140, 18)
-    left_wall = pygame.Rect(tub_rect.x + 70,  tub_rect.y + 90,  22, tub_rect.h - 130)
-    right_wall = pygame.Rect(tub_rect.right - 92, tub_rect.y + 90, 22, tub_rect.h - 130)
-    bottom_lip = pygame.Rect(tub_rect.x + 95,  tub_rect.bottom - 105, tub_rect.w - 190, 22)
-    solids = [
-        {"rect": rim, "rest": 0.62, "fric": 0.95},
-        {"rect": left_wall, "rest": 0.50, "fric": 0.92},
-        {"rect": right_wall, "rest": 0.50, "fric": 0.92},
-        {"rect": bottom_lip, "rest": 0.30, "fric": 0.90},
-    ]
-
-    # WATER SENSOR (touch = instant win)
-    water = pygame.Rect(tub_rect.x + 120, tub_rect.y + 130, tub_rect.w - 240, tub_rect.h - 210)
-
-    duck_start = (160, H - 140)
-    duck = Duck(duck_start, r=22)
-
-    # Smoother + slower
-    gravity = 1100.0     # was 1800
-    sling_max = 220      # was 260 (limits extreme shots)
-    power = 4.8          # was 7.0 (slower throw)
-
-    dragging = False
-    drag_start = (0,0)
-    drag_now = (0,0)
-
-    shots = 0
-    bounds = (0, 0, W, H)
-
-    preview_steps = 28
-    preview_dt = 0.07    # slightly slower preview for readability
-
-    won = False
-
-    while True:
-        dt = clock.tick(FPS) / 1000.0
-
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    pygame.quit(); return won
-                if e.key == pygame.K_r:
-                    shots = 0
-                    won = False
-                    duck.reset(duck_start)
-
-            if won:
+import pygame, math, sys, os
+from collections import OrderedDict
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general.assets import get_assets
+from general import sdf
+from components.geometry import clamp, vlen, vsub, vmul, vnorm, circle_rect_hit, sweep_circle_rect, parabola_points
+
+W, H, FPS = 1000, 650, 60
+TUB_SIZE = (520, 340)
+TUB_CENTER = (W - 280, H//2 + 10)
+DUCK_START = (160, H - 140)
+DUCK_RADIUS = 22
+
+# Smoother + slower
+GRAVITY = 1100.0     # was 1800
+SLING_MAX = 220      # was 260 (limits extreme shots)
+POWER = 4.8          # was 7.0 (slower throw)
+MIN_PULL = 10        # shorter pulls don't fire
+
+WATER_COLOR = (150, 117, 160)   # sprite pixels that make up the water sensor
+
+# --- DUCK PHYSICS ---
+EDGE_REST, EDGE_FRIC = 0.50, 0.94   # screen edges
+MAX_CONTACTS = 8      # per step; time left after that many bounces is dropped
+SKIN = 0.01           # px left between the duck and a surface after a bounce
+LAND_SPEED = 30       # px/s; slower bounces off a supporting surface become resting contact
+SETTLE_SPEED = 35     # px/s on both axes
+SETTLE_TIME = 1 / 6   # s below SETTLE_SPEED before the shot is over
+
+# --- TRAJECTORY PREVIEW ---
+PREVIEW_QUANT = 4         # px of pull per cache bucket
+PREVIEW_BOUNCES = 6       # contacts the preview follows before it stops
+PREVIEW_CACHE_SIZE = 256
+DOT_RADIUS = 4
+DOT_COLOR = (120, 170, 255)
+
+def edge_hit(x, y, dx, dy, r, bounds):
+    """Earliest screen edge the duck reaches during this move -> (f, nx, ny) or None."""
+    left, top, right, bottom = bounds
+    hit = None
+    if dx < 0 and x + dx < left + r:
+        hit = (max((left + r - x) / dx, 0.0), 1.0, 0.0)
+    elif dx > 0 and x + dx > right - r:
+        hit = (max((right - r - x) / dx, 0.0), -1.0, 0.0)
+    if dy < 0 and y + dy < top + r:
+        f = max((top + r - y) / dy, 0.0)
+        if hit is None or f < hit[0]: hit = (f, 0.0, 1.0)
+    elif dy > 0 and y + dy > bottom - r:
+        f = max((bottom - r - y) / dy, 0.0)
+        if hit is None or f < hit[0]: hit = (f, 0.0, -1.0)
+    return hit
+
+def shot_velocity(pull, sling_max=SLING_MAX, power=POWER):
+    """Launch velocity for a slingshot pull, or None if the pull is too short to fire."""
+    L = vlen(pull)
+    if L <= MIN_PULL:
+        return None
+    if L > sling_max:
+        pull = vmul(vnorm(pull), sling_max)
+    return (pull[0]*power, pull[1]*power)
+
+class TubRects:
+    """
+    Fallback tub shape for when there's no distance field (stale or missing
+    .sdf and no NumPy to build one): the old hand-tuned hitboxes and water
+    rect, minus the rim that sat over the water. Same place()/in_water() as
+    sdf.DistanceField.
+    """
+    def __init__(self, size=TUB_SIZE):
+        self.w, self.h = size
+        self.place((0, 0))
+
+    def place(self, topleft):
+        x, y = topleft
+        w, h = self.w, self.h
+        self.solids = [
+            {"rect": pygame.Rect(x + 70, y + 90, 22, h - 130), "rest": 0.50, "fric": 0.92},      # left wall
+            {"rect": pygame.Rect(x + w - 92, y + 90, 22, h - 130), "rest": 0.50, "fric": 0.92},  # right wall
+            {"rect": pygame.Rect(x + 95, y + h - 105, w - 190, 22), "rest": 0.30, "fric": 0.90}, # bottom lip
+        ]
+        self.water = pygame.Rect(x + 120, y + 130, w - 240, h - 210)
+
+    def in_water(self, x, y):
+        return self.water.collidepoint(int(x), int(y))
+
+def tub_solids(field):
+    """The `solids` list Duck.update takes, for a placed field or TubRects."""
+    if isinstance(field, TubRects):
+        return field.solids
+    return [{"field": field, "rest": 0.50, "fric": 0.92}]
+
+def sweep_solid(s, x, y, dx, dy, r):
+    """Contact with one entry of `solids`: a hitbox rect or a distance field."""
+    if "field" in s:
+        return s["field"].sweep(x, y, dx, dy, r)
+    return sweep_circle_rect(x, y, dx, dy, r, s["rect"])
+
+def first_contact(x, y, dx, dy, r, solids, bounds):
+    """Time of impact of the duck moving by (dx, dy) -> ((f, nx, ny), rest, fric) of the first surface it meets, or None."""
+    hit = edge_hit(x, y, dx, dy, r, bounds)
+    rest, fric = EDGE_REST, EDGE_FRIC
+    for s in solids:
+        c = sweep_solid(s, x, y, dx, dy, r)
+        if c is not None and (hit is None or c[0] < hit[0]):
+            hit = c
+            rest, fric = s.get("rest", 0.55), s.get("fric", 0.94)
+    return None if hit is None else (hit, rest, fric)
+
+def bounce(vx, vy, nx, ny, rest, fric, gx, gy):
+    """
+    Velocity after meeting a surface with normal (nx, ny): restitution along
+    the normal, friction along the surface. -> (vx, vy, landed); landed means
+    the bounce was too slow to leave a supporting surface, so it became
+    resting contact.
+    """
+    vn = vx*nx + vy*ny
+    if vn >= 0:
+        return vx, vy, False
+    tx, ty = vx - vn*nx, vy - vn*ny
+    if -rest*vn < LAND_SPEED and gx*nx + gy*ny < 0:
+        return tx*fric, ty*fric, True
+    return tx*fric - rest*vn*nx, ty*fric - rest*vn*ny, False
+
+class Duck:
+    def __init__(self, pos, r=22):
+        self.r = r
+        self.reset(pos)
+
+    def reset(self, pos):
+        self.pos = [float(pos[0]), float(pos[1])]
+        self.prev = list(self.pos)
+        self.vel = [0.0, 0.0]
+        self.launched = False
+        self.resting = 0.0   # s spent below SETTLE_SPEED
+        self.contacts = 0    # bounces resolved in the last update
+        self.overlaps = 0    # times a push-out was needed (should stay 0)
+
+    @property
+    def rect(self):
+        return pygame.Rect(int(self.pos[0]-self.r), int(self.pos[1]-self.r), self.r*2, self.r*2)
+
+    def launch(self, vel):
+        self.vel[0], self.vel[1] = vel
+        self.launched = True
+        self.resting = 0.0
+
+    def push_out(self, solids, bounds):
+        """Safety net: separates the duck from anything it already overlaps."""
+        left, top, right, bottom = bounds
+        r = self.r
+        self.pos[0] = clamp(self.pos[0], left + r, right - r)
+        self.pos[1] = clamp(self.pos[1], top + r, bottom - r)
+        for s in solids:
+            if "field" in s:
+                hit = s["field"].overlap(self.pos[0], self.pos[1], r)
+                if hit is not None:
+                    depth, nx, ny = hit
+                    self.pos[0] += nx * (depth + SKIN)
+                    self.pos[1] += ny * (depth + SKIN)
+                    self.overlaps += 1
                 continue
-
-            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-                if (not duck.launched) and duck.rect.collidepoint(e.pos) and shots < max_shots:
-                    dragging = True
-                    drag_start = e.pos
-                    drag_now = e.pos
-
-            if e.type == pygame.MOUSEMOTION and dragging:
-                drag_now = e.pos
-
-            if e.type == pygame.MOUSEBUTTONUP and e.button == 1 and dragging:
-                dragging = False
-                pull = vsub(drag_start, drag_now)  # pull back to shoot forward
-                L = vlen(pull)
-                if L > 10:
-                    if L > sling_max:
-                        pull = vmul(vnorm(pull), sling_max)
-                    duck.launch((pull[0]*power, pull[1]*power))
-                    shots += 1
-
-        if not won:
-            duck.update(dt, gravity, solids, bounds)
-
-            # INSTANT WIN: duck touches water region
-            if duck.launched and water.collidepoint(int(duck.pos[0]), int(duck.pos[1])):
-                won = True
-
-            # reset duck after it settles (if not won)
-            if duck.launched and duck.sleep > 30 and not won:
-                duck.reset(duck_start)
-
-        # draw
+            hit, closest, (dx, dy) = circle_rect_hit(self.pos[0], self.pos[1], r, s["rect"])
+            if not hit:
+                continue
+            self.overlaps += 1
+            if abs(dx) > abs(dy):
+                self.pos[0] = closest[0] - r - SKIN if self.pos[0] < closest[0] else closest[0] + r + SKIN
+            else:
+                self.pos[1] = closest[1] - r - SKIN if self.pos[1] < closest[1] else closest[1] + r + SKIN
+
+    def update(self, dt, gravity, solids, bounds):
+        """
+        Swept motion: each move is tested against every surface for the time of
+        impact, the duck bounces there and carries on with the time left, so
+        nothing is skipped however fast it goes. Between contacts the move is
+        the exact chord of the parabola (v*t + g*t^2/2).
+        """
+        self.prev = list(self.pos)
+        if not self.launched:
+            return
+        self.push_out(solids, bounds)
+        step = dt
+
+        r = self.r
+        x, y = self.pos
+        vx, vy = self.vel
+        gx, gy = 0.0, gravity
+        self.contacts = 0
+        while dt > 0:
+            dx, dy = vx*dt + 0.5*gx*dt*dt, vy*dt + 0.5*gy*dt*dt
+            contact = first_contact(x, y, dx, dy, r, solids, bounds)
+            if contact is None:
+                x, y = x + dx, y + dy
+                vx, vy = vx + gx*dt, vy + gy*dt
+                break
+
+            (f, nx, ny), rest, fric = contact
+            t = dt * f
+            x, y = x + dx*f + nx*SKIN, y + dy*f + ny*SKIN
+            vx, vy, landed = bounce(vx + gx*t, vy + gy*t, nx, ny, rest, fric, gx, gy)
+            if landed:
+                # Resting on it: drop the part of gravity pushing into it
+                gn = gx*nx + gy*ny
+                gx, gy = gx - gn*nx, gy - gn*ny
+            dt -= t
+            self.contacts += 1
+            if self.contacts >= MAX_CONTACTS:
+                break
+        self.pos[0], self.pos[1] = x, y
+        self.vel[0], self.vel[1] = vx, vy
+
+        # settle detection (reset after shot ends)
+        if abs(vx) < SETTLE_SPEED and abs(vy) < SETTLE_SPEED:
+            self.resting += step
+        else:
+            self.resting = 0.0
+
+    def draw(self, surf, alpha=1.0):
+        # Drawn between the last two physics steps
+        x = int(self.prev[0] + (self.pos[0] - self.prev[0]) * alpha)
+        y = int(self.prev[1] + (self.pos[1] - self.prev[1]) * alpha)
+        pygame.draw.circle(surf, (255,210,70), (x,y), self.r)
+        pygame.draw.circle(surf, (255,230,120), (x-self.r//4,y-self.r//4), self.r//2)
+        pygame.draw.circle(surf, (245,155,70), (x+self.r-6,y+4), max(6,self.r//4))
+        pygame.draw.circle(surf, (70,80,95), (x-self.r//6,y-self.r//6), max(3,self.r//8))
+
+def arc_contact(x0, y0, vx, vy, gravity, t0, ta, tb, step, r, solids, bounds, field):
+    """
+    Sweeps the arc launched from (x0, y0) with (vx, vy) at time t0, from ta
+    to tb, in chords ending on the same `step` grid Duck.update moves by, so
+    a contact comes out where the real duck would meet it.
+    -> (contact, tc) for the first contact at time tc, (None, tc) if the duck
+    is in the water at tc, or None.
+    """
+    s = ta - t0
+    ax, ay = x0 + vx*s, y0 + vy*s + 0.5*gravity*s*s
+    while ta < tb:
+        tn = min(tb, (math.floor(ta / step + 1e-9) + 1) * step)
+        s = tn - t0
+        bx, by = x0 + vx*s, y0 + vy*s + 0.5*gravity*s*s
+        contact = first_contact(ax, ay, bx - ax, by - ay, r, solids, bounds)
+        if contact is not None:
+            return contact, ta + (tn - ta) * contact[0][0]
+        if field.in_water(bx, by):
+            return None, tn
+        ta, ax, ay = tn, bx, by
+    return None
+
+def flight_path(duck, vel, gravity, solids, bounds, field, dt, steps, step):
+    """
+    Where a duck launched from its current spot with `vel` will be every `dt`
+    seconds, for up to `steps` dots. Between contacts the flight is the
+    closed-form parabola, evaluated for all the remaining dot times at once.
+    Only the stretches that come near a surface are swept (arc_contact, with
+    the same time of impact and bounce response as Duck.update), and the arc
+    restarts from each contact, so the work grows with the bounces rather
+    than the flight time. Stops where the duck would land in the water or
+    come to rest on a surface, or after PREVIEW_BOUNCES contacts.
+    """
+    r = duck.r
+    # Chords that stay inside the screen edges and clear of every solid's box can't touch
+    # anything, nor reach the water, which lies inside the tub
+    boxes = [s["field"].rect if "field" in s else s["rect"] for s in solids]
+    near = boxes[0].unionall(boxes[1:]).inflate(2*r + 2, 2*r + 2) if boxes else pygame.Rect(0, 0, 0, 0)
+    left, top, right, bottom = bounds[0] + r, bounds[1] + r, bounds[2] - r, bounds[3] - r
+
+    x0, y0 = duck.pos
+    vx, vy = vel
+    t0 = t = 0.0      # when the current arc started, and how far the flight has been checked
+    px, py = x0, y0   # where the duck is at t
+    path = []
+    for _ in range(PREVIEW_BOUNCES + 1):
+        times = [(k + 1) * dt for k in range(len(path), steps)]
+        for (x, y), tb in zip(parabola_points((x0, y0), (vx, vy), (0.0, gravity), [tk - t0 for tk in times]), times):
+            if not (left <= x <= right and top <= y <= bottom
+                    and (max(px, x) < near.left or min(px, x) > near.right
+                         or max(py, y) < near.top or min(py, y) > near.bottom)):
+                found = arc_contact(x0, y0, vx, vy, gravity, t0, t, tb, step, r, solids, bounds, field)
+                if found is not None:
+                    break
+            path.append((x, y))
+            t, px, py = tb, x, y
+        else:
+            return path
+
+        contact, tc = found
+        s = tc - t0
+        if contact is None:
+            # In the water part way to the next dot
+            path.append((x0 + vx*s, y0 + vy*s + 0.5*gravity*s*s))
+            return path
+
+        # Restart the arc from the contact with the velocity it leaves with
+        (f, nx, ny), rest, fric = contact
+        cx, cy = x0 + vx*s, y0 + vy*s + 0.5*gravity*s*s
+        x0, y0 = cx + nx*SKIN, cy + ny*SKIN
+        vx, vy, landed = bounce(vx, vy + gravity*s, nx, ny, rest, fric, 0.0, gravity)
+        t0 = t = tc
+        px, py = x0, y0
+        if landed:
+            path.append((x0, y0))
+            return path
+    return path
+
+class BathtubGame(Scene):
+    size = (W, H)
+    fps = FPS
+
+    @classmethod
+    def preload(cls, sprite_path, max_shots=12):
+        get_assets().request(sprite_path, TUB_SIZE, smooth=True)
+        cls.request_field(sprite_path)
+
+    @classmethod
+    def request_field(cls, sprite_path):
+        """load_field() on the asset pool, so a rebuild never stalls the frame that opens the room."""
+        return get_assets().submit(("tub field", os.path.abspath(sprite_path)), cls.load_field, sprite_path)
+
+    @staticmethod
+    def load_field(sprite_path):
+        """Collision field + water sensor for the tub, from the sprite's alpha (the checked-in .sdf next to it)."""
+        try:
+            return sdf.load(sprite_path, TUB_SIZE, smooth=True, water=WATER_COLOR, open_above=True, save=False)
+        except ImportError:
+            print("Warning: bathtub.png.sdf is out of date and NumPy is missing; using the tub hitboxes.")
+            return TubRects()
+
+    def __init__(self, screen, sprite_path, max_shots=12):
+        self.screen = screen
+        self.max_shots = max_shots
+        self.font = get_font("arial", 22)
+
+        # If you want to force local assets folder, uncomment:
+        # BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+        # sprite_path = os.path.join(BASE_DIR, "assets", "bathtub.png")
+
+        self.tub_img = get_assets().get(sprite_path, TUB_SIZE, smooth=True)
+        tub_rect = self.tub_rect = self.tub_img.get_rect(center=TUB_CENTER)
+
+        # Tub shape and WATER SENSOR (touch = instant win) both come from the sprite
+        self.field = self.request_field(sprite_path).result()
+        self.field.place(tub_rect.topleft)
+        self.solids = tub_solids(self.field)
+
+        self.duck_start = DUCK_START
+        self.duck = Duck(self.duck_start, r=DUCK_RADIUS)
+
+        self.gravity = GRAVITY
+        self.sling_max = SLING_MAX
+        self.power = POWER
+
+        self.dragging = False
+        self.drag_start = (0,0)
+        self.drag_now = (0,0)
+
+        self.shots = 0
+        self.bounds = (0, 0, W, H)
+
+        self.preview_steps = 28
+        self.preview_dt = 0.07    # slightly slower preview for readability
+        self.preview_cache = OrderedDict()   # quantized pull -> blit sequence
+        self.dot = pygame.Surface((DOT_RADIUS*2 + 1, DOT_RADIUS*2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(self.dot, DOT_COLOR, (DOT_RADIUS, DOT_RADIUS), DOT_RADIUS)
+
+        self.won = False
+
+    def handle(self, e):
+        if e.type == pygame.KEYDOWN:
+            if e.key == pygame.K_ESCAPE:
+                self.finish(self.won); return
+            if e.key == pygame.K_r:
+                self.shots = 0
+                self.won = False
+                self.duck.reset(self.duck_start)
+
+        if self.won:
+            return
+
+        if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+            if (not self.duck.launched) and self.duck.rect.collidepoint(e.pos) and self.shots < self.max_shots:
+                self.dragging = True
+                self.drag_start = e.pos
+                self.drag_now = e.pos
+
+        if e.type == pygame.MOUSEMOTION and self.dragging:
+            self.drag_now = e.pos
+
+        if e.type == pygame.MOUSEBUTTONUP and e.button == 1 and self.dragging:
+            self.dragging = False
+            pull = vsub(self.drag_start, self.drag_now)  # pull back to shoot forward
+            vel = shot_velocity(pull, self.sling_max, self.power)
+            if vel is not None:
+                self.duck.launch(vel)
+                self.shots += 1
+
+    def idle(self):
+        return self.won or not self.duck.launched
+
+    def preview(self, pull):
+        """Blit sequence of the preview dots for this pull, worked out once per quantized pull."""
+        # The duck sits at its start while the player aims, so the pull alone is the key
+        key = qx, qy = round(pull[0] / PREVIEW_QUANT), round(pull[1] / PREVIEW_QUANT)
+        seq = self.preview_cache.get(key)
+        if seq is not None:
+            self.preview_cache.move_to_end(key)
+            return seq
+
+        vel = (qx * PREVIEW_QUANT * self.power, qy * PREVIEW_QUANT * self.power)
+        path = flight_path(self.duck, vel, self.gravity, self.solids, self.bounds, self.field,
+                           self.preview_dt, self.preview_steps, self.timestep)
+        seq = self.preview_cache[key] = [(self.dot, (int(x) - DOT_RADIUS, int(y) - DOT_RADIUS)) for x, y in path]
+        if len(self.preview_cache) > PREVIEW_CACHE_SIZE:
+            self.preview_cache.popitem(last=False)
+        return seq
+
+    def update(self, dt):
+        if self.won:
+            return
+        duck = self.duck
+        duck.update(dt, self.gravity, self.solids, self.bounds)
+
+        # INSTANT WIN: duck touches water region
+        if duck.launched and self.field.in_water(duck.pos[0], duck.pos[1]):
+            self.won = True
+
+        # reset duck after it settles (if not won)
+        if duck.launched and duck.resting > SETTLE_TIME and not self.won:
+            duck.reset(self.duck_start)
+
+    def draw(self):
+        screen = self.screen
         screen.fill((210, 235, 255))
-        screen.blit(tub_img, tub_rect)
+        screen.blit(self.tub_img, self.tub_rect)
 
         # trajectory preview while dragging
-        if dragging and not won:
-            pull = vsub(drag_start, drag_now)
+        if self.dragging and not self.won:
+            pull = vsub(self.drag_start, self.drag_now)
             L = vlen(pull)
             if L > 4:
-                if L > sling_max:
-                    pull = vmul(vnorm(pull), sling_max)
-                vx, vy = pull[0]*power, pull[1]*power
-                px, py = duck.pos[0], duck.pos[1]
-                pvx, pvy = vx, vy
-                for _ in range(preview_steps):
-                    pvy += gravity * preview_dt
-                    px += pvx * preview_dt
-                    py += pvy * preview_dt
-                    pygame.draw.circle(screen, (120,170,255), (int(px), int(py)), 4)
-
-        duck.draw(screen)
-
-        ui = font.render(f"Shots {shots}/{max_shots}", True, (40,55,80))
+                if L > self.sling_max:
+                    pull = vmul(vnorm(pull), self.sling_max)
+                screen.blits(self.preview(pull), doreturn=False)
+
+        self.duck.draw(screen, self.alpha)
+
+        ui = render_text(self.font, f"Shots {self.shots}/{self.max_shots}", (40,55,80))
         screen.blit(ui, (20, 18))
 
-        if won:
-            msg = font.render("WIN! Duck touched water.  (R) Restart  (ESC) Exit", True, (40,55,80))
+        if self.won:
+            msg = render_text(self.font, "WIN! Duck touched water.  (R) Restart  (ESC) Exit", (40,55,80))
             screen.blit(msg, (20, 48))
 
-        pygame.display.flip()
+def duck_bathtub_game(sprite_path, max_shots=12):
+    manager = get_manager()
+    return manager.run(BathtubGame(manager.screen, sprite_path, max_shots))
 
 if __name__ == "__main__":
     # IMPORTANT: use your real mac path or local relative path
@@ -3,11 +3,41 @@ import sys
 import os
 import random
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general import pointer
+from general.assets import get_assets
+
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 800, 1000
 FPS = 60
 
-class BookCatcher:
+def find_background():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    search_paths = [
+        os.path.join(script_dir, 'bookshelf.png'),
+        os.path.join(ROOT_DIR, 'assets', 'bookshelf.png'),
+        os.path.join(os.path.expanduser("~"), "Downloads", "bookshelf.png"),
+        os.path.join(os.path.expanduser("~"), "Desktop", "bookshelf.png")
+    ]
+    for path in search_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+class BookCatcher(Scene):
+    caption = "Library Task"
+
+    @classmethod
+    def preload(cls):
+        path = find_background()
+        if path:
+            get_assets().request(path, (WIDTH, HEIGHT), alpha=False)
+
     def __init__(self, screen):
         self.screen = screen
         self.game_cleared = False
@@ -15,21 +45,12 @@ class BookCatcher:
         self.clear_timer = 0
         
         # --- 1. THE LOADER ---
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        search_paths = [
-            os.path.join(script_dir, 'bookshelf.png'),
-            os.path.join(os.path.expanduser("~"), "Downloads", "bookshelf.png"),
-            os.path.join(os.path.expanduser("~"), "Desktop", "bookshelf.png")
-        ]
-        
         self.bg_img = None
-        for path in search_paths:
-            if os.path.exists(path):
-                try:
-                    loaded = pygame.image.load(path).convert()
-                    self.bg_img = pygame.transform.scale(loaded, (WIDTH, HEIGHT))
-                    break
-                except: continue
+        path = find_background()
+        if path:
+            try:
+                self.bg_img = get_assets().get(path, (WIDTH, HEIGHT), alpha=False)
+            except: pass
 
         # --- 2. GAME STATE ---
         self.book_h = 48 
@@ -51,25 +72,33 @@ class BookCatcher:
             (145, 70, 60), (175, 120, 75), (95, 105, 55), (110, 55, 80), (70, 50, 40)
         ]
 
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish(self.game_cleared)
+
     def spawn_book(self):
         w = random.randint(160, 240)
         x = random.randint(50, WIDTH - w - 50)
         color_idx = random.randint(0, len(self.colors)-1)
         speed = 5 + (len(self.stack) * 0.2) 
-        self.falling_book = {'x': x, 'y': -80, 'w': w, 'c': color_idx, 's': speed}
+        self.falling_book = {'x': x, 'y': -80, 'py': -80, 'w': w, 'c': color_idx, 's': speed}
+
+    def idle(self):
+        return self.show_done_overlay
 
-    def update(self):
+    def update(self, dt=0.0):
         if self.game_cleared:
-            if pygame.time.get_ticks() - self.clear_timer > 800:
+            if self.manager.ticks - self.clear_timer > 800:
                 self.show_done_overlay = True
             return
 
-        mx, _ = pygame.mouse.get_pos()
+        mx, _ = pointer.get_pos()
         self.stack_center_x = mx
 
         if not self.falling_book:
             self.spawn_book()
         else:
+            self.falling_book['py'] = self.falling_book['y']
             self.falling_book['y'] += self.falling_book['s']
             
             # Find the top of the stack
@@ -90,7 +119,7 @@ class BookCatcher:
                     
                     if top_y - self.book_h <= self.top_shelf_y:
                         self.game_cleared = True
-                        self.clear_timer = pygame.time.get_ticks()
+                        self.clear_timer = self.manager.ticks
 
             if self.falling_book and self.falling_book['y'] > HEIGHT:
                 self.falling_book = None 
@@ -126,28 +155,20 @@ class BookCatcher:
         # 4. Draw Falling Book
         if self.falling_book:
             fb = self.falling_book
-            self.draw_pixel_book(fb['x'], fb['y'], fb['w'], fb['c'])
+            self.draw_pixel_book(fb['x'], self.lerp(fb['py'], fb['y']), fb['w'], fb['c'])
 
         # 5. Victory Overlay
         if self.show_done_overlay:
             overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, 180))
             self.screen.blit(overlay, (0,0))
-            font = pygame.font.SysFont("Arial", 120, bold=True)
-            text = font.render("DONE!", True, (100, 255, 100))
+            font = get_font("Arial", 120, bold=True)
+            text = render_text(font, "DONE!", (100, 255, 100))
             self.screen.blit(text, text.get_rect(center=(WIDTH//2, HEIGHT//2)))
 
 def main():
-    pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Library Task")
-    clock = pygame.time.Clock()
-    game = BookCatcher(screen)
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-        game.update(); game.draw()
-        pygame.display.flip(); clock.tick(FPS)
+    manager = get_manager()
+    return manager.run(BookCatcher(manager.screen))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
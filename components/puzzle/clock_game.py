@@ -7,12 +7,28 @@ import random
 # --- PATH RESOLUTION ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general import pointer
+from general.dirty import DamageTracker, line_rect
+from general.assets import get_assets
+from components.geometry import dist
+
 IMAGE_PATH = os.path.join(ROOT_DIR, "assets", "clock1.png")
 
 WIDTH, HEIGHT = 800, 1000
 FPS = 60
 
-class ClockGame:
+class ClockGame(Scene):
+    dirty_rects = True
+
+    @classmethod
+    def preload(cls):
+        get_assets().request(IMAGE_PATH, width=700)
+
     def __init__(self, screen):
         self.screen = screen
         self.game_cleared = False
@@ -27,16 +43,13 @@ class ClockGame:
         
         self.active_hand = None
         self.is_dragging = False
+        self.damage_tracker = DamageTracker()
 
         self.bg_img = None
         if os.path.exists(IMAGE_PATH):
             try:
-                original = pygame.image.load(IMAGE_PATH).convert_alpha()
-                orig_w, orig_h = original.get_size()
-                new_w = 700
-                aspect_ratio = orig_h / orig_w
-                new_h = int(new_w * aspect_ratio)
-                self.bg_img = pygame.transform.scale(original, (new_w, new_h))
+                self.bg_img = get_assets().get(IMAGE_PATH, width=700)
+                new_w, new_h = self.bg_img.get_size()
                 self.img_rect = self.bg_img.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 40))
                 
                 face_y_offset = int(new_h * 0.65)
@@ -54,15 +67,33 @@ class ClockGame:
         dy = mouse_pos[1] - self.center[1]
         return (math.degrees(math.atan2(dy, dx)) + 90) % 360
 
-    def draw_hand(self, val, is_hour, length_mult, color, thickness, alpha=255):
-        surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    def hand_end(self, val, is_hour, length_mult):
         angle_deg = (val % 12 * 30) if is_hour else (val * 6)
         angle = math.radians(angle_deg - 90)
         
         end_x = self.center[0] + (self.radius * length_mult) * math.cos(angle)
         end_y = self.center[1] + (self.radius * length_mult) * math.sin(angle)
-        pygame.draw.line(surf, (*color, alpha), self.center, (end_x, end_y), thickness)
-        self.screen.blit(surf, (0, 0))
+        return end_x, end_y
+
+    def draw_hand(self, val, is_hour, length_mult, color, thickness, alpha=255):
+        end_x, end_y = self.hand_end(val, is_hour, length_mult)
+        # Translucent hands go through a surface just big enough for the hand
+        rect = line_rect(self.center, (end_x, end_y), thickness)
+        surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.line(surf, (*color, alpha), (self.center[0] - rect.x, self.center[1] - rect.y),
+                         (end_x - rect.x, end_y - rect.y), thickness)
+        self.screen.blit(surf, rect)
+
+    def idle(self):
+        return not (self.game_cleared and not self.show_done_overlay)
+
+    def damage(self):
+        items = {
+            "minute": (self.current_minute, line_rect(self.center, self.hand_end(self.current_minute, False, 0.8), 8)),
+            "hour": (self.current_hour, line_rect(self.center, self.hand_end(self.current_hour, True, 0.5), 12)),
+            "overlay": (self.show_done_overlay, self.screen.get_rect() if self.show_done_overlay else None),
+        }
+        return self.damage_tracker.diff(items)
 
     def check_win(self):
         m_diff = abs(self.current_minute - self.target_minute)
@@ -77,15 +108,48 @@ class ClockGame:
             self.current_minute = self.target_minute
             self.current_hour = h_target_pos
             self.game_cleared = True
-            self.clear_timer = pygame.time.get_ticks()
+            self.clear_timer = self.manager.ticks
+
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish(self.game_cleared); return
+        if self.game_cleared:
+            return
+
+        mouse_pos = pointer.get_pos()
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            d = dist(mouse_pos, self.center)
+            # Only start dragging if clicking inside the clock radius
+            if d < self.radius:
+                self.is_dragging = True
+                self.active_hand = 'hour' if d < self.radius * 0.4 else 'minute'
+
+        if event.type == pygame.MOUSEBUTTONUP:
+            if self.is_dragging:
+                self.is_dragging = False
+                self.active_hand = None 
+                self.check_win()
+
+        if event.type == pygame.MOUSEMOTION and self.is_dragging:
+            # ONLY update values if dragging is active
+            angle = self.get_angle_from_mouse(mouse_pos)
+            if self.active_hand == 'minute': 
+                self.current_minute = (angle / 360) * 60
+            elif self.active_hand == 'hour': 
+                self.current_hour = (angle / 360) * 12
+
+    def update(self, dt=0.0):
+        if self.game_cleared and not self.show_done_overlay:
+            if self.manager.ticks - self.clear_timer > 200:
+                self.show_done_overlay = True
 
     def draw(self):
         self.screen.fill((28, 24, 22)) 
         if self.bg_img:
             self.screen.blit(self.bg_img, self.img_rect)
         
-        font = pygame.font.SysFont("Arial", 80, bold=True)
-        goal_txt = font.render(f"SET: {self.target_hour}:{self.target_minute:02d}", True, (255, 255, 255))
+        font = get_font("Arial", 80, bold=True)
+        goal_txt = render_text(font, f"SET: {self.target_hour}:{self.target_minute:02d}", (255, 255, 255))
         self.screen.blit(goal_txt, goal_txt.get_rect(center=(WIDTH//2, 100)))
 
         # Shadows
@@ -102,51 +166,12 @@ class ClockGame:
             overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, 230))
             self.screen.blit(overlay, (0, 0))
-            done_txt = font.render("DONE!", True, (0, 255, 150))
+            done_txt = render_text(font, "DONE!", (0, 255, 150))
             self.screen.blit(done_txt, done_txt.get_rect(center=(WIDTH//2, HEIGHT//2)))
 
 def main():
-    pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    clock = pygame.time.Clock()
-    game = ClockGame(screen)
-    
-    while True:
-        mouse_pos = pygame.mouse.get_pos()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: 
-                pygame.quit()
-                sys.exit()
-            
-            if not game.game_cleared:
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    dist = math.hypot(mouse_pos[0]-game.center[0], mouse_pos[1]-game.center[1])
-                    # Only start dragging if clicking inside the clock radius
-                    if dist < game.radius:
-                        game.is_dragging = True
-                        game.active_hand = 'hour' if dist < game.radius * 0.4 else 'minute'
-
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if game.is_dragging:
-                        game.is_dragging = False
-                        game.active_hand = None 
-                        game.check_win()
-
-                if event.type == pygame.MOUSEMOTION and game.is_dragging:
-                    # ONLY update values if dragging is active
-                    angle = game.get_angle_from_mouse(mouse_pos)
-                    if game.active_hand == 'minute': 
-                        game.current_minute = (angle / 360) * 60
-                    elif game.active_hand == 'hour': 
-                        game.current_hour = (angle / 360) * 12
-
-        if game.game_cleared and not game.show_done_overlay:
-            if pygame.time.get_ticks() - game.clear_timer > 200:
-                game.show_done_overlay = True
-
-        game.draw()
-        pygame.display.flip()
-        clock.tick(FPS)
+    manager = get_manager()
+    return manager.run(ClockGame(manager.screen))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,175 +1,439 @@
 import pygame, sys, random, math, os
 
-def fly_swatter_game():
-    W, H, FPS = 1000, 650, 60
-    PLAY = pygame.Rect(70, 90, W - 140, H - 160)
-
-    MIN_FLIES, MAX_FLIES = 8, 14
-    WANDER = 140
-    MAX_SPEED = 360
-    SWING_COOLDOWN = 0.12
-
-    HIT_W, HIT_H = 160, 160
-    HIT_OFFSET_X = 0
-    HIT_OFFSET_Y = -85
-
-    FLY_SIZE = (36, 36)
-    SWATTER_SIZE = (220, 220)
-
-    def vlen(x, y): return math.hypot(x, y)
-
-    def load_image(name):
-        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
-        return pygame.image.load(path).convert_alpha()
-
-    pygame.init()
-    screen = pygame.display.set_mode((W, H))
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont("arial", 44, bold=True)
-
-    fly_img = pygame.transform.smoothscale(load_image("fly.png"), FLY_SIZE)
-    swatter_img = pygame.transform.smoothscale(load_image("swatter.png"), SWATTER_SIZE)
-
-    # Transparent overlay for any text (guaranteed no background box)
-    overlay = pygame.Surface((W, H), pygame.SRCALPHA)
-
-    class Fly:
-        def __init__(self):
-            self.alive = True
-            self.pos = [random.uniform(PLAY.left + 20, PLAY.right - 20),
-                        random.uniform(PLAY.top + 20, PLAY.bottom - 20)]
-            sp = random.uniform(140, 320)
-            ang = random.uniform(0, math.tau)
-            self.vx = math.cos(ang) * sp
-            self.vy = math.sin(ang) * sp
-            self.t = random.uniform(0, 10)
-            self.angle = 0.0
-            self.scale = random.uniform(0.85, 1.15)
-
-        def update(self, dt):
-            self.t += dt * random.uniform(1.6, 2.4)
-            self.vx += math.cos(self.t) * WANDER * dt
-            self.vy += math.sin(self.t * 1.2) * WANDER * dt
-
-            sp = vlen(self.vx, self.vy)
-            if sp > MAX_SPEED:
-                k = MAX_SPEED / sp
-                self.vx *= k
-                self.vy *= k
-
-            self.pos[0] += self.vx * dt
-            self.pos[1] += self.vy * dt
-
-            if self.pos[0] < PLAY.left:
-                self.pos[0] = PLAY.left
-                self.vx *= -1
-            if self.pos[0] > PLAY.right:
-                self.pos[0] = PLAY.right
-                self.vx *= -1
-            if self.pos[1] < PLAY.top:
-                self.pos[1] = PLAY.top
-                self.vy *= -1
-            if self.pos[1] > PLAY.bottom:
-                self.pos[1] = PLAY.bottom
-                self.vy *= -1
-
-            if abs(self.vx) + abs(self.vy) > 5:
-                self.angle = math.degrees(math.atan2(-self.vy, self.vx))
-
-        def draw(self, s):
-            x, y = int(self.pos[0]), int(self.pos[1])
-            img = fly_img
-            if self.scale != 1.0:
-                img = pygame.transform.smoothscale(
-                    fly_img,
-                    (int(FLY_SIZE[0] * self.scale), int(FLY_SIZE[1] * self.scale))
-                )
-            rot = pygame.transform.rotate(img, self.angle)
-            s.blit(rot, rot.get_rect(center=(x, y)))
-
-    class Swatter:
-        def __init__(self):
-            self.pos = (0, 0)
-            self.swing = 0.0
-            self.cooldown = 0.0
-
-        def update(self, dt):
-            self.pos = pygame.mouse.get_pos()
-            self.cooldown = max(0.0, self.cooldown - dt)
-            self.swing = max(0.0, self.swing - dt * 6.0)
-
-        def can_swing(self):
-            return self.cooldown <= 0.0
-
-        def swing_now(self):
-            self.swing = 1.0
-            self.cooldown = SWING_COOLDOWN
-
-        def hit_rect(self):
-            x, y = self.pos
-            cx = x + HIT_OFFSET_X
-            cy = y + HIT_OFFSET_Y
-            return pygame.Rect(cx - HIT_W // 2, cy - HIT_H // 2, HIT_W, HIT_H)
-
-        def draw(self, s):
-            x, y = self.pos
-            rot = pygame.transform.rotate(swatter_img, -18 * self.swing)
-            s.blit(rot, rot.get_rect(center=(x, y)))
-
-    def new_round():
-        return [Fly() for _ in range(random.randint(MIN_FLIES, MAX_FLIES))]
-
-    flies = new_round()
-    swatter = Swatter()
-    won = False
-
-    while True:
-        dt = clock.tick(FPS) / 1000.0
-
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    pygame.quit(); return
-                if e.key == pygame.K_r:
-                    flies = new_round()
-                    won = False
-
-            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 and not won:
-                if swatter.can_swing():
-                    swatter.swing_now()
-                    hitbox = swatter.hit_rect()
-                    for f in flies:
-                        if f.alive and hitbox.collidepoint(int(f.pos[0]), int(f.pos[1])):
-                            f.alive = False
-
-        swatter.update(dt)
-
-        if not won:
-            for f in flies:
-                if f.alive:
-                    f.update(dt)
-            if all(not f.alive for f in flies):
-                won = True
-
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general import pointer
+from general.assets import get_assets
+from general.sprites import rotated, rotated_mask, prerender, scale_buckets, quantize, ANGLE_STEP, SCALE_STEP
+from components.geometry import vlen, points_in_rects, sweep_interval, sweep_intervals, sweep_mask
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+W, H, FPS = 1000, 650, 60
+PLAY = pygame.Rect(70, 90, W - 140, H - 160)
+
+MIN_FLIES, MAX_FLIES = 8, 14
+SWARM_MIN = 32   # from this many flies up, FlySwarm (NumPy) replaces the Fly objects
+WANDER = 140
+MAX_SPEED = 360
+SWING_COOLDOWN = 0.12
+
+FLY_SIZE = (36, 36)
+FLY_SCALE = (0.85, 1.15)
+FLY_REACH = int(math.hypot(*FLY_SIZE) * FLY_SCALE[1] / 2) + 1   # farthest a fly's pixels get from its centre
+SWATTER_SIZE = (220, 220)
+SWING_ANGLE = 18   # degrees the swatter tips over at the start of a swing
+SWING_STEP = 2     # finer angle buckets than the flies: the swing is short and big
+HEAD_WIDTH = 0.5   # rows of the swatter at least this share of its widest row are the head
+
+def image_path(name):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+class Fly:
+    def __init__(self, img):
+        self.img = img
+        self.alive = True
+        self.pos = [random.uniform(PLAY.left + 20, PLAY.right - 20),
+                    random.uniform(PLAY.top + 20, PLAY.bottom - 20)]
+        sp = random.uniform(140, 320)
+        ang = random.uniform(0, math.tau)
+        self.vx = math.cos(ang) * sp
+        self.vy = math.sin(ang) * sp
+        self.t = random.uniform(0, 10)
+        self.prev = tuple(self.pos)
+        self.angle = 0.0
+        self.scale = random.uniform(*FLY_SCALE)
+
+    def update(self, dt):
+        self.prev = tuple(self.pos)
+        self.t += dt * random.uniform(1.6, 2.4)
+        self.vx += math.cos(self.t) * WANDER * dt
+        self.vy += math.sin(self.t * 1.2) * WANDER * dt
+
+        sp = vlen((self.vx, self.vy))
+        if sp > MAX_SPEED:
+            k = MAX_SPEED / sp
+            self.vx *= k
+            self.vy *= k
+
+        self.pos[0] += self.vx * dt
+        self.pos[1] += self.vy * dt
+
+        if self.pos[0] < PLAY.left:
+            self.pos[0] = PLAY.left
+            self.vx *= -1
+        if self.pos[0] > PLAY.right:
+            self.pos[0] = PLAY.right
+            self.vx *= -1
+        if self.pos[1] < PLAY.top:
+            self.pos[1] = PLAY.top
+            self.vy *= -1
+        if self.pos[1] > PLAY.bottom:
+            self.pos[1] = PLAY.bottom
+            self.vy *= -1
+
+        if abs(self.vx) + abs(self.vy) > 5:
+            self.angle = math.degrees(math.atan2(-self.vy, self.vx))
+
+    def draw(self, s, alpha=1.0):
+        x = int(self.prev[0] + (self.pos[0] - self.prev[0]) * alpha)
+        y = int(self.prev[1] + (self.pos[1] - self.prev[1]) * alpha)
+        rot = rotated(self.img, self.angle, self.scale)
+        s.blit(rot, rot.get_rect(center=(x, y)))
+
+    def hit_by(self, mask, topleft):
+        """Pixel test: does this fly's sprite overlap `mask` placed at topleft?"""
+        body = rotated_mask(self.img, self.angle, self.scale)
+        w, h = body.get_size()
+        offset = (int(self.pos[0]) - w // 2 - topleft[0], int(self.pos[1]) - h // 2 - topleft[1])
+        return mask.overlap(body, offset) is not None
+
+    def swept_by(self, mask, half, reach, path):
+        """
+        Swept version of hit_by over the last step: the mask's centre follows
+        `path` (spread evenly over the step) while the fly moves prev -> pos.
+        half = mask centre to its top-left, reach = the mask's solid rect in
+        mask coordinates grown by FLY_REACH.
+        """
+        body = rotated_mask(self.img, self.angle, self.scale)
+        bw, bh = body.get_size()[0] // 2, body.get_size()[1] // 2
+        (px, py), (qx, qy) = self.prev, self.pos
+        k = len(path) - 1
+        for j in range(k):
+            s0, s1 = j / k, (j + 1) / k
+            # Fly centre relative to the mask's top-left at both ends of this piece
+            x0 = px + (qx - px) * s0 - path[j][0] + half[0]
+            y0 = py + (qy - py) * s0 - path[j][1] + half[1]
+            dx = px + (qx - px) * s1 - path[j + 1][0] + half[0] - x0
+            dy = py + (qy - py) * s1 - path[j + 1][1] + half[1] - y0
+            span = sweep_interval(x0, y0, dx, dy, reach)
+            if span and sweep_mask(mask, body, (x0 - bw, y0 - bh), (dx, dy), *span) is not None:
+                return True
+        return False
+
+class FlySwarm:
+    """
+    The same flies as Fly, stored as arrays (position, velocity, wander phase,
+    alive) and stepped all at once, for rooms with hundreds of them. Its random
+    numbers come from a NumPy generator seeded off `random`, so seeded scenes
+    and replays stay deterministic.
+    """
+    def __init__(self, img, n):
+        self.rng = rng = np.random.default_rng(random.getrandbits(64))
+        self.pos = np.column_stack((rng.uniform(PLAY.left + 20, PLAY.right - 20, n),
+                                    rng.uniform(PLAY.top + 20, PLAY.bottom - 20, n)))
+        sp = rng.uniform(140, 320, n)
+        ang = rng.uniform(0, math.tau, n)
+        self.vel = np.column_stack((np.cos(ang) * sp, np.sin(ang) * sp))
+        self.t = rng.uniform(0, 10, n)
+        self.prev = self.pos.copy()
+        self.angle = np.zeros(n)
+        self.alive = np.ones(n, dtype=bool)
+        self.lo = np.array(PLAY.topleft, dtype=float)
+        self.hi = np.array(PLAY.bottomright, dtype=float)
+
+        # Every (scale bucket, angle bucket) sprite in one flat list; each fly keeps its scale row
+        scales = scale_buckets(*FLY_SCALE)
+        self.n_angles = int(round(360 / ANGLE_STEP))
+        self.frames = []
+        self.masks = []
+        for scale in scales:
+            for i in range(self.n_angles):
+                surf = rotated(img, i * ANGLE_STEP, scale)
+                self.frames.append((surf, surf.get_width() // 2, surf.get_height() // 2))
+                self.masks.append(rotated_mask(img, i * ANGLE_STEP, scale))
+        bucket = np.rint((rng.uniform(*FLY_SCALE, n) - scales[0]) / SCALE_STEP).astype(int)
+        self.row = np.clip(bucket, 0, len(scales) - 1) * self.n_angles
+
+    def __len__(self):
+        return len(self.alive)
+
+    def remaining(self):
+        return int(self.alive.sum())
+
+    def update(self, dt):
+        n = len(self.t)
+        vel = self.vel
+        self.prev[:] = self.pos
+        self.t += dt * self.rng.uniform(1.6, 2.4, n)
+        vel[:, 0] += np.cos(self.t) * WANDER * dt
+        vel[:, 1] += np.sin(self.t * 1.2) * WANDER * dt
+
+        sp = np.hypot(vel[:, 0], vel[:, 1])
+        fast = sp > MAX_SPEED
+        vel[fast] *= (MAX_SPEED / sp[fast])[:, None]
+
+        self.pos += vel * dt
+        out = (self.pos < self.lo) | (self.pos > self.hi)
+        vel[out] *= -1
+        np.clip(self.pos, self.lo, self.hi, out=self.pos)
+
+        moving = np.abs(vel).sum(axis=1) > 5
+        self.angle[moving] = np.degrees(np.arctan2(-vel[moving, 1], vel[moving, 0]))
+
+    def frame(self, idx):
+        """Index into frames/masks of each fly's current sprite."""
+        return self.row[idx] + np.rint(self.angle[idx] / ANGLE_STEP).astype(int) % self.n_angles
+
+    def swat(self, mask, topleft, bounds):
+        """
+        Kills every live fly whose sprite overlaps `mask` placed at topleft.
+        Only flies within FLY_REACH of bounds (the mask's solid area on screen)
+        get the pixel test. -> number killed
+        """
+        reach = bounds.inflate(2 * FLY_REACH, 2 * FLY_REACH)
+        near = np.flatnonzero(self.alive & points_in_rects(self.pos, [reach])[:, 0])
+        killed = 0
+        masks, frames = self.masks, self.frames
+        for i, k, (x, y) in zip(near.tolist(), self.frame(near).tolist(), self.pos[near].astype(int).tolist()):
+            _, hw, hh = frames[k]
+            if mask.overlap(masks[k], (x - hw - topleft[0], y - hh - topleft[1])) is not None:
+                self.alive[i] = False
+                killed += 1
+        return killed
+
+    def sweep(self, mask, half, reach, path):
+        """Fly.swept_by for the whole swarm; the broad phase is one batched interval test per path piece."""
+        live = np.flatnonzero(self.alive)
+        n, k = len(live), len(path) - 1
+        # Fly centres relative to the mask's top-left at every path point: (k + 1, n, 2)
+        s = np.arange(k + 1) / k
+        prev = self.prev[live]
+        rel = prev + (self.pos[live] - prev) * s[:, None, None] - (np.asarray(path, dtype=float) - half)[:, None, :]
+        start = rel[:-1].reshape(-1, 2)
+        move = (rel[1:] - rel[:-1]).reshape(-1, 2)
+        t_in, t_out = sweep_intervals(start, move, reach)
+
+        rows = np.flatnonzero(t_in <= t_out)   # path piece by piece, in order
+        frame = self.frame(live).tolist()
+        masks, frames, alive = self.masks, self.frames, self.alive
+        killed = 0
+        for row, (x, y), rel_move, a, b in zip(rows.tolist(), start[rows].tolist(), move[rows].tolist(),
+                                              t_in[rows].tolist(), t_out[rows].tolist()):
+            i = live[row % n]
+            if not alive[i]:
+                continue
+            f = frame[row % n]
+            _, hw, hh = frames[f]
+            if sweep_mask(mask, masks[f], (x - hw, y - hh), rel_move, a, b) is not None:
+                alive[i] = False
+                killed += 1
+        return killed
+
+    def draw(self, s, alpha=1.0):
+        live = np.flatnonzero(self.alive)
+        prev, pos = self.prev[live], self.pos[live]
+        xy = (prev + (pos - prev) * alpha).astype(int)
+        frame = self.frame(live)
+        frames = self.frames
+        s.blits([(img, (x - hw, y - hh)) for (img, hw, hh), (x, y) in
+                 zip(map(frames.__getitem__, frame.tolist()), xy.tolist())], doreturn=False)
+
+def head_mask(img):
+    """
+    The swatter's head as one solid shape: the see-through holes in the mesh
+    are filled in (a fly under them still gets squashed) and the handle is
+    left out.
+    """
+    solid = pygame.mask.from_surface(img)
+    w, h = solid.get_size()
+    if not solid.get_at((0, 0)):
+        # Holes = empty pixels that can't reach the border
+        outside = solid.copy()
+        outside.invert()
+        solid = outside.connected_component((0, 0))
+        solid.invert()
+    row = pygame.mask.Mask((w, 1), fill=True)
+    widths = [solid.overlap_area(row, (0, y)) for y in range(h)]
+    for y, width in enumerate(widths):
+        if width < max(widths) * HEAD_WIDTH:
+            solid.erase(row, (0, y))
+    return solid
+
+class Swatter:
+    def __init__(self, img):
+        self.img = img
+        self.pos = (0, 0)
+        self.swing = 0.0
+        self.cooldown = 0.0
+        self.path = [self.pos]   # pointer positions during the last step, oldest first
+        # Head mask per swing angle bucket, rotated the same way draw() rotates the sprite
+        self.head = head_mask(img).to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))
+        self.poses = {}
+        for angle in range(0, -SWING_ANGLE - SWING_STEP, -SWING_STEP):
+            self.pose(angle)
+
+    def pose(self, angle):
+        """-> (mask, its bounding rect) of the head at this swing angle, built once per bucket."""
+        key = quantize(angle, step=SWING_STEP)[0]
+        found = self.poses.get(key)
+        if found is None:
+            mask = pygame.mask.from_surface(pygame.transform.rotate(self.head, key))
+            rects = mask.get_bounding_rects()
+            found = self.poses[key] = (mask, rects[0].unionall(rects[1:]) if rects else pygame.Rect(0, 0, 0, 0))
+        return found
+
+    def update(self, dt):
+        # Every pointer sample since the last step, so a fast flick is a path and not a jump
+        start = self.pos
+        self.pos = pointer.get_pos()
+        self.path = [start] + (pointer.take_samples() or [self.pos])
+        self.cooldown = max(0.0, self.cooldown - dt)
+        self.swing = max(0.0, self.swing - dt * 6.0)
+
+    def can_swing(self):
+        return self.cooldown <= 0.0
+
+    def striking(self):
+        """A swing keeps swatting for SWING_COOLDOWN after the click."""
+        return self.cooldown > 0.0
+
+    def swing_now(self, pos=None):
+        self.swing = 1.0
+        self.cooldown = SWING_COOLDOWN
+        if pos is not None:
+            self.pos = pos
+            pointer.take_samples()  # the strike's path starts at the click
+
+    def hit_pose(self):
+        """-> (head mask, offset from its centre to its top-left, head rect in mask coordinates)"""
+        mask, bounds = self.pose(-SWING_ANGLE * self.swing)
+        w, h = mask.get_size()
+        return mask, (w // 2, h // 2), bounds
+
+    def hit_area(self):
+        """-> (head mask, its top-left on screen, screen rect around the head) for the current pose."""
+        mask, half, bounds = self.hit_pose()
+        topleft = (self.pos[0] - half[0], self.pos[1] - half[1])
+        return mask, topleft, bounds.move(topleft)
+
+    def draw(self, s):
+        x, y = self.pos
+        rot = rotated(self.img, -SWING_ANGLE * self.swing, step=SWING_STEP)
+        s.blit(rot, rot.get_rect(center=(x, y)))
+
+class FlySwatterGame(Scene):
+    size = (W, H)
+    fps = FPS
+
+    @classmethod
+    def preload(cls):
+        assets = get_assets()
+        assets.request(image_path("fly.png"), FLY_SIZE, smooth=True)
+        assets.request(image_path("swatter.png"), SWATTER_SIZE, smooth=True)
+
+    def __init__(self, screen, flies=None):
+        self.screen = screen
+        self.fly_count = flies   # None = a random 8-14 each round
+        self.font = get_font("arial", 44, bold=True)
+
+        assets = get_assets()
+        self.fly_img = assets.get(image_path("fly.png"), FLY_SIZE, smooth=True)
+        self.swatter_img = assets.get(image_path("swatter.png"), SWATTER_SIZE, smooth=True)
+        prerender(self.fly_img, scales=scale_buckets(*FLY_SCALE))
+        prerender(self.swatter_img, range(0, -SWING_ANGLE - SWING_STEP, -SWING_STEP), step=SWING_STEP)
+
+        # Transparent overlay for any text (guaranteed no background box)
+        self.overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+
+        self.flies = self.new_round()
+        self.swatter = Swatter(self.swatter_img)
+        self.won = False
+
+    def new_round(self):
+        n = self.fly_count or random.randint(MIN_FLIES, MAX_FLIES)
+        if np is not None and n >= SWARM_MIN:
+            return FlySwarm(self.fly_img, n)
+        return [Fly(self.fly_img) for _ in range(n)]
+
+    def handle(self, e):
+        if e.type == pygame.KEYDOWN:
+            if e.key == pygame.K_ESCAPE:
+                self.finish(self.won); return
+            if e.key == pygame.K_r:
+                self.flies = self.new_round()
+                self.won = False
+
+        if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 and not self.won:
+            if self.swatter.can_swing():
+                self.swatter.swing_now(e.pos)
+                self.swat()
+
+    def swat(self):
+        """The instant of the click: the head where it lands against the flies where they are."""
+        mask, topleft, bounds = self.swatter.hit_area()
+        if isinstance(self.flies, FlySwarm):
+            self.flies.swat(mask, topleft, bounds)
+            return
+        reach = bounds.inflate(2 * FLY_REACH, 2 * FLY_REACH)
+        for f in self.flies:
+            if f.alive and reach.collidepoint(f.pos) and f.hit_by(mask, topleft):
+                f.alive = False
+
+    def sweep(self):
+        """The rest of the strike: everything the head passed over during the last step."""
+        mask, half, bounds = self.swatter.hit_pose()
+        reach = bounds.inflate(2 * FLY_REACH, 2 * FLY_REACH)
+        path = self.swatter.path
+        if isinstance(self.flies, FlySwarm):
+            self.flies.sweep(mask, half, reach, path)
+            return
+        for f in self.flies:
+            if f.alive and f.swept_by(mask, half, reach, path):
+                f.alive = False
+
+    def idle(self):
+        return self.won and self.swatter.swing == 0.0
+
+    def update(self, dt):
+        striking = self.swatter.striking()
+        if not self.won:
+            if isinstance(self.flies, FlySwarm):
+                self.flies.update(dt)
+            else:
+                for f in self.flies:
+                    if f.alive:
+                        f.update(dt)
+        self.swatter.update(dt)
+
+        if not self.won:
+            if striking:
+                self.sweep()
+            if isinstance(self.flies, FlySwarm):
+                self.won = self.flies.remaining() == 0
+            else:
+                self.won = all(not f.alive for f in self.flies)
+
+    def draw(self):
+        screen = self.screen
         # IMPORTANT: Don't try to "transparent fill" the display.
         # Use a normal fill (or replace with your main game's draw).
         screen.fill((0, 0, 0))
 
-        for f in flies:
-            if f.alive:
-                f.draw(screen)
-        swatter.draw(screen)
+        if isinstance(self.flies, FlySwarm):
+            self.flies.draw(screen, self.alpha)
+        else:
+            for f in self.flies:
+                if f.alive:
+                    f.draw(screen, self.alpha)
+        self.swatter.draw(screen)
 
-        if won:
-            overlay.fill((0, 0, 0, 0))  # transparent overlay
-            text = font.render("DONE!", True, (0, 255, 0))  # green, transparent background
-            overlay.blit(text, text.get_rect(center=(W // 2, H // 2)))
-            screen.blit(overlay, (0, 0))
+        if self.won:
+            self.overlay.fill((0, 0, 0, 0))  # transparent overlay
+            text = render_text(self.font, "DONE!", (0, 255, 0))  # green, transparent background
+            self.overlay.blit(text, text.get_rect(center=(W // 2, H // 2)))
+            screen.blit(self.overlay, (0, 0))
 
-        pygame.display.flip()
+def fly_swatter_game():
+    manager = get_manager()
+    return manager.run(FlySwatterGame(manager.screen))
 
 if __name__ == "__main__":
     fly_swatter_game()
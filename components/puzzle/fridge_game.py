@@ -3,6 +3,16 @@ import sys
 import os
 import random
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general import pointer
+from general.dirty import DamageTracker, line_rect
+from components.geometry import dist
+
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 800, 1000 
 FPS = 60
@@ -15,7 +25,10 @@ COLORS = {
     "pink": (255, 80, 200)
 }
 
-class WireGame:
+class WireGame(Scene):
+    caption = "Fridge Rewiring"
+    dirty_rects = True
+
     def __init__(self, screen):
         self.screen = screen
         self.done = False
@@ -37,6 +50,7 @@ class WireGame:
         self.completed_connections = []
         
         self.toggle_rect = pygame.Rect(20, 20, 160, 40)
+        self.damage_tracker = DamageTracker()
 
     def draw_beveled_wire(self, start, end, color):
         """Draws a wire with a shadow/highlight to look 3D."""
@@ -49,8 +63,11 @@ class WireGame:
         highlight = (min(255, color[0]+50), min(255, color[1]+50), min(255, color[2]+50))
         pygame.draw.line(self.screen, highlight, (start[0], start[1]-2), (end[0], end[1]-2), 4)
 
-    def handle_input(self, event):
-        mx, my = pygame.mouse.get_pos()
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish(self.game_cleared); return
+
+        mx, my = pointer.get_pos()
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.toggle_rect.collidepoint(event.pos):
                 self.device = "iPad" if self.device == "Computer" else "Computer"
@@ -59,22 +76,37 @@ class WireGame:
 
             for i, y in enumerate(self.y_positions):
                 if not any(conn[0] == i for conn in self.completed_connections):
-                    dist = ((mx - self.left_x)**2 + (my - y)**2)**0.5
-                    if dist < self.node_radius:
+                    if dist((mx, my), (self.left_x, y)) < self.node_radius:
                         self.active_line = i
                         break
 
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.active_line is not None:
                 for i, y in enumerate(self.y_positions):
-                    dist = ((mx - self.right_x)**2 + (my - y)**2)**0.5
-                    if dist < self.node_radius:
+                    if dist((mx, my), (self.right_x, y)) < self.node_radius:
                         if self.left_colors[self.active_line] == self.right_colors[i]:
                             self.completed_connections.append((self.active_line, i, self.left_colors[self.active_line]))
                 self.active_line = None
                 if len(self.completed_connections) == len(self.colors_keys):
                     self.game_cleared = True
 
+    def idle(self):
+        # Wires only move while the pointer drags them
+        return True
+
+    def damage(self):
+        items = {
+            "toggle": (self.device, self.toggle_rect),
+            "cleared": (self.game_cleared, self.screen.get_rect() if self.game_cleared else None),
+        }
+        for s_idx, e_idx, _ in self.completed_connections:
+            start, end = (self.left_x, self.y_positions[s_idx]), (self.right_x + 20, self.y_positions[e_idx])
+            items[("wire", s_idx)] = (e_idx, line_rect(start, end, 16))
+        if self.active_line is not None:
+            start, end = (self.left_x, self.y_positions[self.active_line]), pointer.get_pos()
+            items["active"] = ((self.active_line, end), line_rect(start, end, 16))
+        return self.damage_tracker.diff(items)
+
     def draw(self):
         # Slightly Lighter Gray background
         self.screen.fill((50, 50, 55))
@@ -99,7 +131,7 @@ class WireGame:
         # Draw Active Dragging Wire
         if self.active_line is not None:
             self.draw_beveled_wire((self.left_x, self.y_positions[self.active_line]), 
-                                   pygame.mouse.get_pos(), 
+                                   pointer.get_pos(), 
                                    COLORS[self.left_colors[self.active_line]])
 
         # Draw Left Sockets
@@ -111,31 +143,21 @@ class WireGame:
 
         # Toggle UI
         pygame.draw.rect(self.screen, (40, 40, 45), self.toggle_rect, border_radius=10)
-        font = pygame.font.SysFont(None, 24)
-        mode_text = font.render(f"Mode: {self.device}", True, (255, 255, 255))
+        font = get_font(None, 24)
+        mode_text = render_text(font, f"Mode: {self.device}", (255, 255, 255))
         self.screen.blit(mode_text, (self.toggle_rect.x + 15, self.toggle_rect.y + 10))
 
         if self.game_cleared:
             overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, 180))
             self.screen.blit(overlay, (0,0))
-            big_font = pygame.font.SysFont(None, 120)
-            done_text = big_font.render("DONE!", True, (0, 255, 127))
+            big_font = get_font(None, 120)
+            done_text = render_text(big_font, "DONE!", (0, 255, 127))
             self.screen.blit(done_text, done_text.get_rect(center=(WIDTH//2, HEIGHT//2)))
 
 def main():
-    pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Fridge Rewiring")
-    clock = pygame.time.Clock()
-    game = WireGame(screen)
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-            game.handle_input(event)
-        game.draw()
-        pygame.display.flip()
-        clock.tick(FPS)
+    manager = get_manager()
+    return manager.run(WireGame(manager.screen))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,4 +1,12 @@
-import pygame, random, math, sys
+import pygame, random, math, sys, os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general import pointer
+from components.geometry import clamp, PathTracker, smooth_path, capsule_span
 
 WIDTH, HEIGHT = 900, 500
 FPS = 60
@@ -8,9 +16,13 @@ PATH=(170,190,230)
 PATH_OK=(120,210,160)
 IRON=(230,230,240)
 ACCENT=(120,150,255)
+CURVE_SPACING=1.0  # px between samples of a curvy path
+PRESSED=(255,255,255,35)
 
-def clamp(v,a,b): return max(a,min(b,v))
-def dist(a,b): return math.hypot(a[0]-b[0], a[1]-b[1])
+# --- COVERAGE ---
+COVER_CELL=4     # px per coverage cell
+COVER_CORE=0.5   # share of the path's width (around its centre line) that counts as the path
+COVER_GOAL=0.9   # share of those path cells that has to be pressed
 
 class Iron:
     def __init__(self, pos):
@@ -40,7 +52,59 @@ class Iron:
         pygame.draw.rect(s, IRON, r, border_radius=14)
         pygame.draw.rect(s, ACCENT, r.inflate(-r.w*0.35, -r.h*0.6), border_radius=10)
 
-def build_path(cloth, difficulty):
+class Coverage:
+    """
+    The cloth at COVER_CELL px per cell: which cells the iron has pressed,
+    and a running count of how many of the path's cells are among them.
+    Each stroke is the iron's circle swept from one position to the next,
+    rasterized row by row, so a step costs what the stroke covers and never
+    a scan of the cloth.
+    """
+    def __init__(self, rect, pts, half_width):
+        self.rect = pygame.Rect(rect)
+        self.cols = -(-self.rect.w // COVER_CELL)
+        self.rows = -(-self.rect.h // COVER_CELL)
+        self.pressed = bytearray(self.cols * self.rows)
+        self.path = bytearray(self.cols * self.rows)
+        for a, b in zip(pts, pts[1:]):
+            for lo, hi in self.spans(a, b, half_width):
+                self.path[lo:hi] = b"\x01" * (hi - lo)
+        self.path_cells = self.path.count(1)
+        self.covered = 0
+
+    def spans(self, a, b, radius):
+        """Runs of cells, as (start, end) indices per row, whose centres lie within radius of segment ab (screen coordinates)."""
+        c = COVER_CELL
+        ax, ay = (a[0] - self.rect.x) / c, (a[1] - self.rect.y) / c
+        bx, by = (b[0] - self.rect.x) / c, (b[1] - self.rect.y) / c
+        r = radius / c
+        cols = self.cols
+        for row in range(max(0, int(min(ay, by) - r)), min(self.rows - 1, int(max(ay, by) + r)) + 1):
+            span = capsule_span(ax, ay, bx, by, r, row + 0.5)
+            if span:
+                lo, hi = max(0, math.ceil(span[0] - 0.5)), min(cols - 1, math.floor(span[1] - 0.5))
+                if lo <= hi:
+                    yield row * cols + lo, row * cols + hi + 1
+
+    def stroke(self, a, b, radius):
+        """Presses everything within radius of segment ab. -> number of newly pressed cells"""
+        pressed, path = self.pressed, self.path
+        new = 0
+        for lo, hi in self.spans(a, b, radius):
+            fresh = pressed.count(0, lo, hi)
+            if not fresh:
+                continue  # the usual case: the iron is going over its own track
+            new += fresh
+            self.covered += bytes(p & ~q for p, q in zip(path[lo:hi], pressed[lo:hi])).count(1)
+            pressed[lo:hi] = b"\x01" * (hi - lo)
+        return new
+
+    @property
+    def fraction(self):
+        """Share of the path pressed so far."""
+        return self.covered / self.path_cells if self.path_cells else 1.0
+
+def build_path(cloth, difficulty, curvy=False):
     npts = [6, 9, 13][difficulty-1]
     width = [44, 32, 22][difficulty-1]
     x0, x1 = cloth.x+60, cloth.right-60
@@ -53,91 +117,105 @@ def build_path(cloth, difficulty):
         pts.append((x,y))
     pts[0]=(x0, cloth.centery)
     pts[-1]=(x1, cloth.centery)
+    if curvy:
+        # Same control points, but a smooth spline through them instead of straight legs
+        pts=smooth_path(pts, CURVE_SPACING)
     return pts, width
 
-def point_seg_dist(p,a,b):
-    px,py=p; ax,ay=a; bx,by=b
-    abx,aby=bx-ax,by-ay
-    apx,apy=px-ax,py-ay
-    ab2=abx*abx+aby*aby
-    if ab2==0: return dist(p,a),0.0
-    t=(apx*abx+apy*aby)/ab2
-    t=max(0.0,min(1.0,t))
-    cx,cy=ax+t*abx, ay+t*aby
-    return dist(p,(cx,cy)), t
-
-def nearest_progress(p, pts):
-    total=0.0
-    lens=[]
-    for i in range(len(pts)-1):
-        L=dist(pts[i],pts[i+1])
-        lens.append(L); total+=L
-    if total<=0: return 0.0, 1e9
-
-    best_d=1e9
-    best_prog=0.0
-    walked=0.0
-    for i in range(len(pts)-1):
-        d,t=point_seg_dist(p, pts[i], pts[i+1])
-        if d<best_d:
-            best_d=d
-            best_prog=(walked + t*lens[i]) / total
-        walked += lens[i]
-    return best_prog, best_d
-
-def ironing_minigame_path(difficulty=2):
-    pygame.init()
-    screen=pygame.display.set_mode((WIDTH,HEIGHT))
-    clock=pygame.time.Clock()
-
-    cloth=pygame.Rect(160,90,600,320)
-    pts, path_w = build_path(cloth, difficulty)
-    tolerance = path_w * 0.45
-
-    iron=Iron((80, HEIGHT//2))
-    pressed=pygame.Surface(cloth.size, pygame.SRCALPHA)
-
-    progress=0.0
-    goal=0.985
-
-    while True:
-        clock.tick(FPS)
-        for e in pygame.event.get():
-            if e.type==pygame.QUIT:
-                pygame.quit(); sys.exit()
-            if e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE:
-                pygame.quit(); return False
-            iron.handle(e)
-
-        if cloth.collidepoint(iron.rect.center):
-            x=iron.rect.centerx-cloth.x
-            y=iron.rect.centery-cloth.y
-            pygame.draw.circle(pressed,(255,255,255,35),(x,y),int(18*iron.scale))
-
-        prog, d = nearest_progress(iron.rect.center, pts)
-        on_path = d <= tolerance
-        if on_path:
-            progress = max(progress, prog)
-
+class IronGame(Scene):
+    size = (WIDTH, HEIGHT)
+    fps = FPS
+
+    def __init__(self, screen, difficulty=2, curvy=False):
+        self.screen = screen
+
+        self.cloth=pygame.Rect(160,90,600,320)
+        self.pts, self.path_w = build_path(self.cloth, difficulty, curvy)
+        self.path = PathTracker(self.pts)
+        self.tolerance = self.path_w * 0.45
+
+        self.iron=Iron((80, HEIGHT//2))
+        self.pressed=pygame.Surface(self.cloth.size, pygame.SRCALPHA)
+        self.coverage=Coverage(self.cloth, self.pts, self.path_w*COVER_CORE/2)
+        self.last=None  # where the iron was at the end of the previous stroke
+
+        self.progress=0.0
+        self.goal=COVER_GOAL
+        self.on_path=False
+        self.done_at=None
+
+    def handle(self, e):
+        if e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE:
+            self.finish(False); return
+        was_dragging = self.iron.drag
+        self.iron.handle(e)
+        if self.iron.drag and not was_dragging:
+            pointer.take_samples()  # only samples from here on belong to the drag
+            self.last = tuple(self.iron.rect.center)
+
+    def update(self, dt):
+        # Hold the completed path on screen for a moment before leaving
+        if self.done_at is not None:
+            if self.manager.ticks - self.done_at >= 250:
+                self.finish(True)
+            return
+
+        cloth, iron = self.cloth, self.iron
+        # Every position the iron passed through since the last step, not just where it ended up
+        samples = pointer.take_samples()
+        if iron.drag and samples:
+            points = [(clamp(x,0,WIDTH), clamp(y,0,HEIGHT)) for x, y in samples]
+        else:
+            points = [iron.rect.center]
+
+        radius = int(18*iron.scale)
+        for p in points:
+            # Press the whole stroke from the last position, not just a stamp where the iron ended up
+            self.press(self.last or p, p, radius)
+            self.last = p
+            _, d = self.path.nearest(p)
+            self.on_path = d <= self.tolerance
+
+        self.progress = self.coverage.fraction
+        if self.progress >= self.goal:
+            self.done_at = self.manager.ticks
+
+    def press(self, a, b, radius):
+        if self.coverage.stroke(a, b, radius):
+            self.paint(a, b, radius)  # skipped when nothing new is under the iron
+
+    def paint(self, a, b, radius):
+        cloth = self.cloth
+        a, b = (a[0]-cloth.x, a[1]-cloth.y), (b[0]-cloth.x, b[1]-cloth.y)
+        pygame.draw.circle(self.pressed, PRESSED, b, radius)
+        if a != b:
+            # The band between the two circles (draw.line's thick lines come out thinner on diagonals)
+            dx, dy = b[0]-a[0], b[1]-a[1]
+            L = math.hypot(dx, dy)
+            nx, ny = -dy/L*radius, dx/L*radius
+            pygame.draw.circle(self.pressed, PRESSED, a, radius)
+            pygame.draw.polygon(self.pressed, PRESSED, [(a[0]+nx, a[1]+ny), (b[0]+nx, b[1]+ny),
+                                                        (b[0]-nx, b[1]-ny), (a[0]-nx, a[1]-ny)])
+
+    def draw(self):
+        screen, cloth = self.screen, self.cloth
         screen.fill((200,220,255))  # remove/override in your main
         pygame.draw.rect(screen, WHITE, cloth, border_radius=18)
-        screen.blit(pressed, cloth.topleft)
+        screen.blit(self.pressed, cloth.topleft)
 
-        pygame.draw.lines(screen, PATH_OK if on_path else PATH, False, pts, path_w)
+        pygame.draw.lines(screen, PATH_OK if self.on_path else PATH, False, self.pts, self.path_w)
 
         bar=pygame.Rect(cloth.x, cloth.bottom+16, cloth.w, 10)
         pygame.draw.rect(screen, (210,220,240), bar, border_radius=8)
         pygame.draw.rect(screen, (120,210,160),
-                         (bar.x, bar.y, int(bar.w*progress), bar.h),
+                         (bar.x, bar.y, int(bar.w*min(1.0, self.progress/self.goal)), bar.h),
                          border_radius=8)
 
-        iron.draw(screen)
-        pygame.display.flip()
+        self.iron.draw(screen)
 
-        if progress >= goal:
-            pygame.time.delay(250)
-            pygame.quit()
-            return True
+def ironing_minigame_path(difficulty=2, curvy=False):
+    manager = get_manager()
+    return manager.run(IronGame(manager.screen, difficulty, curvy))
 
-# call:
-ironing_minigame_path(difficulty=1|2|3)
+if __name__ == "__main__":
+    ironing_minigame_path(difficulty=2)  # 1, 2 or 3; curvy=True for a spline path
@@ -3,46 +3,125 @@ import sys
 import os
 import random
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general import pointer
+from general.assets import get_assets
+from components.geometry import dist
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 800, 1000 
 FPS = 60
 MARGIN_1_5_INCH = 144  
+MIRROR_H = int(HEIGHT * 0.85)
+DIRT_TILE = 32     # px per side of a dirt counting tile
+DIRT_ALPHA = 127   # alpha above this still counts as dirt (pygame.mask.from_surface's cut-off)
+
+def find_mirror():
+    # 1. Get the directory where THIS file is saved
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # 2. Try to find 'assets' in the current folder OR one folder up
+    # This handles moving the code between 'test.py' and 'components/puzzle/mirror_game.py'
+    possible_paths = [
+        os.path.join(current_dir, 'assets', 'mirror.png'), # If assets is in the same folder
+        os.path.join(current_dir, '..', 'assets', 'mirror.png'), # If assets is one folder up
+        os.path.join(current_dir, '..', '..', 'assets', 'mirror.png') # If assets is two folders up
+    ]
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+class DirtTiles:
+    """
+    Remaining dirt per DIRT_TILE x DIRT_TILE tile of the dirt layer, plus the
+    total. Scrubbing marks the tiles under the brush and recount() only looks
+    at those, so checking for a clean mirror never scans the whole layer.
+    """
+    def __init__(self, layer):
+        self.layer = layer
+        w, h = layer.get_size()
+        self.cols = -(-w // DIRT_TILE)
+        self.rows = -(-h // DIRT_TILE)
+        self.counts = [0] * (self.cols * self.rows)
+        self.dirty = set(range(len(self.counts)))
+        self.total = 0
+        self.recount()
+        self.start = self.total
+
+    def touch(self, rect):
+        """Marks the tiles overlapping rect (layer coordinates) for the next recount()."""
+        r = pygame.Rect(rect).clip(self.layer.get_rect())
+        if not r.w or not r.h:
+            return
+        for row in range(r.top // DIRT_TILE, (r.bottom - 1) // DIRT_TILE + 1):
+            base = row * self.cols
+            self.dirty.update(range(base + r.left // DIRT_TILE, base + (r.right - 1) // DIRT_TILE + 1))
+
+    def recount(self):
+        """Recounts the touched tiles. -> total dirt pixels left"""
+        if not self.dirty:
+            return self.total
+        counts, cols, t = self.counts, self.cols, DIRT_TILE
+        if np is not None:
+            alpha = pygame.surfarray.pixels_alpha(self.layer)  # a view, locks the layer until it's gone
+            for i in self.dirty:
+                x, y = i % cols * t, i // cols * t
+                n = int(np.count_nonzero(alpha[x:x + t, y:y + t] > DIRT_ALPHA))
+                self.total += n - counts[i]
+                counts[i] = n
+            del alpha
+        else:
+            bounds = self.layer.get_rect()
+            for i in self.dirty:
+                tile = pygame.Rect(i % cols * t, i // cols * t, t, t).clip(bounds)
+                n = pygame.mask.from_surface(self.layer.subsurface(tile), DIRT_ALPHA).count()
+                self.total += n - counts[i]
+                counts[i] = n
+        self.dirty.clear()
+        return self.total
+
+    @property
+    def clean(self):
+        """Share of the starting dirt scrubbed off."""
+        return 1.0 - self.total / self.start if self.start else 1.0
+
+class MirrorRoom(Scene):
+    @classmethod
+    def preload(cls):
+        path = find_mirror()
+        if path:
+            get_assets().request(path, height=MIRROR_H)
 
-class MirrorRoom:
     def __init__(self, screen):
         self.screen = screen
         self.done = False
         self.game_cleared = False
         self.device = "Computer"
         self.brush_size = 25
+        self.last_point = None  # end of the previous scrub stroke
         
         # --- ROBUST PATH LOADING ---
-        # 1. Get the directory where THIS file is saved
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        # 2. Try to find 'assets' in the current folder OR one folder up
-        # This handles moving the code between 'test.py' and 'components/puzzle/mirror_game.py'
-        possible_paths = [
-            os.path.join(current_dir, 'assets', 'mirror.png'), # If assets is in the same folder
-            os.path.join(current_dir, '..', 'assets', 'mirror.png'), # If assets is one folder up
-            os.path.join(current_dir, '..', '..', 'assets', 'mirror.png') # If assets is two folders up
-        ]
-        
-        original_img = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                try:
-                    original_img = pygame.image.load(path).convert_alpha()
-                    print(f"Successfully loaded mirror from: {path}")
-                    break
-                except:
-                    continue
-
-        if original_img:
-            w, h = original_img.get_size()
-            scale_factor = (HEIGHT * 0.85) / h
-            self.mirror_img = pygame.transform.scale(original_img, (int(w * scale_factor), int(HEIGHT * 0.85)))
-        else:
+        self.mirror_img = None
+        path = find_mirror()
+        if path:
+            try:
+                self.mirror_img = get_assets().get(path, height=MIRROR_H)
+                print(f"Successfully loaded mirror from: {path}")
+            except:
+                pass
+
+        if not self.mirror_img:
             # Fallback if image still can't be found
             print("Warning: Could not find assets/mirror.png. Check folder structure.")
             self.mirror_img = pygame.Surface((400, 850))
@@ -54,6 +133,7 @@ class MirrorRoom:
         # --- DIRT LAYER ---
         self.dirt_layer = pygame.Surface(self.rect.size, pygame.SRCALPHA)
         self.create_restricted_dirt()
+        self.dirt = DirtTiles(self.dirt_layer)
         self.toggle_rect = pygame.Rect(20, 20, 160, 40)
 
     def create_restricted_dirt(self):
@@ -73,58 +153,86 @@ class MirrorRoom:
                     if alpha < 0: alpha = 0
                     pygame.draw.circle(self.dirt_layer, (35, 30, 25, alpha), (x, y), r)
 
-    def handle_input(self, event):
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish(self.game_cleared); return
+
         if event.type == pygame.MOUSEBUTTONDOWN:
+            pointer.take_samples()  # the scrub starts at the press
             if self.toggle_rect.collidepoint(event.pos):
                 self.device = "iPad" if self.device == "Computer" else "Computer"
                 self.brush_size = 50 if self.device == "iPad" else 25
 
-    def update(self):
+    def idle(self):
+        return self.game_cleared or not pointer.get_pressed()[0]
+
+    def stroke_points(self, samples):
+        """The pointer samples plus in-between points, so a fast scrub leaves no gaps."""
+        points = []
+        prev = self.last_point
+        spacing = max(1, self.brush_size // 2)
+        for p in samples:
+            if prev is not None:
+                steps = int(dist(p, prev) // spacing)
+                for i in range(1, steps):
+                    t = i / steps
+                    points.append((prev[0] + (p[0] - prev[0]) * t, prev[1] + (p[1] - prev[1]) * t))
+            points.append(p)
+            prev = p
+        return points
+
+    def update(self, dt=0.0):
+        samples = pointer.take_samples()
         if self.game_cleared: return
-        if pygame.mouse.get_pressed()[0]:
-            mx, my = pygame.mouse.get_pos()
+        if not pointer.get_pressed()[0]:
+            self.last_point = None
+            return
+
+        # Held still: keep scrubbing the same spot
+        points = self.stroke_points(samples) or [pointer.get_pos()]
+        self.last_point = points[-1]
+        brush = None
+        for mx, my in points:
             if self.rect.collidepoint(mx, my):
-                lx, ly = mx - self.rect.x, my - self.rect.y
-                brush = pygame.Surface((self.brush_size*2, self.brush_size*2), pygame.SRCALPHA)
-                pygame.draw.circle(brush, (0,0,0,150), (self.brush_size, self.brush_size), self.brush_size)
-                self.dirt_layer.blit(brush, (lx-self.brush_size, ly-self.brush_size), special_flags=pygame.BLEND_RGBA_SUB)
-                
-                # Zero-pixel tolerance check
-                if pygame.mask.from_surface(self.dirt_layer).count() == 0:
-                    self.game_cleared = True
+                lx, ly = int(mx) - self.rect.x, int(my) - self.rect.y
+                if brush is None:
+                    brush = pygame.Surface((self.brush_size*2, self.brush_size*2), pygame.SRCALPHA)
+                    pygame.draw.circle(brush, (0,0,0,150), (self.brush_size, self.brush_size), self.brush_size)
+                self.dirt.touch(self.dirt_layer.blit(brush, (lx-self.brush_size, ly-self.brush_size), special_flags=pygame.BLEND_RGBA_SUB))
+
+        # Zero-pixel tolerance check, over the tiles the brush touched
+        if brush is not None and self.dirt.recount() == 0:
+            self.game_cleared = True
 
     def draw(self):
         self.screen.fill((15, 15, 20))
         self.screen.blit(self.mirror_img, self.rect)
         self.screen.blit(self.dirt_layer, self.rect)
+
+        # Percent clean
+        bar = pygame.Rect(self.rect.x, self.rect.bottom + 30, self.rect.w, 10)
+        pygame.draw.rect(self.screen, (45, 45, 50), bar, border_radius=8)
+        pygame.draw.rect(self.screen, (0, 255, 127),
+                         (bar.x, bar.y, int(bar.w * self.dirt.clean), bar.h),
+                         border_radius=8)
         
         # Toggle UI
         pygame.draw.rect(self.screen, (45, 45, 50), self.toggle_rect, border_radius=10)
-        font = pygame.font.SysFont(None, 24)
-        mode_text = font.render(f"Mode: {self.device}", True, (255, 255, 255))
+        font = get_font(None, 24)
+        mode_text = render_text(font, f"Mode: {self.device}", (255, 255, 255))
         self.screen.blit(mode_text, (self.toggle_rect.x + 15, self.toggle_rect.y + 10))
 
         if self.game_cleared:
             overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, 180))
             self.screen.blit(overlay, (0,0))
-            big_font = pygame.font.SysFont(None, 120)
-            done_text = big_font.render("DONE!", True, (0, 255, 127))
+            big_font = get_font(None, 120)
+            done_text = render_text(big_font, "DONE!", (0, 255, 127))
             self.screen.blit(done_text, done_text.get_rect(center=(WIDTH//2, HEIGHT//2)))
 
 def main():
-    pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    clock = pygame.time.Clock()
-    room = MirrorRoom(screen)
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-            room.handle_input(event)
-        room.update()
-        room.draw()
-        pygame.display.flip()
-        clock.tick(FPS)
+    manager = get_manager()
+    return manager.run(MirrorRoom(manager.screen))
 
 if __name__ == "__main__":
     main()
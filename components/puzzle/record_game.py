@@ -1,217 +1,213 @@
 import pygame, sys, math, random, os
 
-def record_player_game(difficulty=3, needle_length=240):
-    W, H, FPS = 1000, 650, 60
-    CENTER = (W // 2, H // 2)
-
-    # Colors
-    BG = (18, 22, 28)
-    ARM = (210, 220, 235)
-    NEEDLE = (245, 215, 125)
-    DOT = (255, 90, 120)
-    GREEN = (0, 255, 0)
-    RED = (255, 70, 70)
-
-    # Difficulty
-    dot_radius = {1: 16, 2: 12, 3: 9}[difficulty]
-    hit_margin = {1: 10, 2: 8, 3: 6}[difficulty]
-    lower_speed = {1: 0.60, 2: 0.45, 3: 0.34}[difficulty]
-    spin_speed = {1: 1.1, 2: 1.6, 3: 2.2}[difficulty]
-
-    def clamp(v, a, b):
-        return max(a, min(b, v))
-
-    def dist(a, b):
-        return math.hypot(a[0] - b[0], a[1] - b[1])
-
-    def load_record_frames(prefix="record", count=8, target_diameter=None):
-        """
-        Loads record0.png ... record7.png with transparency.
-        If images have a solid background (no alpha), we auto-colorkey using top-left pixel.
-        """
-        frames = []
-        for i in range(count):
-            path = f"{prefix}{i}.png"
-            if not os.path.exists(path):
-                raise FileNotFoundError(f"Missing image: {path}")
-
-            img = pygame.image.load(path)
-
-            # If no alpha channel, use top-left pixel as a color key background
-            if img.get_alpha() is None and (img.get_flags() & pygame.SRCALPHA) == 0:
-                img = img.convert()
-                key = img.get_at((0, 0))
-                img.set_colorkey(key)
-                img = img.convert_alpha()
-            else:
-                img = img.convert_alpha()
-
-            if target_diameter is not None:
-                img = pygame.transform.smoothscale(img, (target_diameter, target_diameter))
-
-            frames.append(img)
-        return frames
-
-    pygame.init()
-    screen = pygame.display.set_mode((W, H))
-    pygame.display.set_caption("Record Player")
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont("arial", 44, bold=True)
-
-    # --- Record animation frames ---
-    record_frames = load_record_frames(prefix="record", count=8, target_diameter=None)
-    frame_count = len(record_frames)
-
-    # Record radius from image size
-    rw, rh = record_frames[0].get_size()
-    RECORD_R = min(rw, rh) // 2
-
-    # Animation timing
-    frame_time = 1.0 / 12.0
-    anim_t = 0.0
-
-    # --- OVAL DOT PATH SETTINGS ---
-    # User request: range 55 height and 100 width, oval motion.
-    # Treat as semi-axes: a = 100 (x radius), b = 55 (y radius).
-    OVAL_A = 100
-    OVAL_B = 55
-
-    # Keep dot fully inside the oval by shrinking axes by dot radius
-    a_in = max(1, OVAL_A - dot_radius)
-    b_in = max(1, OVAL_B - dot_radius)
-
-    # --- Needle placement: right of player, shorter needle ---
-    arm_len = float(needle_length)
-
-    # Place pivot to the right of the record image
-    pivot = (CENTER[0] + RECORD_R + 170, CENTER[1] - 10)
-
-    # States
-    spinning_angle = 0.0
-    lowering = False
-    needle_h = 1.0
-    won = False
-    lost = False
-    resolved = False
-
-    # Dot phase random each round (random start angle on oval)
-    dot_phase = 0.0
-
-    def new_round():
-        nonlocal spinning_angle, lowering, needle_h, won, lost, resolved, anim_t, dot_phase
-        spinning_angle = 0.0
-        lowering = False
-        needle_h = 1.0
-        won = False
-        lost = False
-        resolved = False
-        anim_t = 0.0
-        dot_phase = random.uniform(-math.pi, math.pi)  # random position on oval
-
-    def tip_from_mouse(mx, my):
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general import pointer
+from general.assets import get_assets
+from components.geometry import clamp, dist
+
+W, H, FPS = 1000, 650, 60
+RECORD_PREFIX = os.path.join(ROOT_DIR, "record")
+CENTER = (W // 2, H // 2)
+
+# Colors
+BG = (18, 22, 28)
+ARM = (210, 220, 235)
+NEEDLE = (245, 215, 125)
+DOT = (255, 90, 120)
+GREEN = (0, 255, 0)
+RED = (255, 70, 70)
+
+def request_record_frames(prefix="record", count=8, target_diameter=None):
+    """
+    Queues record0.png ... record7.png on the asset pool so they decode in parallel.
+    If images have a solid background (no alpha), we auto-colorkey using top-left pixel.
+    """
+    size = (target_diameter, target_diameter) if target_diameter is not None else None
+    handles = []
+    for i in range(count):
+        path = f"{prefix}{i}.png"
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Missing image: {path}")
+        handles.append(get_assets().request(path, size, smooth=True, colorkey=True))
+    return handles
+
+def load_record_frames(prefix="record", count=8, target_diameter=None):
+    """
+    Loads record0.png ... record7.png with transparency.
+    """
+    size = (target_diameter, target_diameter) if target_diameter is not None else None
+    request_record_frames(prefix, count, target_diameter)
+    return [get_assets().get(f"{prefix}{i}.png", size, smooth=True, colorkey=True) for i in range(count)]
+
+class RecordPlayerGame(Scene):
+    size = (W, H)
+    fps = FPS
+    caption = "Record Player"
+
+    @classmethod
+    def preload(cls, difficulty=3, needle_length=240):
+        request_record_frames(prefix=RECORD_PREFIX, count=8)
+
+    def __init__(self, screen, difficulty=3, needle_length=240):
+        self.screen = screen
+        self.font = get_font("arial", 44, bold=True)
+
+        # Difficulty
+        self.dot_radius = {1: 16, 2: 12, 3: 9}[difficulty]
+        self.hit_margin = {1: 10, 2: 8, 3: 6}[difficulty]
+        self.lower_speed = {1: 0.60, 2: 0.45, 3: 0.34}[difficulty]
+        self.spin_speed = {1: 1.1, 2: 1.6, 3: 2.2}[difficulty]
+
+        # --- Record animation frames ---
+        self.record_frames = load_record_frames(prefix=RECORD_PREFIX, count=8, target_diameter=None)
+        self.frame_count = len(self.record_frames)
+
+        # Record radius from image size
+        rw, rh = self.record_frames[0].get_size()
+        RECORD_R = min(rw, rh) // 2
+
+        # Animation timing
+        self.frame_time = 1.0 / 12.0
+
+        # --- OVAL DOT PATH SETTINGS ---
+        # User request: range 55 height and 100 width, oval motion.
+        # Treat as semi-axes: a = 100 (x radius), b = 55 (y radius).
+        OVAL_A = 100
+        OVAL_B = 55
+
+        # Keep dot fully inside the oval by shrinking axes by dot radius
+        self.a_in = max(1, OVAL_A - self.dot_radius)
+        self.b_in = max(1, OVAL_B - self.dot_radius)
+
+        # --- Needle placement: right of player, shorter needle ---
+        self.arm_len = float(needle_length)
+
+        # Place pivot to the right of the record image
+        self.pivot = (CENTER[0] + RECORD_R + 170, CENTER[1] - 10)
+
+        self.new_round()
+
+    def new_round(self):
+        self.spinning_angle = 0.0
+        self.lowering = False
+        self.needle_h = 1.0
+        self.won = False
+        self.lost = False
+        self.resolved = False
+        self.anim_t = 0.0
+        self.frame_idx = 0
+        # Dot phase random each round (random start angle on oval)
+        self.dot_phase = random.uniform(-math.pi, math.pi)  # random position on oval
+        self.contact = False
+        self.dpos = self.prev_dpos = self.dot_pos()
+        self.arm_ang, _ = self.tip_from_mouse(*pointer.get_pos())
+
+    def tip_from_mouse(self, mx, my):
         """
         Arm follows mouse but is clamped to a right-side range so it behaves like a tonearm.
         """
-        dx, dy = mx - pivot[0], my - pivot[1]
+        dx, dy = mx - self.pivot[0], my - self.pivot[1]
         ang = math.atan2(dy, dx)
 
         # Right-side-ish limits (tweak if you want more/less movement)
         ang = clamp(ang, -2.25, -0.15)
 
-        tip = (pivot[0] + math.cos(ang) * arm_len,
-               pivot[1] + math.sin(ang) * arm_len)
+        tip = (self.pivot[0] + math.cos(ang) * self.arm_len,
+               self.pivot[1] + math.sin(ang) * self.arm_len)
         return ang, tip
 
-    def dot_pos():
+    def dot_pos(self):
         """
         Dot moves around an oval centered on the record CENTER.
         It rotates continuously using spinning_angle, plus a random dot_phase per round.
         """
-        a = spinning_angle + dot_phase
-        return (CENTER[0] + math.cos(a) * a_in,
-                CENTER[1] + math.sin(a) * b_in)
-
-    new_round()
-
-    while True:
-        dt = clock.tick(FPS) / 1000.0
-
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    return won
-                if e.key == pygame.K_r:
-                    new_round()
-
-            if not resolved:
-                if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-                    lowering = True
-                if e.type == pygame.MOUSEBUTTONUP and e.button == 1:
-                    lowering = False
-
-        if not resolved:
-            spinning_angle = (spinning_angle + spin_speed * dt) % (math.tau)
-
-            if lowering:
-                needle_h = max(0.0, needle_h - lower_speed * dt)
+        a = self.spinning_angle + self.dot_phase
+        return (CENTER[0] + math.cos(a) * self.a_in,
+                CENTER[1] + math.sin(a) * self.b_in)
+
+    def handle(self, e):
+        if e.type == pygame.KEYDOWN:
+            if e.key == pygame.K_ESCAPE:
+                self.finish(self.won); return
+            if e.key == pygame.K_r:
+                self.new_round()
+
+        if not self.resolved:
+            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+                self.lowering = True
+            if e.type == pygame.MOUSEBUTTONUP and e.button == 1:
+                self.lowering = False
+
+    def update(self, dt):
+        if not self.resolved:
+            self.spinning_angle = (self.spinning_angle + self.spin_speed * dt) % (math.tau)
+
+            if self.lowering:
+                self.needle_h = max(0.0, self.needle_h - self.lower_speed * dt)
             else:
-                needle_h = min(1.0, needle_h + (lower_speed * 0.50) * dt)
+                self.needle_h = min(1.0, self.needle_h + (self.lower_speed * 0.50) * dt)
 
         # Record frame animation (loops forever)
-        anim_t += dt
-        frame_idx = int(anim_t / frame_time) % frame_count
+        self.anim_t += dt
+        self.frame_idx = int(self.anim_t / self.frame_time) % self.frame_count
 
-        mx, my = pygame.mouse.get_pos()
-        arm_ang, tip = tip_from_mouse(mx, my)
+        mx, my = pointer.get_pos()
+        self.arm_ang, tip = self.tip_from_mouse(mx, my)
 
-        contact = needle_h <= 0.06
-        dpos = dot_pos()
+        self.contact = self.needle_h <= 0.06
+        self.prev_dpos, self.dpos = self.dpos, self.dot_pos()
 
         # Win/lose once at contact moment while lowering
-        if not resolved and contact and lowering:
-            if dist(tip, dpos) <= (dot_radius + hit_margin):
-                won = True
+        if not self.resolved and self.contact and self.lowering:
+            if dist(tip, self.dpos) <= (self.dot_radius + self.hit_margin):
+                self.won = True
             else:
-                lost = True
-            resolved = True
-            lowering = False
+                self.lost = True
+            self.resolved = True
+            self.lowering = False
 
-        # --- Draw ---
+    def draw(self):
+        screen = self.screen
         screen.fill(BG)
 
         # Record image centered
-        frame = record_frames[frame_idx]
+        frame = self.record_frames[self.frame_idx]
         screen.blit(frame, frame.get_rect(center=CENTER))
 
         # Moving dot on oval path
-        pygame.draw.circle(screen, DOT, (int(dpos[0]), int(dpos[1])), dot_radius)
+        dx = self.lerp(self.prev_dpos[0], self.dpos[0])
+        dy = self.lerp(self.prev_dpos[1], self.dpos[1])
+        pygame.draw.circle(screen, DOT, (int(dx), int(dy)), self.dot_radius)
 
         # Arm + needle (shorter and placed on right)
-        arm_end = (pivot[0] + math.cos(arm_ang) * arm_len,
-                   pivot[1] + math.sin(arm_ang) * arm_len)
+        pivot, arm_ang = self.pivot, self.arm_ang
+        arm_end = (pivot[0] + math.cos(arm_ang) * self.arm_len,
+                   pivot[1] + math.sin(arm_ang) * self.arm_len)
         arm_end_i = (int(arm_end[0]), int(arm_end[1]))
 
         pivot_i = (int(pivot[0]), int(pivot[1]))
         pygame.draw.circle(screen, ARM, pivot_i, 14)
         pygame.draw.line(screen, ARM, pivot_i, arm_end_i, 10)
 
-        tip_draw = (arm_end[0], arm_end[1] - (22 * needle_h))
+        tip_draw = (arm_end[0], arm_end[1] - (22 * self.needle_h))
         tip_draw_i = (int(tip_draw[0]), int(tip_draw[1]))
-        pygame.draw.circle(screen, NEEDLE, tip_draw_i, 9 if not contact else 6)
+        pygame.draw.circle(screen, NEEDLE, tip_draw_i, 9 if not self.contact else 6)
 
-        if won:
-            t = font.render("LEVEL COMPLETE", True, GREEN)
+        if self.won:
+            t = render_text(self.font, "LEVEL COMPLETE", GREEN)
             screen.blit(t, t.get_rect(center=(W // 2, 60)))
-        elif lost:
-            t = font.render("TRY AGAIN", True, RED)
+        elif self.lost:
+            t = render_text(self.font, "TRY AGAIN", RED)
             screen.blit(t, t.get_rect(center=(W // 2, 60)))
 
-        pygame.display.flip()
+def record_player_game(difficulty=3, needle_length=240):
+    manager = get_manager()
+    return manager.run(RecordPlayerGame(manager.screen, difficulty, needle_length))
 
 if __name__ == "__main__":
     record_player_game(difficulty=3, needle_length=240)
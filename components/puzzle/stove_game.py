@@ -4,12 +4,52 @@ import os
 import math
 import random
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general import pointer
+from general.dirty import DamageTracker
+from general.assets import get_assets
+from components.geometry import ring_dist
+
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 800, 1000 
 FPS = 60
 PIXEL_SIZE = 4 
+SPRITE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'stove_burner.png')
+BURNER_CENTER = (WIDTH // 2, 320)
+
+# Pixel circles never change shape, so each (radius, color, width) is rasterised once
+_pixel_circles = {}
+
+def pixel_circle_surface(radius, color, width=0):
+    key = (radius, tuple(color), width)
+    surf = _pixel_circles.get(key)
+    if surf is None:
+        surf = pygame.Surface((radius * 2 + PIXEL_SIZE * 2, radius * 2 + PIXEL_SIZE * 2), pygame.SRCALPHA)
+        for x in range(-radius, radius + PIXEL_SIZE, PIXEL_SIZE):
+            for y in range(-radius, radius + PIXEL_SIZE, PIXEL_SIZE):
+                dist = math.sqrt(x*x + y*y)
+                if width == 0: 
+                    if dist <= radius:
+                        pygame.draw.rect(surf, color, (radius + x, radius + y, PIXEL_SIZE, PIXEL_SIZE))
+                else: 
+                    if radius - width <= dist <= radius:
+                        pygame.draw.rect(surf, color, (radius + x, radius + y, PIXEL_SIZE, PIXEL_SIZE))
+        _pixel_circles[key] = surf
+    return surf
+
+class StoveGame(Scene):
+    caption = "Stove Calibration Lab"
+    dirty_rects = True
+
+    @classmethod
+    def preload(cls):
+        get_assets().request(SPRITE_PATH, (450, 450))
 
-class StoveGame:
     def __init__(self, screen):
         self.screen = screen
         self.game_cleared = False
@@ -18,12 +58,8 @@ class StoveGame:
         self.device = "Computer"
         
         # --- 1. SPRITE LOADING ---
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        img_path = os.path.join(base_path, 'assets', 'stove_burner.png')
-        
         try:
-            raw_img = pygame.image.load(img_path).convert_alpha()
-            self.stove_img = pygame.transform.scale(raw_img, (450, 450))
+            self.stove_img = get_assets().get(SPRITE_PATH, (450, 450))
             self.stove_rect = self.stove_img.get_rect(center=(WIDTH // 2, 320))
         except:
             print("Sprite 'stove_burner.png' not found. Using pixel fallback.")
@@ -40,57 +76,91 @@ class StoveGame:
         self.center = (WIDTH // 2, HEIGHT // 2 + 150)
         self.knob_radius = 100
         self.toggle_rect = pygame.Rect(20, 20, 160, 40)
+        self.damage_tracker = DamageTracker()
 
     def draw_pixel_circle(self, center, radius, color, width=0):
-        for x in range(-radius, radius + PIXEL_SIZE, PIXEL_SIZE):
-            for y in range(-radius, radius + PIXEL_SIZE, PIXEL_SIZE):
-                dist = math.sqrt(x*x + y*y)
-                if width == 0: 
-                    if dist <= radius:
-                        pygame.draw.rect(self.screen, color, (center[0] + x, center[1] + y, PIXEL_SIZE, PIXEL_SIZE))
-                else: 
-                    if radius - width <= dist <= radius:
-                        pygame.draw.rect(self.screen, color, (center[0] + x, center[1] + y, PIXEL_SIZE, PIXEL_SIZE))
+        self.screen.blit(pixel_circle_surface(radius, color, width), (center[0] - radius, center[1] - radius))
+
+    def burner_state(self):
+        """Glow alpha (sprite) or burner color (pixel fallback) for the current knob angle."""
+        dist_to_target = abs((self.current_angle - self.target_angle + 180) % 360 - 180)
+        if self.stove_img:
+            if not (dist_to_target < 60 or self.game_cleared):
+                return None
+            # Full brightness if won or very close
+            if self.game_cleared or dist_to_target <= self.tolerance:
+                return 180
+            return int(150 * (1 - (dist_to_target / 60)))
+
+        if self.game_cleared or dist_to_target < 10:
+            return (255, 60, 0)
+        elif dist_to_target < 60:
+            return (int(100 * (1 - dist_to_target/60)), 20, 10)
+        return (35, 35, 40)
+
+    def idle(self):
+        # The knob eases toward the pointer while dragged; the DONE overlay waits on a timer
+        return not self.is_dragging and not (self.game_cleared and not self.show_done_overlay)
+
+    def damage(self):
+        r = self.knob_radius + 6
+        knob = pygame.Rect(self.center[0] - r, self.center[1] - r, r * 2 + PIXEL_SIZE * 2, r * 2 + PIXEL_SIZE * 2)
+        if self.stove_img:
+            burner = self.stove_rect
+        else:
+            burner = pygame.Rect(0, 0, 160 * 2 + PIXEL_SIZE * 2, 160 * 2 + PIXEL_SIZE * 2)
+            burner.topleft = (BURNER_CENTER[0] - 160, BURNER_CENTER[1] - 160)
+        items = {
+            "knob": (self.current_angle, knob),
+            "burner": (self.burner_state(), burner),
+            "toggle": (self.device, self.toggle_rect),
+            "overlay": (self.show_done_overlay, self.screen.get_rect() if self.show_done_overlay else None),
+        }
+        return self.damage_tracker.diff(items)
 
     def get_angle_from_pos(self, pos):
         dx = pos[0] - self.center[0]
         dy = pos[1] - self.center[1]
         return (math.degrees(math.atan2(dy, dx)) + 90) % 360
 
-    def handle_input(self, event):
-        mx, my = pygame.mouse.get_pos()
-        dist = math.hypot(mx - self.center[0], my - self.center[1])
-        
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish(self.game_cleared); return
+
+        mx, my = pointer.get_pos()
+
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.toggle_rect.collidepoint(event.pos):
                 self.device = "iPad" if self.device == "Computer" else "Computer"
                 self.path_width = 75 if self.device == "iPad" else 45
                 return
-            if not self.game_cleared and abs(dist - self.knob_radius) < 35:
+            if not self.game_cleared and ring_dist((mx, my), self.center, self.knob_radius) < 35:
                 self.is_dragging = True
+                pointer.take_samples()  # the drag starts here, not where the pointer came from
 
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.is_dragging:
                 # Success Check
                 if abs(self.current_angle - self.target_angle) <= self.tolerance:
                     self.game_cleared = True
-                    self.clear_timer = pygame.time.get_ticks() # Start the delay timer
+                    self.clear_timer = self.manager.ticks # Start the delay timer
                 else:
                     self.current_angle = 0 
             self.is_dragging = False
 
-    def update(self):
+    def update(self, dt=0.0):
         # 1. Handle Knob Rotation
+        samples = pointer.take_samples()
         if self.is_dragging and not self.game_cleared:
-            mx, my = pygame.mouse.get_pos()
-            dist = math.hypot(mx - self.center[0], my - self.center[1])
-            
-            # Reset if cursor leaves the circular track
-            if abs(dist - self.knob_radius) > self.path_width:
-                self.is_dragging = False
-                self.current_angle = 0 
-                return
+            # Reset if cursor leaves the circular track (checked for every sample, so a
+            # fast swipe cutting across the middle between frames still counts)
+            for p in samples + [pointer.get_pos()]:
+                if ring_dist(p, self.center, self.knob_radius) > self.path_width:
+                    self.is_dragging = False
+                    self.current_angle = 0 
+                    return
 
+            mx, my = pointer.get_pos()
             target_angle = self.get_angle_from_pos((mx, my))
             diff = (target_angle - self.current_angle + 180) % 360 - 180
             if abs(diff) < 30: 
@@ -98,7 +168,7 @@ class StoveGame:
 
         # 2. Handle the "DONE!" Delay
         if self.game_cleared and not self.show_done_overlay:
-            if pygame.time.get_ticks() - self.clear_timer > 800: # 800ms delay
+            if self.manager.ticks - self.clear_timer > 800: # 800ms delay
                 self.show_done_overlay = True
 
     def draw(self):
@@ -109,15 +179,9 @@ class StoveGame:
             self.screen.blit(self.stove_img, self.stove_rect)
             
             # Real-time Proximity Glow
-            dist_to_target = abs((self.current_angle - self.target_angle + 180) % 360 - 180)
-            if dist_to_target < 60 or self.game_cleared:
+            max_alpha = self.burner_state()
+            if max_alpha is not None:
                 glow_surf = pygame.Surface((450, 450), pygame.SRCALPHA)
-                
-                # Full brightness if won or very close
-                if self.game_cleared or dist_to_target <= self.tolerance:
-                    max_alpha = 180
-                else:
-                    max_alpha = int(150 * (1 - (dist_to_target / 60)))
 
                 for r in range(160, 0, -15):
                     ring_alpha = min(max_alpha, (160 - r) + (max_alpha // 2))
@@ -125,18 +189,11 @@ class StoveGame:
                 self.screen.blit(glow_surf, self.stove_rect)
         else:
             # Fallback Pixel Burner
-            burner_center = (WIDTH // 2, 320)
-            dist_to_target = abs((self.current_angle - self.target_angle + 180) % 360 - 180)
+            burner_center = BURNER_CENTER
             for r in [160, 120, 80]:
                 self.draw_pixel_circle(burner_center, r, (20, 20, 22), width=10)
             
-            if self.game_cleared or dist_to_target < 10:
-                color = (255, 60, 0)
-            elif dist_to_target < 60:
-                color = (int(100 * (1 - dist_to_target/60)), 20, 10)
-            else:
-                color = (35, 35, 40)
-            self.draw_pixel_circle(burner_center, 40, color)
+            self.draw_pixel_circle(burner_center, 40, self.burner_state())
 
         # --- TARGET ---
         t_rad = math.radians(self.target_angle - 90)
@@ -156,8 +213,8 @@ class StoveGame:
 
         # --- UI ---
         pygame.draw.rect(self.screen, (30, 32, 35), self.toggle_rect, border_radius=10)
-        font = pygame.font.SysFont(None, 24)
-        mode_text = font.render(f"Mode: {self.device}", True, (255, 255, 255))
+        font = get_font(None, 24)
+        mode_text = render_text(font, f"Mode: {self.device}", (255, 255, 255))
         self.screen.blit(mode_text, (self.toggle_rect.x + 15, self.toggle_rect.y + 10))
 
         # --- DELAYED OVERLAY ---
@@ -165,24 +222,13 @@ class StoveGame:
             overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, 180))
             self.screen.blit(overlay, (0,0))
-            big_font = pygame.font.SysFont(None, 120)
-            done_text = big_font.render("DONE!", True, (0, 255, 127))
+            big_font = get_font(None, 120)
+            done_text = render_text(big_font, "DONE!", (0, 255, 127))
             self.screen.blit(done_text, done_text.get_rect(center=(WIDTH//2, HEIGHT//2)))
 
 def main():
-    pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Stove Calibration Lab")
-    clock = pygame.time.Clock()
-    game = StoveGame(screen)
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-            game.handle_input(event)
-        game.update()
-        game.draw()
-        pygame.display.flip()
-        clock.tick(FPS)
+    manager = get_manager()
+    return manager.run(StoveGame(manager.screen))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,173 @@
+import pygame
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from general.bake import BakedIndex
+
+# --- CONFIGURATION ---
+WORKERS = 4
+PUMP_BUDGET_MS = 2.0  # main-thread conversion time allowed per frame
+
+
+def target_size(src_size, size=None, width=None, height=None):
+    """Final pixel size for a load request (None = keep the source size)."""
+    w, h = src_size
+    if size is not None:
+        return (int(size[0]), int(size[1]))
+    if width is not None:
+        return (int(width), int(width * (h / w)))
+    if height is not None:
+        return (int(w * (height / h)), int(height))
+    return None
+
+
+def scale(img, size, smooth):
+    if size is None or size == img.get_size():
+        return img
+    if smooth:
+        return pygame.transform.smoothscale(img, size)
+    return pygame.transform.scale(img, size)
+
+
+def decode(path, size, width, height, smooth, colorkey, baked=None):
+    """
+    Worker-thread half of a load: baked blob lookup, else PNG decode + scaling.
+    Returns (surface, size still to apply after conversion).
+    """
+    if baked is not None:
+        img = baked.lookup(path, size, width, height, smooth, colorkey)
+        if img is not None:
+            return img, None
+
+    img = pygame.image.load(path)
+    dest = target_size(img.get_size(), size, width, height)
+
+    # Images without alpha get the top-left pixel as their color key.
+    # Scaling has to wait until convert_alpha() has turned the key into alpha.
+    if colorkey and img.get_alpha() is None and (img.get_flags() & pygame.SRCALPHA) == 0:
+        img.set_colorkey(img.get_at((0, 0)))
+        return img, dest
+
+    # smoothscale only handles 24/32 bit surfaces
+    if smooth and img.get_bitsize() < 24:
+        return img, dest
+
+    return scale(img, dest, smooth), None
+
+
+class AssetHandle:
+    """A pending or finished image load. Callbacks always fire on the main thread."""
+    def __init__(self, key, future):
+        self.key = key
+        self.future = future
+        self.surface = None
+        self.error = None
+        self.callbacks = []
+
+    @property
+    def ready(self):
+        return self.surface is not None or self.error is not None
+
+    def when_ready(self, callback):
+        if self.ready:
+            callback(self)
+        else:
+            self.callbacks.append(callback)
+
+
+class AssetService:
+    """
+    Decodes and scales images on a thread pool while the current scene runs.
+    Only convert()/convert_alpha() happen on the main thread, either in pump()
+    (once per frame, time-boxed) or in get() if a scene needs an image right now.
+    """
+    def __init__(self, workers=WORKERS, use_baked=True):
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self.baked = BakedIndex() if use_baked else None
+        self.handles = {}
+        self.pending = []
+        self.jobs = {}   # submit() key -> Future
+        self.stats = {"requests": 0, "hits": 0, "stalls": 0}
+
+    def key(self, path, size=None, width=None, height=None, smooth=False, colorkey=False, alpha=True):
+        return (os.path.abspath(path), tuple(size) if size else None, width, height, smooth, colorkey, alpha)
+
+    def request(self, path, size=None, width=None, height=None, smooth=False, colorkey=False, alpha=True):
+        """Starts loading an image in the background and returns its AssetHandle."""
+        key = self.key(path, size, width, height, smooth, colorkey, alpha)
+        self.stats["requests"] += 1
+        handle = self.handles.get(key)
+        if handle is not None:
+            self.stats["hits"] += 1
+            return handle
+
+        future = self.pool.submit(decode, key[0], size, width, height, smooth, colorkey, self.baked)
+        handle = self.handles[key] = AssetHandle(key, future)
+        self.pending.append(handle)
+        return handle
+
+    def finish(self, handle):
+        try:
+            img, dest = handle.future.result()
+            alpha = handle.key[6]
+            img = img.convert_alpha() if alpha else img.convert()
+            handle.surface = scale(img, dest, handle.key[4])
+        except Exception as e:
+            handle.error = e
+        if handle in self.pending:
+            self.pending.remove(handle)
+        callbacks, handle.callbacks = handle.callbacks, []
+        for callback in callbacks:
+            callback(handle)
+
+    def pump(self, budget_ms=PUMP_BUDGET_MS):
+        """Converts finished decodes on the main thread. Call once per frame."""
+        if not self.pending:
+            return
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        for handle in [h for h in self.pending if h.future.done()]:
+            self.finish(handle)
+            if time.perf_counter() > deadline:
+                break
+
+    def get(self, path, size=None, width=None, height=None, smooth=False, colorkey=False, alpha=True):
+        """Returns the converted surface, blocking only if it was never preloaded."""
+        handle = self.request(path, size, width, height, smooth, colorkey, alpha)
+        if not handle.ready:
+            if not handle.future.done():
+                self.stats["stalls"] += 1
+            self.finish(handle)
+        if handle.error is not None:
+            raise handle.error
+        return handle.surface
+
+    def submit(self, key, fn, *args):
+        """
+        Runs fn(*args) on the pool once per key, for other slow loads (e.g. a
+        collision field) that a scene's preload() can start. -> its Future
+        """
+        future = self.jobs.get(key)
+        if future is None:
+            future = self.jobs[key] = self.pool.submit(fn, *args)
+        return future
+
+    def drop(self, path=None):
+        """Forgets cached surfaces (all of them, or every variant of one file)."""
+        if path is None:
+            self.handles.clear()
+            self.jobs.clear()
+            return
+        path = os.path.abspath(path)
+        for key in [k for k in self.handles if k[0] == path]:
+            del self.handles[key]
+
+
+_assets = None
+
+def get_assets():
+    """The process-wide AssetService (created on first use)."""
+    global _assets
+    if _assets is None:
+        _assets = AssetService()
+    return _assets
@@ -0,0 +1,173 @@
+"""
+Offline asset bake.
+
+Reads assets/manifest.json and writes every entry, already scaled and with its
+color key turned into alpha, as raw BGRA pixels under assets/baked/. Blob names
+are a content hash of the source PNG plus the load options, so a changed PNG
+or changed options can never pick up an old blob.
+
+At runtime the AssetService asks BakedIndex for a blob first and maps it with
+pygame.image.frombuffer over an mmap instead of decoding the PNG.
+
+    python general/bake.py            # bake everything in the manifest
+    python general/bake.py --clean    # drop blobs that are no longer referenced
+"""
+import pygame
+import sys
+import os
+import json
+import mmap
+import hashlib
+
+# --- PATH RESOLUTION ---
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(ROOT_DIR, "assets", "manifest.json")
+BAKED_DIR = os.path.join(ROOT_DIR, "assets", "baked")
+INDEX_PATH = os.path.join(BAKED_DIR, "index.json")
+
+BAKE_VERSION = 1
+PIXEL_FORMAT = "BGRA"  # byte order of a 32 bit display surface on little-endian devices
+
+
+def entry_key(path, size=None, width=None, height=None, smooth=False, colorkey=False):
+    """Index key for one load variant. Paths are stored relative to the repo root."""
+    rel = os.path.relpath(os.path.abspath(path), ROOT_DIR).replace(os.sep, "/")
+    size = list(size) if size else None
+    return json.dumps([rel, size, width, height, bool(smooth), bool(colorkey)])
+
+
+def content_hash(path, key):
+    h = hashlib.sha1()
+    h.update(f"v{BAKE_VERSION}|{PIXEL_FORMAT}|{key}|".encode())
+    with open(path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()[:20]
+
+
+def render(path, size=None, width=None, height=None, smooth=False, colorkey=False):
+    """Produces the exact pixels the PNG path would give, without needing a display."""
+    from general.assets import target_size, scale
+
+    img = pygame.image.load(path)
+    dest = target_size(img.get_size(), size, width, height)
+
+    # Flatten onto a 32 bit RGBA surface; a color key becomes real transparency here
+    flat = pygame.Surface(img.get_size(), pygame.SRCALPHA, 32)
+    if colorkey and img.get_alpha() is None and (img.get_flags() & pygame.SRCALPHA) == 0:
+        img.set_colorkey(img.get_at((0, 0)))
+        flat.blit(img, (0, 0))
+    else:
+        flat.blit(img, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    return scale(flat, dest, smooth)
+
+
+class BakedIndex:
+    """
+    Read side of the bake. lookup() is safe to call from the asset worker threads.
+    An entry whose source PNG changed on disk is dropped on first use.
+    """
+    def __init__(self, index_path=INDEX_PATH):
+        self.index_path = index_path
+        self.entries = {}
+        self.stats = {"hits": 0, "misses": 0, "stale": 0}
+        if os.path.exists(index_path):
+            try:
+                with open(index_path) as f:
+                    self.entries = json.load(f).get("entries", {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def is_fresh(self, key, entry, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_size == entry["source_size"] and int(st.st_mtime) == entry["source_mtime"]:
+            return True
+        # Touched but maybe not changed (e.g. a fresh checkout): fall back to the hash
+        return content_hash(path, key) == entry["hash"]
+
+    def lookup(self, path, size=None, width=None, height=None, smooth=False, colorkey=False):
+        """Returns a surface mapped straight from the blob, or None if there is no fresh blob."""
+        key = entry_key(path, size, width, height, smooth, colorkey)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if not self.is_fresh(key, entry, path):
+            self.stats["stale"] += 1
+            self.entries.pop(key, None)
+            return None
+
+        blob = os.path.join(os.path.dirname(self.index_path), entry["hash"] + ".raw")
+        try:
+            with open(blob, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return pygame.image.frombuffer(data, (entry["w"], entry["h"]), PIXEL_FORMAT)
+
+
+def load_manifest(path=MANIFEST_PATH):
+    with open(path) as f:
+        items = json.load(f)["assets"]
+    for item in items:
+        item["path"] = os.path.join(ROOT_DIR, item["path"])
+    return items
+
+
+def bake(manifest_path=MANIFEST_PATH, out_dir=BAKED_DIR, clean=False):
+    """Bakes every manifest entry that is missing or out of date. Returns the new index."""
+    os.makedirs(out_dir, exist_ok=True)
+    index_path = os.path.join(out_dir, "index.json")
+    old = BakedIndex(index_path).entries
+    entries = {}
+    baked = skipped = 0
+
+    for item in load_manifest(manifest_path):
+        path = item.pop("path")
+        if not os.path.exists(path):
+            print(f"missing source, skipped: {path}")
+            continue
+        key = entry_key(path, **item)
+        digest = content_hash(path, key)
+        blob = os.path.join(out_dir, digest + ".raw")
+
+        prev = old.get(key)
+        if prev and prev["hash"] == digest and os.path.exists(blob):
+            w, h = prev["w"], prev["h"]
+            skipped += 1
+        else:
+            surf = render(path, **item)
+            w, h = surf.get_size()
+            with open(blob + ".tmp", "wb") as f:
+                f.write(pygame.image.tobytes(surf, PIXEL_FORMAT))
+            os.replace(blob + ".tmp", blob)
+            baked += 1
+
+        st = os.stat(path)
+        entries[key] = {"hash": digest, "w": w, "h": h,
+                        "source_size": st.st_size, "source_mtime": int(st.st_mtime)}
+
+    with open(index_path + ".tmp", "w") as f:
+        json.dump({"version": BAKE_VERSION, "format": PIXEL_FORMAT, "entries": entries}, f, indent=1)
+    os.replace(index_path + ".tmp", index_path)
+
+    removed = 0
+    if clean:
+        keep = {e["hash"] + ".raw" for e in entries.values()}
+        for name in os.listdir(out_dir):
+            if name.endswith(".raw") and name not in keep:
+                os.remove(os.path.join(out_dir, name))
+                removed += 1
+
+    print(f"baked {baked}, up to date {skipped}, removed {removed} -> {out_dir}")
+    return entries
+
+
+if __name__ == "__main__":
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    bake(clean="--clean" in sys.argv[1:])
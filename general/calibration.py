@@ -0,0 +1,76 @@
+"""
+Latency calibration screen.
+
+Black screen that flashes white on every tap, click or key press. Point a
+photodiode or high-speed camera at it: each flash in the exported log has the
+perf_counter time of the poll and of the present that showed it, and
+clock_origin maps perf_counter to wall-clock time, so the measured light-up
+time gives the part of the chain after present() (compositor, scan-out, panel).
+
+    python general/calibration.py [--out latency_calibration.json]
+"""
+import os
+import sys
+import argparse
+
+import pygame
+
+# --- PATH RESOLUTION ---
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+
+# --- CONFIGURATION ---
+FLASH_FRAMES = 3
+DARK = (0, 0, 0)
+LIGHT = (255, 255, 255)
+TEXT_COLOR = (120, 120, 120)
+TRIGGERS = (pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN, pygame.KEYDOWN)
+
+
+class LatencyCalibration(Scene):
+    caption = "HIDDEN - Latency calibration"
+
+    def __init__(self):
+        self.flash = 0
+        self.flashes = 0
+        self.font = get_font("Arial", 24)
+
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish(self.flashes); return
+        if event.type in TRIGGERS:
+            # Light up on the very next present; the frame count only times the fade back
+            self.flash = FLASH_FRAMES
+            self.flashes += 1
+
+    def idle(self):
+        return self.flash == 0
+
+    def draw(self):
+        if self.flash:
+            self.screen.fill(LIGHT)
+            self.flash -= 1
+            return
+        self.screen.fill(DARK)
+        text = render_text(self.font, f"Tap to flash ({self.flashes} so far) - ESC to finish", TEXT_COLOR)
+        self.screen.blit(text, text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 40)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Input-to-present latency calibration")
+    parser.add_argument("--out", default="latency_calibration.json")
+    args = parser.parse_args(argv)
+
+    manager = get_manager()
+    manager.measure_latency(args.out, keep_log=True)
+    manager.run(LatencyCalibration())
+    manager.latency.export(args.out)
+    print(f"Latency report written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import pygame
+
+# --- CONFIGURATION ---
+FLASH_FRAMES = 8
+FLASH_COLOR = (255, 0, 255)
+
+
+def line_rect(start, end, width):
+    """Bounding rect of a thick line, padded for the stroke width."""
+    x0, y0 = min(start[0], end[0]), min(start[1], end[1])
+    x1, y1 = max(start[0], end[0]), max(start[1], end[1])
+    pad = width + 2
+    return pygame.Rect(int(x0) - pad, int(y0) - pad, int(x1 - x0) + pad * 2 + 1, int(y1 - y0) + pad * 2 + 1)
+
+
+class DamageTracker:
+    """
+    Compares what each on-screen element looked like last frame with this frame.
+    items: {name: (state, rect)} -> rects that need repainting (old and new position).
+    """
+    def __init__(self):
+        self.last = {}
+
+    def diff(self, items):
+        rects = []
+        for name, (state, rect) in items.items():
+            old = self.last.get(name)
+            if old is not None and old[0] == state and old[1] == rect:
+                continue
+            if old is not None and old[1]:
+                rects.append(pygame.Rect(old[1]))
+            if rect:
+                rects.append(pygame.Rect(rect))
+        for name in self.last.keys() - items.keys():
+            if self.last[name][1]:
+                rects.append(pygame.Rect(self.last[name][1]))
+        self.last = items
+        return rects
+
+    def reset(self):
+        self.last = {}
+
+
+class DirtyFlash:
+    """
+    Debug view: outlines every damaged rect for a few frames.
+    The outlines are painted right before the display update and the pixels
+    underneath are put back straight after, so they never leak into the scene.
+    """
+    def __init__(self, frames=FLASH_FRAMES):
+        self.frames = frames
+        self.recent = []
+        self.saved = []
+
+    def overlay(self, screen, rects):
+        """Draws the outlines and returns the rects they touched."""
+        bounds = screen.get_rect()
+        self.recent = [(r, ttl - 1) for r, ttl in self.recent if ttl > 1]
+        self.recent += [(pygame.Rect(r), self.frames) for r in (rects if rects is not None else [bounds])]
+
+        touched = []
+        for rect, ttl in self.recent:
+            area = rect.clip(bounds)
+            if not area.w or not area.h:
+                continue
+            self.saved.append((screen.subsurface(area).copy(), area))
+            color = [c * ttl // self.frames for c in FLASH_COLOR]
+            pygame.draw.rect(screen, color, area, 2)
+            touched.append(area)
+        return touched
+
+    def restore(self, screen):
+        """Puts the scene pixels back; returns rects to push with the next update."""
+        restored = []
+        for pixels, area in reversed(self.saved):
+            screen.blit(pixels, area)
+            restored.append(area)
+        self.saved = []
+        return restored
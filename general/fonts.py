@@ -0,0 +1,81 @@
+import pygame
+from collections import OrderedDict
+
+# --- CONFIGURATION ---
+TEXT_CACHE_SIZE = 256  # rendered surfaces kept before the least recently used is dropped
+
+
+class FontRegistry:
+    """One pygame Font per (name, size, bold, italic) for the whole process."""
+    def __init__(self):
+        self.fonts = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, name, size, bold=False, italic=False):
+        key = (name.lower() if name else None, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            self.stats["misses"] += 1
+            font = self.fonts[key] = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        else:
+            self.stats["hits"] += 1
+        return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color, antialias)."""
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.stats["hits"] += 1
+            self.surfaces.move_to_end(key)
+            return surf
+
+        self.stats["misses"] += 1
+        surf = self.surfaces[key] = font.render(text, antialias, color)
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+            self.stats["evictions"] += 1
+        return surf
+
+    def hit_rate(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+
+fonts = FontRegistry()
+text_cache = TextCache()
+enabled = True
+
+
+def get_font(name, size, bold=False, italic=False):
+    """Drop-in for pygame.font.SysFont that only looks the font up once."""
+    if not enabled:
+        return pygame.font.SysFont(name, size, bold=bold, italic=italic)
+    return fonts.get(name, size, bold, italic)
+
+
+def render_text(font, text, color, antialias=True):
+    """Drop-in for font.render(text, antialias, color) that reuses unchanged text."""
+    if not enabled:
+        return font.render(text, antialias, color)
+    return text_cache.render(font, text, color, antialias)
+
+
+def set_enabled(on):
+    """Turns both caches on or off (off = the old per-frame SysFont/render path)."""
+    global enabled
+    enabled = on
+
+
+def reset():
+    """Forgets every font and surface. Needed after pygame.quit(), which invalidates them."""
+    global fonts, text_cache
+    fonts = FontRegistry()
+    text_cache = TextCache(text_cache.capacity)
@@ -0,0 +1,66 @@
+import time
+
+import pygame
+
+# --- CONFIGURATION ---
+IDLE_AFTER = 0.5       # seconds without input (and nothing animating) before leaving full rate
+SLEEP_AFTER = 10.0     # seconds before the long wait
+IDLE_WAIT_MS = 100     # idle: wake ~10x a second for timers and asset uploads
+SLEEP_WAIT_MS = 1000   # sleep: wake once a second
+
+ACTIVE, IDLE, SLEEP = "active", "idle", "sleep"
+STATES = (ACTIVE, IDLE, SLEEP)
+
+
+class Governor:
+    """
+    Picks the power state for the next frame.
+    ACTIVE ticks the clock at the scene's fps. Once the scene reports idle()
+    and no input has arrived for IDLE_AFTER seconds, the manager blocks in
+    pygame.event.wait() instead (IDLE, then SLEEP), which returns the moment
+    any event arrives. Wall time spent in each state is summed per scene.
+    """
+    def __init__(self):
+        self.state = ACTIVE
+        self.last = self.quiet_since = time.perf_counter()
+        self.totals = {}  # (scene name, state) -> seconds
+        self.enabled = True
+
+    def note(self, scene, busy):
+        """Called once per frame; busy = input arrived or something outside the scene is animating."""
+        now = time.perf_counter()
+        key = (type(scene).__name__, self.state)
+        self.totals[key] = self.totals.get(key, 0.0) + now - self.last
+        self.last = now
+
+        if busy or not self.enabled or not scene.idle():
+            self.quiet_since = now
+            self.state = ACTIVE
+        elif now - self.quiet_since >= SLEEP_AFTER:
+            self.state = SLEEP
+        elif now - self.quiet_since >= IDLE_AFTER:
+            self.state = IDLE
+
+    def wake(self):
+        self.state = ACTIVE
+        self.quiet_since = time.perf_counter()
+
+    def wait(self):
+        """Blocks until an event arrives or the state's timeout runs out; returns that event, if any."""
+        event = pygame.event.wait(IDLE_WAIT_MS if self.state == IDLE else SLEEP_WAIT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        self.state = ACTIVE
+        return [event]
+
+    def report(self):
+        """Seconds per power state, per scene and in total."""
+        scenes = sorted({name for name, _ in self.totals})
+        lines = [f"{'power states (s)':<18}" + "".join(f"{s:>10}" for s in STATES)]
+        for name in scenes:
+            lines.append(f"{name:<18}" + "".join(f"{self.totals.get((name, s), 0.0):>10.1f}" for s in STATES))
+        totals = [sum(v for (_, s), v in self.totals.items() if s == state) for state in STATES]
+        whole = sum(totals) or 1.0
+        lines.append(f"{'total':<18}" + "".join(f"{t:>10.1f}" for t in totals))
+        lines.append(f"{'share':<18}" + "".join(f"{t / whole:>10.0%}" for t in totals))
+        return "\n".join(lines)
@@ -0,0 +1,152 @@
+import time
+from collections import deque
+
+import pygame
+
+from general.fonts import get_font
+from general.perf import SurfaceCounter, DrawCounter, CountingScreen, wrapper_cost
+
+# --- CONFIGURATION ---
+HUD_KEY = pygame.K_F3
+GRAPH_W, GRAPH_H = 180, 48
+GRAPH_MS = 33.3            # frame time at the top of the graph
+HITCH_WINDOW = 5.0         # seconds the "worst" line looks back
+TEXT_EVERY = 10            # frames between text refreshes
+PAD = 6
+BG_COLOR = (12, 12, 16)
+TEXT_COLOR = (220, 220, 220)
+FRAME_COLOR = (90, 90, 100)
+EVENT_COLOR = (240, 200, 60)
+UPDATE_COLOR = (80, 200, 120)
+DRAW_COLOR = (80, 150, 255)
+BUDGET_COLOR = (200, 60, 60)
+
+
+class PerfHUD:
+    """
+    Toggleable overlay (F3) fed by SceneManager.step() once per frame.
+    Shows a rolling frame-time graph (grey = whole frame, stacked colours =
+    events / update / draw), the blits, draw calls and Surface allocations of
+    the last frame, and the worst hitch of the last HITCH_WINDOW seconds.
+
+    To stay cheap the graph scrolls by one column per frame and the text is
+    only re-rendered every TEXT_EVERY frames. Blits are counted by handing
+    the scene a CountingScreen for the length of its draw(), draw calls by
+    wrapping pygame.draw. The "hud" figure is everything the HUD adds to a
+    frame: its bookkeeping, its panel and the wrappers' share of the draw.
+    """
+    def __init__(self, fps=60):
+        self.font = get_font("consolas", 14)
+        self.budget_ms = 1000.0 / fps
+        self.counter = SurfaceCounter()
+        self.counter.install()
+        self.draw_counter = DrawCounter()
+        self.draw_counter.install()
+        self.call_cost = wrapper_cost()
+        self.screen = None   # the CountingScreen the current scene draws on
+        self.spent = 0.0     # s of HUD work so far this frame
+
+        self.graph = pygame.Surface((GRAPH_W, GRAPH_H))
+        self.graph.fill(BG_COLOR)
+        self.hitches = deque()  # (time, frame_ms)
+        self.lines = []
+        self.frames = 0
+
+        self.blits = self.draws = 0
+        self.last = {"frame": 0.0, "events": 0.0, "update": 0.0, "draw": 0.0,
+                     "blits": 0, "draws": 0, "allocs": 0, "alloc_bytes": 0}
+        self.cost_ms = 0.0
+
+        line_h = self.font.get_linesize()
+        self.rect = pygame.Rect(0, 0, GRAPH_W + PAD * 2, GRAPH_H + line_h * 4 + PAD * 3)
+
+    def close(self):
+        self.counter.uninstall()
+        self.draw_counter.uninstall()
+
+    # --- COUNTING ---
+    def begin_draw(self, scene):
+        start = time.perf_counter()
+        self.screen = CountingScreen(scene.screen)
+        scene.screen = self.screen
+        self.draws = self.draw_counter.count
+        self.spent += time.perf_counter() - start
+
+    def end_draw(self, scene):
+        start = time.perf_counter()
+        scene.screen = self.screen.surface
+        self.blits = self.screen.count
+        self.draws = self.draw_counter.count - self.draws
+        self.screen = None
+        self.spent += time.perf_counter() - start + (self.blits + self.draws) * self.call_cost
+
+    # --- FRAME DATA ---
+    def record(self, frame_ms, events_s, update_s, draw_s):
+        """Called once per frame with the raw clock.tick() value and the three phase times."""
+        start = time.perf_counter()
+        allocs, alloc_bytes = self.counter.take()
+        last = self.last
+        last["frame"] = frame_ms
+        last["events"] = events_s * 1000
+        last["update"] = update_s * 1000
+        last["draw"] = draw_s * 1000
+        last["blits"], last["draws"] = self.blits, self.draws
+        last["allocs"], last["alloc_bytes"] = allocs, alloc_bytes
+
+        now = time.perf_counter()
+        hitches = self.hitches
+        hitches.append((now, frame_ms))
+        while hitches[0][0] < now - HITCH_WINDOW:
+            hitches.popleft()
+
+        self.add_column()
+        self.frames += 1
+        self.spent += time.perf_counter() - start
+
+    def add_column(self):
+        g = self.graph
+        g.scroll(-1, 0)
+        x = GRAPH_W - 1
+        g.fill(BG_COLOR, (x, 0, 1, GRAPH_H))
+        scale = GRAPH_H / GRAPH_MS
+        y = GRAPH_H
+        h = min(GRAPH_H, int(self.last["frame"] * scale))
+        g.fill(FRAME_COLOR, (x, GRAPH_H - h, 1, h))
+        for phase, color in (("events", EVENT_COLOR), ("update", UPDATE_COLOR), ("draw", DRAW_COLOR)):
+            h = int(self.last[phase] * scale + 0.5)
+            if h and y > 0:
+                g.fill(color, (x, y - h, 1, h))
+                y -= h
+        g.set_at((x, GRAPH_H - int(self.budget_ms * scale)), BUDGET_COLOR)
+
+    def refresh_text(self):
+        last = self.last
+        worst = max(ms for _, ms in self.hitches) if self.hitches else 0.0
+        fps = 1000.0 / last["frame"] if last["frame"] else 0.0
+        texts = [
+            f"frame {last['frame']:5.1f} ms  {fps:4.0f} fps  hud {self.cost_ms:.2f}",
+            f"evt {last['events']:.2f}  upd {last['update']:.2f}  draw {last['draw']:.2f}",
+            f"blits {last['blits']}  draws {last['draws']}  allocs {last['allocs']} ({last['alloc_bytes'] // 1024} KB)",
+            f"worst {worst:5.1f} ms in last {HITCH_WINDOW:.0f} s",
+        ]
+        self.lines = [self.font.render(t, True, TEXT_COLOR) for t in texts]
+
+    # --- DRAWING ---
+    def draw(self, screen):
+        """Paints the panel in the top-right corner and returns the rect it covers."""
+        start = time.perf_counter()
+        if self.frames % TEXT_EVERY == 1 or not self.lines:
+            self.refresh_text()
+
+        self.rect.topright = (screen.get_width(), 0)
+        x, y = self.rect.x + PAD, self.rect.y + PAD
+        screen.fill(BG_COLOR, self.rect)
+        for line in self.lines:
+            screen.blit(line, (x, y))
+            y += self.font.get_linesize()
+        screen.blit(self.graph, (x, y + PAD))
+
+        # Previous record() + this frame's draw wrappers + this panel
+        self.cost_ms = (self.spent + time.perf_counter() - start) * 1000
+        self.spent = 0.0
+        return self.rect
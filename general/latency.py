@@ -0,0 +1,85 @@
+import json
+import time
+from collections import deque
+
+import pygame
+
+from general.perf import percentile
+
+# --- CONFIGURATION ---
+MAX_SAMPLES = 20000   # per (scene, input kind); oldest dropped first
+
+INPUT_KINDS = {
+    pygame.MOUSEBUTTONDOWN: "press",
+    pygame.FINGERDOWN: "press",
+    pygame.MOUSEBUTTONUP: "release",
+    pygame.FINGERUP: "release",
+    pygame.MOUSEMOTION: "motion",
+    pygame.FINGERMOTION: "motion",
+    pygame.KEYDOWN: "key",
+}
+
+
+class LatencyProbe:
+    """
+    Input-to-present timing. SceneManager reports when it pulled each input
+    event off the queue (polled) and when the next frame went out (presented).
+
+    pygame does not expose OS event timestamps, so an event is only known to
+    have arrived between the previous poll and this one. Both bounds are kept:
+    "poll" = this poll -> present (best case), "queued" = previous poll ->
+    present (worst case). The true value lies in between. When the manager
+    was blocked in pygame.event.wait() the event woke it, so both bounds match.
+    """
+    def __init__(self, keep_log=False):
+        self.samples = {}          # (scene, kind) -> deque of (poll_ms, queued_ms)
+        self.pending = []          # (scene, kind, prev_poll, poll, event)
+        self.last_poll = time.perf_counter()
+        self.log = [] if keep_log else None
+        # Lets external captures (camera, photodiode) be lined up with perf_counter times
+        self.clock_origin = {"perf_counter": time.perf_counter(), "wall": time.time()}
+
+    def polled(self, scene, events, now, woke=False):
+        """now = perf_counter() taken right after the events came off the queue."""
+        if woke:
+            self.last_poll = now
+        name = type(scene).__name__
+        for event in events:
+            kind = INPUT_KINDS.get(event.type)
+            if kind is not None:
+                self.pending.append((name, kind, self.last_poll, now, event))
+        self.last_poll = now
+
+    def presented(self):
+        if not self.pending:
+            return
+        now = time.perf_counter()
+        for name, kind, prev_poll, poll, event in self.pending:
+            key = (name, kind)
+            if key not in self.samples:
+                self.samples[key] = deque(maxlen=MAX_SAMPLES)
+            self.samples[key].append(((now - poll) * 1000, (now - prev_poll) * 1000))
+            if self.log is not None and kind != "motion":
+                self.log.append({"scene": name, "kind": kind, "event": pygame.event.event_name(event.type),
+                                 "prev_poll": prev_poll, "poll": poll, "present": now})
+        self.pending = []
+
+    def summary(self):
+        """{scene: {kind: {count, poll_ms: {p50, p95, p99}, queued_ms: {...}}}}"""
+        out = {}
+        for (name, kind), values in sorted(self.samples.items()):
+            polls = sorted(v[0] for v in values)
+            queued = sorted(v[1] for v in values)
+            out.setdefault(name, {})[kind] = {
+                "count": len(values),
+                "poll_ms": {f"p{p}": round(percentile(polls, p), 3) for p in (50, 95, 99)},
+                "queued_ms": {f"p{p}": round(percentile(queued, p), 3) for p in (50, 95, 99)},
+            }
+        return out
+
+    def export(self, path):
+        report = {"clock_origin": self.clock_origin, "scenes": self.summary()}
+        if self.log is not None:
+            report["events"] = self.log
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
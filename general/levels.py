@@ -0,0 +1,77 @@
+import os
+import importlib
+
+from general.start import get_manager
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BATHTUB_SPRITE = os.path.join(ROOT_DIR, "components", "puzzle", "bathtub.png")
+
+
+class Puzzle:
+    """
+    One registry entry. Name, title and constructor kwargs are known up front;
+    the module is only imported the first time scene_cls is asked for.
+    """
+    def __init__(self, name, module, class_name, title, kwargs=None):
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.title = title
+        self.kwargs = kwargs or {}
+        self._cls = None
+
+    @property
+    def loaded(self):
+        return self._cls is not None
+
+    @property
+    def scene_cls(self):
+        if self._cls is None:
+            self._cls = getattr(importlib.import_module(self.module), self.class_name)
+        return self._cls
+
+    def preload(self):
+        self.scene_cls.preload(**self.kwargs)
+
+    def build(self, screen):
+        return self.scene_cls(screen, **self.kwargs)
+
+    def __repr__(self):
+        return f"Puzzle({self.name!r}, {'loaded' if self.loaded else 'not loaded'})"
+
+
+REGISTRY = {}
+
+def register(name, module, class_name, title, **kwargs):
+    REGISTRY[name] = Puzzle(name, module, class_name, title, kwargs)
+
+def get_puzzle(name):
+    return REGISTRY[name]
+
+
+# Play order
+register("bathtub", "components.puzzle.bathtub_game", "BathtubGame", "Duck in the Tub",
+         sprite_path=BATHTUB_SPRITE, max_shots=12)
+register("record", "components.puzzle.record_game", "RecordPlayerGame", "Drop the Needle",
+         difficulty=3, needle_length=240)
+register("flyswatter", "components.puzzle.flyswatter_game", "FlySwatterGame", "Swat the Flies")
+register("iron", "components.puzzle.iron_game", "IronGame", "Iron the Path", difficulty=2)
+register("stove", "components.puzzle.stove_game", "StoveGame", "Turn the Stove Knob")
+register("clock", "components.puzzle.clock_game", "ClockGame", "Set the Clock")
+register("bookshelf", "components.puzzle.bookshelf_game", "BookCatcher", "Stack the Books")
+register("fridge", "components.puzzle.fridge_game", "WireGame", "Fix the Fridge Wires")
+register("mirror", "components.puzzle.mirror_game", "MirrorRoom", "Clean the Mirror")
+
+LEVELS = list(REGISTRY.values())
+
+
+def preload_level(index):
+    """Starts decoding a level's images in the background (no-op past the end)."""
+    if 0 <= index < len(LEVELS):
+        LEVELS[index].preload()
+
+
+def build_level(index, screen):
+    # Puzzles randomise in __init__, so the seed has to be set before construction
+    get_manager().seed_scene()
+    return LEVELS[index].build(screen)
@@ -0,0 +1,163 @@
+import time
+import pygame
+
+BaseSurface = pygame.Surface
+
+# Functions that hand back a freshly allocated Surface
+ALLOCATORS = [
+    (pygame.transform, "rotate"),
+    (pygame.transform, "rotozoom"),
+    (pygame.transform, "scale"),
+    (pygame.transform, "smoothscale"),
+    (pygame.transform, "flip"),
+    (pygame.mask, "from_surface"),
+]
+
+
+class CountingScreen:
+    """
+    Stands in for a scene's screen while it draws: counts blit()/blits() and
+    hands everything else to the real surface. Only calls made through
+    scene.screen are seen; blits between off-screen surfaces are not. It is
+    not a Surface itself, so the pygame.draw and ALLOCATORS wrappers unwrap
+    it with real_surface() before calling into C.
+    """
+    __slots__ = ("surface", "count")
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.count = 0
+
+    def blit(self, *args, **kwargs):
+        self.count += 1
+        return self.surface.blit(*args, **kwargs)
+
+    def blits(self, *args, **kwargs):
+        self.count += 1
+        return self.surface.blits(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.surface, name)
+
+
+def real_surface(obj):
+    """The Surface behind a CountingScreen (anything else is returned as is)."""
+    return obj.surface if type(obj) is CountingScreen else obj
+
+
+class DrawCounter:
+    """
+    Counts pygame.draw calls while installed by wrapping the module's
+    functions. The wrappers also unwrap a CountingScreen, since the C side
+    only takes real Surfaces.
+    """
+    def __init__(self):
+        self.count = 0
+        self.saved = []
+
+    def install(self):
+        if self.saved:
+            return
+        counter = self
+
+        def wrap(fn):
+            def counted(surface, *args, **kwargs):
+                counter.count += 1
+                return fn(real_surface(surface), *args, **kwargs)
+            return counted
+
+        for name in dir(pygame.draw):
+            fn = getattr(pygame.draw, name)
+            if not name.startswith("_") and callable(fn):
+                self.saved.append((name, fn))
+                setattr(pygame.draw, name, wrap(fn))
+
+    def uninstall(self):
+        for name, fn in self.saved:
+            setattr(pygame.draw, name, fn)
+        self.saved = []
+
+
+def wrapper_cost(n=2000):
+    """Seconds a counting wrapper adds to one call (timed on a 1x1 blit), so the HUD can own up to it."""
+    src, dest = BaseSurface((1, 1)), BaseSurface((1, 1))
+    screen = CountingScreen(dest)
+    start = time.perf_counter()
+    for _ in range(n):
+        dest.blit(src, (0, 0))
+    mid = time.perf_counter()
+    for _ in range(n):
+        screen.blit(src, (0, 0))
+    return max(0.0, (time.perf_counter() - mid) - (mid - start)) / n
+
+
+class SurfaceType(type):
+    """Metaclass of SurfaceCounter's stand-in class: every real Surface counts as an instance of it."""
+    def __instancecheck__(cls, obj):
+        return isinstance(obj, BaseSurface)
+
+    def __subclasscheck__(cls, sub):
+        return issubclass(sub, BaseSurface)
+
+
+class SurfaceCounter:
+    """
+    Counts Surface allocations made from Python while installed: pygame.Surface(...)
+    plus the pygame.transform/mask calls in ALLOCATORS. Text rendering and
+    Surface.copy()/convert() happen inside C and are not counted.
+
+    pygame.Surface(...) has no hook of its own, so install() does rebind
+    pygame.Surface, for every module, to a counting subclass. Its metaclass
+    keeps isinstance()/issubclass() against pygame.Surface true for surfaces
+    made in C (the display, convert(), font renders), but `type(s) is
+    pygame.Surface` and identity checks against the class are wrong until
+    uninstall(). Only install it for diagnostics (the HUD, benchmarks).
+    """
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.saved = []
+
+    def note(self, surf):
+        self.count += 1
+        if isinstance(surf, BaseSurface):
+            self.bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        return surf
+
+    def install(self):
+        if self.saved:
+            return
+        counter = self
+
+        class CountedSurface(BaseSurface, metaclass=SurfaceType):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                counter.note(self)
+
+        def wrap(fn):
+            return lambda surface, *args, **kwargs: counter.note(fn(real_surface(surface), *args, **kwargs))
+
+        self.saved.append((pygame, "Surface", pygame.Surface))
+        pygame.Surface = CountedSurface
+        for module, name in ALLOCATORS:
+            fn = getattr(module, name)
+            self.saved.append((module, name, fn))
+            setattr(module, name, wrap(fn))
+
+    def uninstall(self):
+        for module, name, fn in reversed(self.saved):
+            setattr(module, name, fn)
+        self.saved = []
+
+    def take(self):
+        """Returns (count, bytes) since the last take() and starts counting again."""
+        result = (self.count, self.bytes)
+        self.count = self.bytes = 0
+        return result
+
+
+def percentile(sorted_samples, p):
+    if not sorted_samples:
+        return 0.0
+    i = min(len(sorted_samples) - 1, int(round(p / 100.0 * (len(sorted_samples) - 1))))
+    return sorted_samples[i]
@@ -0,0 +1,154 @@
+import time
+
+import pygame
+
+# --- CONFIGURATION ---
+SAMPLE_CAPACITY = 256   # samples kept per ring (about 1 s of 240 Hz touch input)
+MAX_CONTACTS = 10       # fingers tracked at once
+
+
+class SampleRing:
+    """
+    Fixed-size history of (x, y, t) samples. Storage is allocated once;
+    push() only overwrites slots, so high-rate input never allocates.
+    """
+    def __init__(self, capacity=SAMPLE_CAPACITY):
+        self.capacity = capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.ts = [0.0] * capacity
+        self.clear()
+
+    def clear(self):
+        self.written = 0
+        self.read = 0
+
+    def push(self, x, y, t):
+        i = self.written % self.capacity
+        self.xs[i] = x
+        self.ys[i] = y
+        self.ts[i] = t
+        self.written += 1
+
+    def __len__(self):
+        return min(self.written, self.capacity)
+
+    def latest(self):
+        i = (self.written - 1) % self.capacity
+        return self.xs[i], self.ys[i]
+
+    def take(self):
+        """[(x, y), ...] pushed since the last take(), oldest first. Overflowed samples are lost."""
+        start = max(self.read, self.written - self.capacity)
+        c, xs, ys = self.capacity, self.xs, self.ys
+        out = [(xs[i % c], ys[i % c]) for i in range(start, self.written)]
+        self.read = self.written
+        return out
+
+
+class Pointer:
+    """
+    Mouse and touch state as seen through the event stream.
+    Scenes read this instead of pygame.mouse, so scripted or replayed events
+    move the cursor exactly like a real mouse does.
+
+    The primary pointer (the mouse, or the first finger down) has a position,
+    buttons and a trail of every sample since the scene last asked for them
+    (take_samples), so fast drags are not reduced to one point per frame.
+    Every finger also gets its own ring in `contacts`.
+    """
+    def __init__(self):
+        self.pos = (0, 0)
+        self.buttons = [False, False, False]
+        self.trail = SampleRing()
+        self.contacts = {}           # finger_id -> SampleRing
+        self.primary = None          # finger_id driving pos/buttons, None = mouse
+        self.free = [SampleRing() for _ in range(MAX_CONTACTS)]
+
+    def sample(self, pos, ring=None):
+        t = time.perf_counter()
+        if ring is not None:
+            ring.push(pos[0], pos[1], t)
+        self.trail.push(pos[0], pos[1], t)
+
+    def feed(self, event):
+        etype = event.type
+        if etype in (pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP):
+            self.feed_finger(event)
+            return
+        if etype not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            return
+        if getattr(event, "touch", False) and self.contacts:
+            # SDL's mouse copy of a finger we already track
+            return
+        self.pos = event.pos
+        self.sample(event.pos)
+        if etype != pygame.MOUSEMOTION and 1 <= event.button <= 3:
+            self.buttons[event.button - 1] = etype == pygame.MOUSEBUTTONDOWN
+
+    def feed_finger(self, event):
+        w, h = pygame.display.get_window_size() if pygame.display.get_init() else (1, 1)
+        pos = (int(event.x * w), int(event.y * h))
+        fid = event.finger_id
+
+        if event.type == pygame.FINGERDOWN:
+            ring = self.contacts.get(fid)
+            if ring is None:
+                if not self.free:
+                    return
+                ring = self.contacts[fid] = self.free.pop()
+                ring.clear()
+            if self.primary is None:
+                self.primary = fid
+                self.buttons[0] = True
+        ring = self.contacts.get(fid)
+        if ring is None:
+            return
+
+        if fid == self.primary:
+            self.pos = pos
+            self.sample(pos, ring)
+        else:
+            ring.push(pos[0], pos[1], time.perf_counter())
+
+        if event.type == pygame.FINGERUP:
+            self.free.append(self.contacts.pop(fid))
+            if fid == self.primary:
+                self.primary = None
+                self.buttons[0] = False
+
+    def take_samples(self):
+        """Every primary-pointer position since the last call (may be empty)."""
+        return self.trail.take()
+
+    def touches(self):
+        """{finger_id: (x, y)} for the fingers currently down."""
+        return {fid: ring.latest() for fid, ring in self.contacts.items()}
+
+    def sync(self):
+        """Starts from the real mouse state (only meaningful with a live window)."""
+        if pygame.display.get_init() and pygame.mouse.get_focused():
+            self.pos = pygame.mouse.get_pos()
+            self.buttons = list(pygame.mouse.get_pressed()[:3])
+
+    def reset(self, pos=(0, 0)):
+        self.pos = pos
+        self.buttons = [False, False, False]
+        self.free += self.contacts.values()
+        self.contacts = {}
+        self.primary = None
+        self.trail.clear()
+
+
+pointer = Pointer()
+
+def get_pos():
+    """Drop-in for pygame.mouse.get_pos()."""
+    return pointer.pos
+
+def get_pressed():
+    """Drop-in for pygame.mouse.get_pressed()."""
+    return tuple(pointer.buttons)
+
+def take_samples():
+    return pointer.take_samples()
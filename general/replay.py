@@ -0,0 +1,141 @@
+import struct
+
+import pygame
+
+# --- LOG FORMAT ---
+# header: MAGIC + version byte
+# b"S" seed:u32                          before a scene is built (random.seed(seed))
+# b"F" dt_ms:u16 count:u16               one per frame, followed by `count` events
+# event: kind:u8 + payload (see EVENTS)
+MAGIC = b"HDNREC"
+VERSION = 2
+
+SEED = struct.Struct("<I")
+FRAME = struct.Struct("<HH")
+
+# kind -> (pygame event type, payload struct)
+EVENTS = {
+    1: (pygame.MOUSEMOTION, struct.Struct("<hhB")),      # x, y, buttons bitmask (+ TOUCH_BIT)
+    2: (pygame.MOUSEBUTTONDOWN, struct.Struct("<hhB")),  # x, y, button (+ TOUCH_BIT)
+    3: (pygame.MOUSEBUTTONUP, struct.Struct("<hhB")),
+    4: (pygame.KEYDOWN, struct.Struct("<iH")),           # key, mod
+    5: (pygame.KEYUP, struct.Struct("<iH")),
+    6: (pygame.QUIT, struct.Struct("<")),
+    7: (pygame.FINGERDOWN, struct.Struct("<qff")),       # finger_id, x, y (0..1)
+    8: (pygame.FINGERMOTION, struct.Struct("<qff")),
+    9: (pygame.FINGERUP, struct.Struct("<qff")),
+}
+TOUCH_BIT = 0x80  # mouse event that SDL synthesised from a finger
+KINDS = {etype: kind for kind, (etype, _) in EVENTS.items()}
+
+
+def encode(event):
+    """Event -> bytes, or None for event types the puzzles never look at."""
+    kind = KINDS.get(event.type)
+    if kind is None:
+        return None
+    packer = EVENTS[kind][1]
+    touch = TOUCH_BIT if getattr(event, "touch", False) else 0
+    if kind == 1:
+        bits = sum(1 << i for i, down in enumerate(event.buttons[:3]) if down)
+        payload = packer.pack(event.pos[0], event.pos[1], bits | touch)
+    elif kind in (2, 3):
+        payload = packer.pack(event.pos[0], event.pos[1], event.button | touch)
+    elif kind in (4, 5):
+        payload = packer.pack(event.key, event.mod & 0xFFFF)
+    elif kind in (7, 8, 9):
+        payload = packer.pack(event.finger_id, event.x, event.y)
+    else:
+        payload = b""
+    return bytes((kind,)) + payload
+
+
+def decode(kind, payload):
+    etype, packer = EVENTS[kind]
+    values = packer.unpack(payload)
+    if kind == 1:
+        x, y, bits = values
+        buttons = tuple(bool(bits & (1 << i)) for i in range(3))
+        return pygame.event.Event(etype, pos=(x, y), rel=(0, 0), buttons=buttons, touch=bool(bits & TOUCH_BIT))
+    if kind in (2, 3):
+        x, y, button = values
+        return pygame.event.Event(etype, pos=(x, y), button=button & ~TOUCH_BIT, touch=bool(button & TOUCH_BIT))
+    if kind in (4, 5):
+        key, mod = values
+        return pygame.event.Event(etype, key=key, mod=mod, unicode="", scancode=0)
+    if kind in (7, 8, 9):
+        finger_id, x, y = values
+        return pygame.event.Event(etype, touch_id=0, finger_id=finger_id, x=x, y=y, dx=0.0, dy=0.0, pressure=1.0)
+    return pygame.event.Event(etype)
+
+
+class Recorder:
+    """
+    Writes the session to a compact binary log: every frame's dt and the
+    events the scenes saw, plus the RNG seed each scene was built with.
+    """
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.file.write(MAGIC + bytes((VERSION,)))
+        self.frames = 0
+
+    def seed(self, seed):
+        self.file.write(b"S" + SEED.pack(seed))
+
+    def frame(self, dt_ms, events):
+        encoded = [e for e in map(encode, events) if e is not None]
+        self.file.write(b"F" + FRAME.pack(min(dt_ms, 0xFFFF), len(encoded)))
+        self.file.write(b"".join(encoded))
+        self.frames += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class ReplayError(Exception):
+    pass
+
+
+class Replayer:
+    """
+    Reads a Recorder log back. next_frame() -> (dt_ms, events), or None at the end.
+    With fast=True the manager runs the frames back to back instead of at the
+    recorded pace.
+    """
+    def __init__(self, path, fast=False):
+        with open(path, "rb") as f:
+            self.data = f.read()
+        if self.data[:len(MAGIC)] != MAGIC or self.data[len(MAGIC)] != VERSION:
+            raise ReplayError(f"{path} is not a version {VERSION} replay log")
+        self.offset = len(MAGIC) + 1
+        self.fast = fast
+        self.frames = 0
+
+    def expect(self, tag):
+        if self.data[self.offset:self.offset + 1] != tag:
+            found = self.data[self.offset:self.offset + 1] or b"end of log"
+            raise ReplayError(f"replay out of sync at byte {self.offset}: expected {tag!r}, found {found!r}")
+        self.offset += 1
+
+    def next_seed(self):
+        self.expect(b"S")
+        (seed,) = SEED.unpack_from(self.data, self.offset)
+        self.offset += SEED.size
+        return seed
+
+    def next_frame(self):
+        if self.offset >= len(self.data):
+            return None
+        self.expect(b"F")
+        dt_ms, count = FRAME.unpack_from(self.data, self.offset)
+        self.offset += FRAME.size
+        events = []
+        for _ in range(count):
+            kind = self.data[self.offset]
+            size = EVENTS[kind][1].size
+            payload = self.data[self.offset + 1:self.offset + 1 + size]
+            events.append(decode(kind, payload))
+            self.offset += 1 + size
+        self.frames += 1
+        return dt_ms, events
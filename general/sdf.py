@@ -0,0 +1,258 @@
+"""
+Signed distance fields from sprite alpha.
+
+build() turns an image's alpha into a distance field: every pixel holds the
+distance to the nearest solid edge, negative inside. Pixels matching an
+optional water color are cut out of the solid and kept as a sensor mask, and
+with open_above the solid directly over the water is cut away as well, so a
+tub becomes a basin that can be fallen into.
+
+Fields are cached next to the image (bathtub.png -> bathtub.png.sdf, zlib
+compressed and checked in), keyed by a content hash of the PNG and the build
+options. Building needs NumPy, loading a fresh cache does not; the game only
+reads the cache, so after changing the sprite re-run this tool to rewrite it.
+
+    python general/sdf.py components/puzzle/bathtub.png --size 520 340 --water 150 117 160 --open-above
+"""
+import pygame
+import sys
+import os
+import json
+import math
+import struct
+import zlib
+import argparse
+from array import array
+
+# --- PATH RESOLUTION ---
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.bake import render, entry_key, content_hash
+
+# --- CONFIGURATION ---
+SDF_VERSION = 2
+MAGIC = b"HDNSDF"
+ALPHA_SOLID = 127      # same cut-off as pygame.mask.from_surface
+WATER_TOLERANCE = 40   # per channel
+MAX_DIST = 64          # distances are capped here; far away only a lower bound is needed
+PAD = 32               # empty margin kept around the sprite
+CONTACT = 0.5          # px; closer than this counts as touching
+SLIDE_STEP = 4.0       # px advanced per check while touching a surface and moving along or off it
+MAX_MARCH = 24         # sphere-tracing steps per sweep
+
+
+def distance_to(feature, cap=MAX_DIST):
+    """Euclidean distance from every pixel to the nearest True pixel, capped (NumPy bool array in)."""
+    import numpy as np
+    h, w = feature.shape
+    big = float(cap * cap)
+
+    # Columns first: squared vertical distance to the nearest feature in the same column
+    g = np.where(feature, 0.0, big)
+    for k in range(1, cap + 1):
+        d = float(k * k)
+        g[k:] = np.minimum(g[k:], np.where(feature[:-k], d, big))
+        g[:-k] = np.minimum(g[:-k], np.where(feature[k:], d, big))
+
+    # Then rows: min over horizontal offsets of k^2 + g
+    out = g.copy()
+    for k in range(1, cap + 1):
+        d = float(k * k)
+        out[:, k:] = np.minimum(out[:, k:], g[:, :-k] + d)
+        out[:, :-k] = np.minimum(out[:, :-k], g[:, k:] + d)
+    return np.sqrt(np.minimum(out, big))
+
+
+def build(path, size=None, smooth=True, water=None, tolerance=WATER_TOLERANCE, open_above=False):
+    """Builds the field for `path` scaled like the asset loader would. Returns a DistanceField."""
+    import numpy as np
+
+    surf = render(path, size=size, smooth=smooth)
+    alpha = pygame.surfarray.array_alpha(surf).T
+    solid = alpha > ALPHA_SOLID
+    wet = np.zeros_like(solid)
+    if water is not None:
+        # Largest patch of the water color, with each row filled edge to edge
+        # so highlights and ripples inside it count as water too
+        found = pygame.mask.from_threshold(surf, tuple(water) + (255,), (tolerance + 1,) * 3 + (255,))
+        patch = pygame.surfarray.array_red(found.connected_component().to_surface()).T > 0
+        for y in np.flatnonzero(patch.any(axis=1)):
+            xs = np.flatnonzero(patch[y])
+            wet[y, xs[0]:xs[-1] + 1] = True
+        wet &= solid
+        solid &= ~wet
+        if open_above:
+            # Clear the solid run sitting right on top of the water in each column
+            for x in np.flatnonzero(wet.any(axis=0)):
+                y = int(wet[:, x].argmax()) - 1
+                while y >= 0 and solid[y, x]:
+                    solid[y, x] = False
+                    y -= 1
+
+    solid = np.pad(solid, PAD)
+    wet = np.pad(wet, PAD)
+    outside = distance_to(solid)
+    inside = distance_to(~solid)
+    sdf = np.where(solid, 0.5 - inside, outside - 0.5).astype(np.float32)
+    h, w = sdf.shape
+    return DistanceField(w, h, array("f", sdf.tobytes()), bytes(wet.astype(np.uint8)))
+
+
+def cache_path(path):
+    return path + ".sdf"
+
+
+def load(path, size=None, smooth=True, water=None, tolerance=WATER_TOLERANCE, open_above=False, save=True):
+    """Cached build(): reads <path>.sdf when it matches the PNG and options, else builds it (and writes it if save)."""
+    options = [list(water) if water else None, tolerance, bool(open_above), PAD, MAX_DIST]
+    key = f"sdf{SDF_VERSION}|{entry_key(path, size, smooth=smooth)}|{json.dumps(options)}"
+    digest = content_hash(path, key)
+    cached = cache_path(path)
+
+    field = read(cached, digest)
+    if field is None:
+        field = build(path, size, smooth, water, tolerance, open_above)
+        if save:
+            write(cached, field, digest)
+    return field
+
+
+def read(cached, digest):
+    try:
+        with open(cached, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            n, = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(n))
+            if header["hash"] != digest:
+                return None
+            w, h = header["w"], header["h"]
+            data = zlib.decompress(f.read())
+    except (OSError, ValueError, KeyError, struct.error, zlib.error):
+        return None
+    if len(data) != w * h * 5:
+        return None
+    sdf = array("f")
+    sdf.frombytes(data[:w * h * 4])
+    wet = data[w * h * 4:]
+    return DistanceField(w, h, sdf, wet)
+
+
+def write(cached, field, digest):
+    header = json.dumps({"version": SDF_VERSION, "hash": digest, "w": field.w, "h": field.h, "pad": PAD}).encode()
+    try:
+        with open(cached + ".tmp", "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+            f.write(zlib.compress(field.sdf.tobytes() + bytes(field.wet), 9))
+        os.replace(cached + ".tmp", cached)
+    except OSError:
+        pass  # read-only install: just rebuild next time
+
+
+class DistanceField:
+    """
+    Runtime side: O(1) distance, normal and water lookups in screen coordinates
+    once place()d. Outside the stored grid the distance is a lower bound built
+    from the nearest border pixel, which is all sphere tracing needs.
+    """
+    def __init__(self, w, h, sdf, wet):
+        self.w, self.h = w, h
+        self.sdf = sdf
+        self.wet = wet
+        self.ox = self.oy = -PAD
+
+    def place(self, topleft):
+        """Puts the sprite's top-left corner at this screen position."""
+        self.ox, self.oy = topleft[0] - PAD, topleft[1] - PAD
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.ox + PAD, self.oy + PAD, self.w - 2 * PAD, self.h - 2 * PAD)
+
+    def distance(self, x, y):
+        """Signed distance from (x, y) to the nearest solid edge (negative inside), bilinear."""
+        gx, gy = x - self.ox - 0.5, y - self.oy - 0.5
+        w, h = self.w, self.h
+        cx = 0.0 if gx < 0 else (w - 1.0 if gx > w - 1 else gx)
+        cy = 0.0 if gy < 0 else (h - 1.0 if gy > h - 1 else gy)
+        ix, iy = min(int(cx), w - 2), min(int(cy), h - 2)
+        fx, fy = cx - ix, cy - iy
+        sdf = self.sdf
+        i = iy * w + ix
+        top = sdf[i] + (sdf[i + 1] - sdf[i]) * fx
+        bottom = sdf[i + w] + (sdf[i + w + 1] - sdf[i + w]) * fx
+        d = top + (bottom - top) * fy
+        if cx != gx or cy != gy:
+            return math.hypot(gx - cx, gy - cy, d)
+        return d
+
+    def normal(self, x, y):
+        """Unit gradient of the field: points away from the nearest surface."""
+        nx = self.distance(x + 1, y) - self.distance(x - 1, y)
+        ny = self.distance(x, y + 1) - self.distance(x, y - 1)
+        L = math.hypot(nx, ny)
+        return (0.0, -1.0) if L == 0 else (nx / L, ny / L)
+
+    def in_water(self, x, y):
+        gx, gy = int(x - self.ox), int(y - self.oy)
+        return 0 <= gx < self.w and 0 <= gy < self.h and self.wet[gy * self.w + gx] != 0
+
+    def sweep(self, x, y, dx, dy, r):
+        """
+        First contact of a circle of radius r at (x, y) moving by (dx, dy),
+        found by sphere tracing: each step advances by the free distance the
+        field reports, so open space is crossed in one or two lookups.
+        -> (f, nx, ny) like geometry.sweep_circle_rect, or None if it gets all
+        the way.
+        """
+        L = math.hypot(dx, dy)
+        if L == 0:
+            return None
+        f = 0.0
+        for _ in range(MAX_MARCH):
+            px, py = x + dx*f, y + dy*f
+            gap = self.distance(px, py) - r
+            if gap <= CONTACT:
+                nx, ny = self.normal(px, py)
+                if nx*dx + ny*dy < 0:
+                    return f, nx, ny
+                gap = SLIDE_STEP   # touching but moving along or away from it
+            f += gap / L
+            if f >= 1:
+                return None
+        return None
+
+    def overlap(self, x, y, r):
+        """-> (depth, nx, ny) if the circle is inside the surface by more than CONTACT, else None."""
+        depth = r - self.distance(x, y)
+        if depth <= CONTACT:
+            return None
+        return (depth,) + self.normal(x, y)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and cache a signed distance field from sprite alpha")
+    parser.add_argument("path")
+    parser.add_argument("--size", type=int, nargs=2)
+    parser.add_argument("--water", type=int, nargs=3, help="RGB of the water sensor pixels")
+    parser.add_argument("--tolerance", type=int, default=WATER_TOLERANCE)
+    parser.add_argument("--open-above", action="store_true")
+    parser.add_argument("--preview", help="write a PNG of the field here")
+    args = parser.parse_args(argv)
+
+    field = load(args.path, args.size, True, args.water, args.tolerance, args.open_above)
+    print(f"{cache_path(args.path)}: {field.w}x{field.h}")
+    if args.preview:
+        img = pygame.Surface((field.w, field.h))
+        for y in range(field.h):
+            for x in range(field.w):
+                d = field.sdf[y * field.w + x]
+                v = max(0, min(255, int(128 + d * 4)))
+                img.set_at((x, y), (60, 120, 255) if field.wet[y * field.w + x] else (v, v, v))
+        pygame.image.save(img, args.preview)
+
+
+if __name__ == "__main__":
+    main()
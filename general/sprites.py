@@ -0,0 +1,123 @@
+import pygame
+from collections import OrderedDict
+
+# --- CONFIGURATION ---
+ANGLE_STEP = 5.0                     # degrees between cached rotations
+SCALE_STEP = 0.05                    # scale buckets: 0.85, 0.90, ...
+SPRITE_CACHE_BYTES = 16 * 1024 * 1024  # pixel memory kept before the least recently used is dropped
+
+
+def quantize(angle, scale=1.0, step=ANGLE_STEP):
+    """(angle, scale) snapped to the buckets the cache stores them under."""
+    a = round(angle / step) * step % 360.0
+    s = round(scale / SCALE_STEP) * SCALE_STEP if scale != 1.0 else 1.0
+    return round(a, 3), round(s, 3)
+
+
+def transform(img, angle, scale):
+    """What a cache miss renders: smoothscale first, then rotate (same as the old per-frame draws)."""
+    if scale != 1.0:
+        w, h = img.get_size()
+        img = pygame.transform.smoothscale(img, (max(1, int(w * scale)), max(1, int(h * scale))))
+    return pygame.transform.rotate(img, angle) if angle else img
+
+
+class SpriteCache:
+    """
+    LRU cache of rotated/scaled copies of sprites keyed by (surface, angle
+    bucket, scale bucket). Bounded by pixel bytes rather than entries, since a
+    220px swatter costs as much as a hundred flies.
+    """
+    def __init__(self, budget=SPRITE_CACHE_BYTES):
+        self.budget = budget
+        self.bytes = 0
+        self.surfaces = OrderedDict()
+        self.masks = {}   # same keys, built on first use by mask()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, img, angle, scale=1.0, step=ANGLE_STEP):
+        key = (img,) + quantize(angle, scale, step)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.stats["hits"] += 1
+            self.surfaces.move_to_end(key)
+            return surf
+
+        self.stats["misses"] += 1
+        return self.store(key, transform(img, key[1], key[2]))
+
+    def store(self, key, surf):
+        self.surfaces[key] = surf
+        self.bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        while self.bytes > self.budget and len(self.surfaces) > 1:
+            old_key, old = self.surfaces.popitem(last=False)
+            self.masks.pop(old_key, None)
+            self.bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+            self.stats["evictions"] += 1
+        return surf
+
+    def mask(self, img, angle, scale=1.0, step=ANGLE_STEP):
+        """pygame.mask of the cached surface get() returns for the same arguments."""
+        key = (img,) + quantize(angle, scale, step)
+        mask = self.masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(self.get(img, angle, scale, step))
+            if key in self.surfaces:
+                self.masks[key] = mask
+        return mask
+
+    def prerender(self, img, angles, scales=(1.0,), step=ANGLE_STEP):
+        """Fills the cache ahead of time, e.g. from a scene's __init__, so the first frames don't miss."""
+        for scale in scales:
+            for angle in angles:
+                key = (img,) + quantize(angle, scale, step)
+                if key not in self.surfaces:
+                    self.store(key, transform(img, key[1], key[2]))
+
+    def hit_rate(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+
+sprites = SpriteCache()
+enabled = True
+
+
+def rotated(img, angle, scale=1.0, step=ANGLE_STEP):
+    """Drop-in for rotate(smoothscale(img, scale), angle) that reuses the nearest cached bucket."""
+    if not enabled:
+        return transform(img, angle, scale)
+    return sprites.get(img, angle, scale, step)
+
+
+def rotated_mask(img, angle, scale=1.0, step=ANGLE_STEP):
+    """Mask matching rotated(img, angle, scale, step), for pixel-accurate hit tests."""
+    if not enabled:
+        return pygame.mask.from_surface(transform(img, angle, scale))
+    return sprites.mask(img, angle, scale, step)
+
+
+def prerender(img, angles=None, scales=(1.0,), step=ANGLE_STEP):
+    """Pre-renders img at every angle bucket (or just the given angles) and scale."""
+    if not enabled:
+        return
+    if angles is None:
+        angles = [i * step for i in range(int(round(360 / step)))]
+    sprites.prerender(img, angles, scales, step)
+
+
+def scale_buckets(lo, hi):
+    """Every scale bucket between lo and hi, for prerender()."""
+    return [round(s * SCALE_STEP, 3) for s in range(int(round(lo / SCALE_STEP)), int(round(hi / SCALE_STEP)) + 1)]
+
+
+def set_enabled(on):
+    """Turns the cache on or off (off = transform on every draw, like before)."""
+    global enabled
+    enabled = on
+
+
+def reset():
+    """Forgets every cached surface. Needed after pygame.quit(), which invalidates them."""
+    global sprites
+    sprites = SpriteCache(sprites.budget)
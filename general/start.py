@@ -0,0 +1,387 @@
+import pygame
+import sys
+import os
+import time
+import random
+import argparse
+
+# --- PATH RESOLUTION ---
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from general.assets import get_assets
+from general.dirty import DirtyFlash
+from general.hud import PerfHUD, HUD_KEY
+from general.pointer import pointer
+from general.replay import Recorder, Replayer
+from general.governor import Governor, ACTIVE
+from general.latency import LatencyProbe
+
+# --- CONFIGURATION ---
+WIDTH, HEIGHT = 800, 1000
+FPS = 60
+SIM_RATE = 60      # simulation steps per second, independent of the render rate
+MAX_STEPS = 5      # per frame; past this the game slows down instead of spiralling
+DIRTY_DEBUG_KEY = pygame.K_F9
+CAPTION = "HIDDEN - Escape Room"
+
+
+class Scene:
+    """
+    Base class for everything the SceneManager can run (menu, puzzles, rooms).
+    Subclasses override the hooks they need; draw() paints onto self.screen.
+    """
+    size = (WIDTH, HEIGHT)
+    caption = CAPTION
+    fps = FPS
+    timestep = 1.0 / SIM_RATE
+    dirty_rects = False  # opt in by implementing damage()
+
+    screen = None
+    manager = None
+    finished = False
+    result = None
+    alpha = 1.0  # how far past the last update() this frame is drawn, in timesteps
+
+    @classmethod
+    def preload(cls, *args, **kwargs):
+        """Queues the scene's images on the AssetService before it is built."""
+        pass
+
+    def enter(self, manager):
+        self.manager = manager
+        self.screen = manager.screen
+        self.finished = False
+
+    def handle(self, event):
+        pass
+
+    def update(self, dt):
+        """Advances the simulation by one fixed step (dt is always self.timestep)."""
+        pass
+
+    def draw(self):
+        pass
+
+    def idle(self):
+        """
+        True when the scene would look the same next frame without input
+        (nothing animating, no timer pending). Lets the governor drop the frame rate.
+        """
+        return False
+
+    def lerp(self, prev, cur):
+        """Where to draw something that moved from prev to cur during the last step."""
+        return prev + (cur - prev) * self.alpha
+
+    def damage(self):
+        """
+        Dirty-rect scenes only: rects that changed since the last draw.
+        [] = nothing to repaint, None = repaint everything.
+        """
+        return None
+
+    def exit(self):
+        pass
+
+    def finish(self, result=None):
+        self.finished = True
+        self.result = result
+
+
+class SceneManager:
+    """
+    Owns the one display, clock and event pump for the whole game.
+    Switching scenes never re-initialises SDL: the window is only resized when
+    the next scene asks for a different size, so a transition costs one frame.
+    """
+    def __init__(self, size=(WIDTH, HEIGHT), caption=CAPTION):
+        pygame.init()
+        self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+        self.clock = pygame.time.Clock()
+        self.pointer = pointer
+        self.pointer.sync()
+        self.assets = get_assets()
+        self.scene = None
+        self.next_scene = None
+        self.accumulator = 0.0
+
+        # Dirty-rect rendering (only for scenes that opt in)
+        self.use_dirty_rects = True
+        self.full_redraw = True
+        self.flash = None
+        self.pending_rects = []
+        self.pixels_presented = 0
+
+        # Performance overlay (F3)
+        self.hud = None
+
+        # Game clock in ms (sum of frame times, so replays see the same timers)
+        self.ticks = 0
+        self.recorder = None
+        self.replayer = None
+
+        # Drops out of full frame rate while the scene is quiet
+        self.governor = Governor()
+
+        # Input -> present timing (off unless asked for)
+        self.latency = None
+        self.latency_path = None
+        self.woke = False  # last frame came out of a governor wait
+        self.polled_at = 0.0
+
+    def measure_latency(self, path, keep_log=False):
+        """Times every input event to the frame that presents it; written to `path` on quit."""
+        self.latency = LatencyProbe(keep_log)
+        self.latency_path = path
+
+    def record(self, path):
+        """Logs every frame's dt, events and scene seeds to `path` from now on."""
+        self.recorder = Recorder(path)
+        self.pointer.reset()
+
+    def replay(self, path, fast=False):
+        """Takes frames from a recorded log instead of the clock and the event queue."""
+        self.replayer = Replayer(path, fast)
+        self.pointer.reset()
+
+    def seed_scene(self):
+        """Seeds `random` right before a scene is built; the seed is logged when recording."""
+        if self.replayer:
+            seed = self.replayer.next_seed()
+        else:
+            seed = int.from_bytes(os.urandom(4), "little")
+        if self.recorder:
+            self.recorder.seed(seed)
+        random.seed(seed)
+        return seed
+
+    def quit(self):
+        if self.recorder:
+            self.recorder.close()
+        if self.replayer:
+            print(f"Replayed {self.replayer.frames} frames")
+        if self.latency:
+            self.latency.export(self.latency_path)
+            print(f"Latency report written to {self.latency_path}")
+        print(self.governor.report())
+        pygame.quit()
+        sys.exit()
+
+    def toggle_hud(self):
+        if self.hud:
+            self.hud.close()
+            self.hud = None
+        else:
+            self.hud = PerfHUD(FPS)
+        self.full_redraw = True
+
+    def switch(self, scene):
+        # Applied at the start of the next frame so a scene can switch from inside its own hooks
+        self.next_scene = scene
+
+    def apply_switch(self):
+        scene, self.next_scene = self.next_scene, None
+        if self.scene is not None:
+            self.scene.exit()
+        if tuple(scene.size) != self.screen.get_size():
+            self.screen = pygame.display.set_mode(scene.size)
+        pygame.display.set_caption(scene.caption)
+        scene.enter(self)
+        self.scene = scene
+        self.accumulator = 0.0
+        self.governor.wake()
+        self.full_redraw = True
+
+    def step(self):
+        """Runs exactly one frame: switch, events, update, draw, flip."""
+        fps = self.scene.fps if self.scene else FPS
+        frame_ms, events = self.next_frame(fps)
+        dt = frame_ms / 1000.0
+        self.ticks += frame_ms
+        self.assets.pump()
+
+        if self.next_scene is not None:
+            self.apply_switch()
+        scene = self.scene
+        if self.latency and self.replayer is None:
+            self.latency.polled(scene, events, self.polled_at, self.woke)
+
+        t0 = time.perf_counter()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.quit()
+            if event.type == pygame.KEYDOWN and event.key == DIRTY_DEBUG_KEY:
+                self.flash = None if self.flash else DirtyFlash()
+                self.full_redraw = True
+            if event.type == pygame.KEYDOWN and event.key == HUD_KEY:
+                self.toggle_hud()
+            self.pointer.feed(event)
+            scene.handle(event)
+            if scene.finished:
+                return
+
+        t1 = time.perf_counter()
+        self.advance(scene, dt)
+        if scene.finished:
+            return
+        busy = bool(events) or self.hud is not None or self.replayer is not None or bool(self.assets.pending)
+        self.governor.note(scene, busy)
+        if not busy and self.governor.state != ACTIVE and not self.full_redraw:
+            # Nothing moves and nothing arrived: the last frame is still on screen
+            return
+        t2 = time.perf_counter()
+        self.render(scene)
+        if self.hud:
+            self.hud.record(frame_ms, t1 - t0, t2 - t1, time.perf_counter() - t2)
+
+    def advance(self, scene, dt, max_steps=MAX_STEPS):
+        """
+        Runs scene.update() in fixed timesteps to cover `dt` seconds and sets
+        scene.alpha for drawing in between. Returns the number of steps run.
+        max_steps=None lets headless runs simulate ahead without a cap.
+        """
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= scene.timestep:
+            if max_steps is not None and steps == max_steps:
+                self.accumulator = 0.0
+                break
+            scene.update(scene.timestep)
+            self.accumulator -= scene.timestep
+            steps += 1
+            if scene.finished:
+                break
+        scene.alpha = self.accumulator / scene.timestep
+        return steps
+
+    def next_frame(self, fps):
+        """(ms since the last frame, events) from the live clock and queue, or from the replay log."""
+        if self.replayer is None:
+            self.woke = self.governor.state != ACTIVE
+            if not self.woke:
+                frame_ms = self.clock.tick(fps)
+                events = pygame.event.get()
+                self.polled_at = time.perf_counter()
+            else:
+                # Sleeps until input (or the state's timeout), then resumes at full rate
+                events = self.governor.wait()
+                self.polled_at = time.perf_counter()
+                frame_ms = self.clock.tick()
+                events += pygame.event.get()
+            if self.recorder:
+                self.recorder.frame(frame_ms, events)
+            return frame_ms, events
+
+        frame = self.replayer.next_frame()
+        if frame is None:
+            self.quit()
+        frame_ms, events = frame
+        self.clock.tick(0 if self.replayer.fast else 1000.0 / max(frame_ms, 1))
+        # Only closing the window and the debug overlays are taken from the live queue
+        live = [e for e in pygame.event.get() if e.type == pygame.QUIT
+                or (e.type == pygame.KEYDOWN and e.key in (DIRTY_DEBUG_KEY, HUD_KEY))]
+        return frame_ms, live + events
+
+    def render(self, scene):
+        rects = None
+        if scene.dirty_rects:
+            # Always ask, so the scene's damage tracking stays in step even on full redraws
+            rects = scene.damage()
+            if self.full_redraw or not self.use_dirty_rects:
+                rects = None
+        self.full_redraw = False
+
+        if self.hud:
+            self.hud.begin_draw(scene)
+        try:
+            if rects is None:
+                scene.draw()
+            elif rects:
+                # Everything is still drawn, but blits/fills only touch the damaged area
+                self.screen.set_clip(rects[0].unionall(rects[1:]))
+                scene.draw()
+                self.screen.set_clip(None)
+        finally:
+            if self.hud:
+                self.hud.end_draw(scene)
+        self.present(rects)
+
+    def present(self, rects):
+        """flip() for full frames, display.update(rects) for dirty-rect frames."""
+        if self.hud:
+            # Repainted every frame; the scene never redraws underneath it in dirty-rect mode
+            area = self.hud.draw(self.screen)
+            if rects is not None:
+                rects = rects + [area]
+        if self.flash:
+            touched = self.flash.overlay(self.screen, rects)
+            if rects is not None:
+                rects = rects + touched
+        if rects is None:
+            pygame.display.flip()
+            self.pending_rects = []
+            self.pixels_presented += self.screen.get_width() * self.screen.get_height()
+        else:
+            rects = rects + self.pending_rects
+            if rects:
+                pygame.display.update(rects)
+                self.pixels_presented += sum(r.w * r.h for r in rects)
+        if self.flash:
+            self.pending_rects = self.flash.restore(self.screen)
+        if self.latency:
+            self.latency.presented()
+
+    def run(self, scene):
+        """Runs a scene until it calls finish() and returns its result."""
+        scene.finished = False
+        self.switch(scene)
+        while not scene.finished:
+            self.step()
+        scene.exit()
+        self.scene = None
+        return scene.result
+
+
+_manager = None
+
+def get_manager():
+    """The process-wide SceneManager (created on first use)."""
+    global _manager
+    if _manager is None:
+        _manager = SceneManager()
+    return _manager
+
+
+def main(argv=None):
+    from start_instructions import HiddenMenu
+    from general.levels import LEVELS, preload_level, build_level
+
+    parser = argparse.ArgumentParser(description=CAPTION)
+    parser.add_argument("--record", metavar="LOG", help="record input and scene seeds to LOG")
+    parser.add_argument("--replay", metavar="LOG", help="play back a recorded LOG")
+    parser.add_argument("--fast", action="store_true", help="replay as fast as possible instead of at the recorded pace")
+    parser.add_argument("--latency", metavar="JSON", help="write per-scene input-to-present latency percentiles to JSON on quit")
+    args = parser.parse_args(argv)
+
+    manager = get_manager()
+    if args.replay:
+        manager.replay(args.replay, args.fast)
+    elif args.record:
+        manager.record(args.record)
+    if args.latency:
+        manager.measure_latency(args.latency)
+    preload_level(0)
+    while manager.run(HiddenMenu()) == "start":
+        for i in range(len(LEVELS)):
+            scene = build_level(i, manager.screen)
+            # Next room's images decode on the pool while this one is played
+            preload_level(i + 1)
+            manager.run(scene)
+        preload_level(0)
+
+
+if __name__ == "__main__":
+    main()
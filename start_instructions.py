@@ -1,5 +1,9 @@
 import pygame
-import sys
+
+from general.start import Scene, get_manager
+from general.fonts import get_font, render_text
+from general import pointer
+from general.dirty import DamageTracker
 
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 800, 1000
@@ -16,23 +20,47 @@ HOVER_COLOR = (65, 55, 50)     # Feedback color
 START = "start"
 INSTRUCTIONS = "instructions"
 
-class HiddenMenu:
+class HiddenMenu(Scene):
+    caption = "HIDDEN - Escape Room"
+    dirty_rects = True
+
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("HIDDEN - Escape Room")
-        self.clock = pygame.time.Clock()
         self.state = START
+
+        # Button rects are refreshed every draw; start empty so early clicks are ignored
+        self.start_btn = self.instr_btn = self.back_btn = pygame.Rect(0, 0, 0, 0)
+        self.damage_tracker = DamageTracker()
         
         # Fonts
-        self.title_font = pygame.font.SysFont("Georgia", 90, bold=True)
-        self.header_font = pygame.font.SysFont("Georgia", 45, bold=True)
-        self.body_font = pygame.font.SysFont("Arial", 26)
-        self.button_font = pygame.font.SysFont("Arial", 28, bold=True)
+        self.title_font = get_font("Georgia", 90, bold=True)
+        self.header_font = get_font("Georgia", 45, bold=True)
+        self.body_font = get_font("Arial", 26)
+        self.button_font = get_font("Arial", 28, bold=True)
+
+    def button_rect(self, y_pos):
+        return pygame.Rect(WIDTH//2 - 160, y_pos, 320, 75)
+
+    def button_ys(self):
+        if self.state == START:
+            return [HEIGHT//2 + 50, HEIGHT//2 + 150]
+        return [HEIGHT - 150]
+
+    def idle(self):
+        return True
+
+    def damage(self):
+        # Only the state page and the hover highlight ever change
+        mouse_pos = pointer.get_pos()
+        items = {"page": (self.state, self.screen.get_rect())}
+        for y_pos in self.button_ys():
+            rect = self.button_rect(y_pos)
+            items[y_pos] = (rect.collidepoint(mouse_pos), rect)
+        return self.damage_tracker.diff(items)
 
     def draw_button(self, text, y_pos):
-        mouse_pos = pygame.mouse.get_pos()
-        rect = pygame.Rect(WIDTH//2 - 160, y_pos, 320, 75)
+        mouse_pos = pointer.get_pos()
+        rect = self.button_rect(y_pos)
         
         # Hover logic
         current_color = HOVER_COLOR if rect.collidepoint(mouse_pos) else BUTTON_COLOR
@@ -41,7 +69,7 @@ class HiddenMenu:
         pygame.draw.rect(self.screen, ACCENT_COLOR, rect, border_radius=12) # Border
         pygame.draw.rect(self.screen, current_color, rect.inflate(-4, -4), border_radius=10) # Inner
         
-        btn_txt = self.button_font.render(text, True, TEXT_COLOR)
+        btn_txt = render_text(self.button_font, text, TEXT_COLOR)
         self.screen.blit(btn_txt, btn_txt.get_rect(center=rect.center))
         return rect
 
@@ -49,19 +77,20 @@ class HiddenMenu:
         self.screen.fill(BG_COLOR)
         
         # Title with a bit of "Shadow" for depth
-        title_surf = self.title_font.render("HIDDEN", True, ACCENT_COLOR)
+        title_surf = render_text(self.title_font, "HIDDEN", ACCENT_COLOR)
         self.screen.blit(title_surf, title_surf.get_rect(center=(WIDTH//2, HEIGHT//3)))
         
-        sub_txt = self.body_font.render("Precision Escape Room", True, TEXT_COLOR)
+        sub_txt = render_text(self.body_font, "Precision Escape Room", TEXT_COLOR)
         self.screen.blit(sub_txt, sub_txt.get_rect(center=(WIDTH//2, HEIGHT//3 + 75)))
         
-        self.start_btn = self.draw_button("START GAME", HEIGHT//2 + 50)
-        self.instr_btn = self.draw_button("HOW TO PLAY", HEIGHT//2 + 150)
+        start_y, instr_y = self.button_ys()
+        self.start_btn = self.draw_button("START GAME", start_y)
+        self.instr_btn = self.draw_button("HOW TO PLAY", instr_y)
 
     def draw_instructions(self):
         self.screen.fill(BG_COLOR)
         
-        header = self.header_font.render("HOW TO ESCAPE", True, ACCENT_COLOR)
+        header = render_text(self.header_font, "HOW TO ESCAPE", ACCENT_COLOR)
         self.screen.blit(header, (60, 100))
         
         # Instructions broken into smaller chunks to fit the screen width
@@ -81,37 +110,32 @@ class HiddenMenu:
         
         # Draw instructions with proper margins
         for i, line in enumerate(instr_text):
-            surf = self.body_font.render(line, True, TEXT_COLOR)
+            surf = render_text(self.body_font, line, TEXT_COLOR)
             self.screen.blit(surf, (60, 200 + (i * 45)))
             
-        self.back_btn = self.draw_button("BACK", HEIGHT - 150)
-
-    def run(self):
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.state == START:
-                        if self.start_btn.collidepoint(event.pos):
-                            print("Launching Gameplay...") 
-                        elif self.instr_btn.collidepoint(event.pos):
-                            self.state = INSTRUCTIONS
-                    
-                    elif self.state == INSTRUCTIONS:
-                        if self.back_btn.collidepoint(event.pos):
-                            self.state = START
+        self.back_btn = self.draw_button("BACK", self.button_ys()[0])
 
+    def handle(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
             if self.state == START:
-                self.draw_start()
+                if self.start_btn.collidepoint(event.pos):
+                    self.finish("start")
+                elif self.instr_btn.collidepoint(event.pos):
+                    self.state = INSTRUCTIONS
+            
             elif self.state == INSTRUCTIONS:
-                self.draw_instructions()
+                if self.back_btn.collidepoint(event.pos):
+                    self.state = START
+
+    def draw(self):
+        if self.state == START:
+            self.draw_start()
+        elif self.state == INSTRUCTIONS:
+            self.draw_instructions()
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
+    def run(self):
+        return get_manager().run(self)
 
 if __name__ == "__main__":
-    menu = HiddenMenu()
-    menu.run()
\ No newline at end of file
+    from general.start import main
+    main()